@@ -0,0 +1,86 @@
+"""
+Measure the memory taken by the whole inventory in each in-memory representation.
+
+Run from the repository root: python -m benchmarks.account_memory [accounts]
+Rows are generated like the ones sqlite returns (fresh strings per row) while each representation is built,
+so the strings it keeps alive are counted. No database is used.
+"""
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+from discordbot.constants import AccountStatus
+from discordbot.database import Database
+from discordbot.models import AccountTable
+
+
+@dataclass
+class LegacyUser:
+    """The User model before it was slotted and frozen, statuses as plain strings."""
+    id: str
+    nick: str
+    status: str
+    price: int
+    buyer: Optional[str]
+    reason_inactive: Optional[str]
+    discord_channel_id: int
+    created_at: str
+
+
+def iter_rows(accounts: int) -> Iterator[tuple]:
+    """Rows in the accounts column order, every string a distinct object."""
+    statuses: list[str] = [status.value for status in AccountStatus]
+    rng: random.Random = random.Random(accounts)
+
+    for i in range(accounts):
+        yield (
+            i,
+            f'player_{i}',
+            ''.join(rng.choice(statuses)),  # join() returns a new string object, like a fetched row
+            rng.randint(1, 500),
+            None,
+            None,
+            900000000000000000 + i,
+            f'2024-01-01 00:00:{i % 60:02d}'
+        )
+
+
+def measure(build: Callable[[], object]) -> int:
+    """Bytes allocated and still alive after building a representation."""
+    tracemalloc.start()
+    result: object = build()
+    size: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def list_view(users: list) -> list:
+    """What /list used to build on top of the objects: four status lists and their concatenation."""
+    groups: dict[str, list] = {status.value: [] for status in AccountStatus}
+
+    for user in users:
+        groups[user.status].append(user)
+
+    return [user for group in groups.values() for user in group]
+
+
+def main() -> None:
+    accounts: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    results: dict[str, int] = {
+        'legacy objects + /list lists': measure(
+            lambda: (lambda users: (users, list_view(users)))([LegacyUser(*row) for row in iter_rows(accounts)])
+        ),
+        'slotted frozen User': measure(lambda: [Database._to_user(row) for row in iter_rows(accounts)]),
+        'AccountTable': measure(lambda: AccountTable.from_accounts(Database._to_user(row) for row in iter_rows(accounts))),
+    }
+    baseline: int = next(iter(results.values()))
+
+    for name, size in results.items():
+        print(f'{name:30} {size / 1024 / 1024:8.2f} MiB  {size / accounts:7.1f} B/account  {size / baseline:5.2f}x')
+
+
+if __name__ == '__main__':
+    main()
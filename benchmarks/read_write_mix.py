@@ -0,0 +1,139 @@
+"""
+Measure mixed read/write load: listings and lookups running while account statuses are updated.
+
+Run from the repository root: python -m benchmarks.read_write_mix [accounts] [seconds] [readers]
+Compares the previous access pattern (rollback journal, a new connection for every Database() call)
+with the WAL reader/writer split. Both run the same SQLiteDatabase queries in a temporary directory.
+"""
+import os
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable
+
+from discordbot.constants import AccountStatus
+from discordbot.database import SQLiteDatabase
+
+
+class LegacyDatabase(SQLiteDatabase):
+    """SQLiteDatabase before the split: every instance opens its own connection to a rollback journal file."""
+
+    def __init__(self) -> None:
+        self._own: sqlite3.Connection = sqlite3.connect(self.PATH, timeout=30)
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        return self._own
+
+    @contextmanager
+    def _get_cursor(self):
+        cursor: sqlite3.Cursor = self._own.cursor()
+
+        try:
+            yield cursor
+
+        finally:
+            cursor.close()
+
+    _read_cursor = _get_cursor
+
+
+def prepare(accounts: int, journal_mode: str) -> None:
+    """Creates the accounts through the current layer and sets the journal mode of the file."""
+    database: SQLiteDatabase = SQLiteDatabase()
+
+    with database._get_cursor() as cursor:
+        cursor.execute('DELETE FROM accounts;')
+        cursor.executemany(
+            'INSERT INTO accounts (nick, status, price) VALUES (?, ?, ?);',
+            [(f'player_{i}', AccountStatus.SALE.code, i) for i in range(accounts)]
+        )
+        database.conn.commit()
+
+    SQLiteDatabase.shutdown()
+    conn: sqlite3.Connection = sqlite3.connect(SQLiteDatabase.PATH)
+    conn.execute(f'PRAGMA journal_mode = {journal_mode};')
+    conn.close()
+
+
+def run(factory: Callable[[], SQLiteDatabase], accounts: int, seconds: float, readers: int) -> dict:
+    """Runs reader threads (one full listing per 20 lookups) and one writer thread for a fixed time."""
+    stop: threading.Event = threading.Event()
+    counts: dict[str, int] = {'listings': 0, 'lookups': 0}
+    latencies: list[float] = []
+    lock: threading.Lock = threading.Lock()
+
+    def reader(seed: int) -> None:
+        rng: random.Random = random.Random(seed)
+
+        while not stop.is_set():
+            listing: bool = rng.random() < 0.05
+
+            if listing:
+                factory().get_accounts()
+
+            else:
+                factory().get_account(f'player_{rng.randrange(accounts)}')
+
+            with lock:
+                counts['listings' if listing else 'lookups'] += 1
+
+    def writer() -> None:
+        rng: random.Random = random.Random(0)
+        statuses: list[AccountStatus] = list(AccountStatus)
+
+        while not stop.is_set():
+            started: float = time.perf_counter()
+            factory().update_account_status(f'player_{rng.randrange(accounts)}', rng.choice(statuses))
+            latencies.append(time.perf_counter() - started)
+
+    threads: list[threading.Thread] = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+
+    for thread in threads:
+        thread.start()
+
+    time.sleep(seconds)
+    stop.set()
+
+    for thread in threads:
+        thread.join()
+
+    return {
+        'listings/s': counts['listings'] / seconds,
+        'lookups/s': counts['lookups'] / seconds,
+        'writes/s': len(latencies) / seconds,
+        'write p50 ms': statistics.median(latencies) * 1000,
+        'write p99 ms': statistics.quantiles(latencies, n=100)[98] * 1000,
+        'write max ms': max(latencies) * 1000,
+    }
+
+
+def main() -> None:
+    accounts: int = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    seconds: float = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+    readers: int = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        prepare(accounts, 'DELETE')
+        legacy: dict = run(LegacyDatabase, accounts, seconds, readers)
+
+        prepare(accounts, 'WAL')
+        current: dict = run(SQLiteDatabase, accounts, seconds, readers)
+        SQLiteDatabase.shutdown()
+
+    print(f'{accounts} accounts, {readers} reader threads + 1 writer thread, {seconds:.0f}s each')
+    print(f'{"":24}' + ''.join(f'{name:>14}' for name in legacy))
+
+    for name, result in (('rollback journal', legacy), ('WAL reader/writer split', current)):
+        print(f'{name:24}' + ''.join(f'{value:14.1f}' for value in result.values()))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Compare the legacy accounts table (text statuses, DATETIME strings) with the compact layout it migrates to.
+
+Run from the repository root: python -m benchmarks.storage_format [accounts]
+A legacy database is generated in a temporary directory, measured, migrated in place by opening it with
+SQLiteDatabase, and measured again. db/accounts.db is never touched.
+"""
+import calendar
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Callable
+
+from discordbot.constants import AccountStatus
+from discordbot.database import SQLiteDatabase
+
+LEGACY_SCHEMA: str = '''
+CREATE TABLE accounts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    nick TEXT NOT NULL,
+    status TEXT NOT NULL,
+    price INTEGER,
+    sold_to TEXT,
+    reason_inactive TEXT,
+    discord_channel_id INTEGER,
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+'''
+
+
+def create_legacy(path: str, accounts: int) -> None:
+    """Writes a version 0 database spread over one year of creation dates."""
+    rng: random.Random = random.Random(accounts)
+    start: int = calendar.timegm((2024, 1, 1, 0, 0, 0))
+    conn: sqlite3.Connection = sqlite3.connect(path)
+    conn.execute(LEGACY_SCHEMA)
+    conn.executemany(
+        'INSERT INTO accounts (nick, status, price, sold_to, discord_channel_id, created_at) VALUES (?, ?, ?, ?, ?, ?);',
+        [
+            (
+                f'player_{i}',
+                rng.choice(list(AccountStatus)).value,
+                rng.randint(1, 500),
+                None,
+                900000000000000000 + i,
+                time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(start + rng.randint(0, 365 * 86400)))
+            )
+            for i in range(accounts)
+        ]
+    )
+    conn.commit()
+    conn.close()
+
+
+def timed(query: Callable[[], object], repeat: int = 20) -> float:
+    """Best time in milliseconds over several runs."""
+    best: float = float('inf')
+
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        query()
+        best = min(best, time.perf_counter() - started)
+
+    return best * 1000
+
+
+def measure(path: str, month: tuple, status: object) -> tuple[int, float, float]:
+    """File size, time of a one month creation range query and time of a status count."""
+    conn: sqlite3.Connection = sqlite3.connect(path)
+    size: int = os.path.getsize(path)
+    range_ms: float = timed(lambda: conn.execute('SELECT id, nick FROM accounts WHERE created_at >= ? AND created_at < ?;', month).fetchall())
+    status_ms: float = timed(lambda: conn.execute('SELECT COUNT(*) FROM accounts WHERE status = ?;', (status,)).fetchone())
+    conn.close()
+    return size, range_ms, status_ms
+
+
+def main() -> None:
+    accounts: int = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        os.makedirs('db')
+        create_legacy(SQLiteDatabase.PATH, accounts)
+        before: tuple = measure(SQLiteDatabase.PATH, ('2024-06-01', '2024-07-01'), AccountStatus.SALE.value)
+
+        started: float = time.perf_counter()
+        SQLiteDatabase()
+        migration: float = time.perf_counter() - started
+        SQLiteDatabase.shutdown()  # Checkpoints the WAL, so the file size is final
+
+        epoch: Callable[[str], int] = lambda date: calendar.timegm(time.strptime(date, '%Y-%m-%d'))
+        after: tuple = measure(SQLiteDatabase.PATH, (epoch('2024-06-01'), epoch('2024-07-01')), AccountStatus.SALE.code)
+
+    print(f'{accounts} accounts, migrated in {migration:.2f}s')
+    print(f'{"":10} {"file size":>12} {"month range":>12} {"status count":>13}')
+
+    for name, (size, range_ms, status_ms) in (('legacy', before), ('compact', after)):
+        print(f'{name:10} {size / 1024 / 1024:9.2f} MiB {range_ms:9.2f} ms {status_ms:10.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Measure account writes per second with and without write-behind group commits.
+
+Run from the repository root: python -m benchmarks.write_batching [writes] [concurrency]
+The benchmark works in a temporary directory and never touches db/accounts.db.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from discordbot.database import Database, SQLiteDatabase
+
+
+def bench_direct(writes: int) -> float:
+    """Every write commits on its own, like the default mode."""
+    database: Database = SQLiteDatabase()
+    start: float = time.perf_counter()
+
+    for i in range(writes):
+        database.add_account(nick=f'direct_{i}', price=i)
+
+    return writes / (time.perf_counter() - start)
+
+
+async def bench_write_behind(writes: int, concurrency: int) -> float:
+    """Concurrent writers each awaiting the durability acknowledgement of their write."""
+    SQLiteDatabase.start_write_behind(window=0.005, max_batch=100)
+    database: Database = SQLiteDatabase()
+
+    async def worker(worker_id: int) -> None:
+        for i in range(worker_id, writes, concurrency):
+            await asyncio.wrap_future(database.add_account(nick=f'batched_{i}', price=i))
+
+    start: float = time.perf_counter()
+    await asyncio.gather(*(worker(worker_id) for worker_id in range(concurrency)))
+    elapsed: float = time.perf_counter() - start
+    writer = SQLiteDatabase.writer
+    SQLiteDatabase.stop_write_behind()
+    print(f'  {writer.statements} statements committed in {writer.batches} transactions')
+    return writes / elapsed
+
+
+def main() -> None:
+    writes: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    concurrency: int = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        direct: float = bench_direct(writes)
+        print(f'direct:       {direct:10.0f} writes/s')
+        batched: float = asyncio.run(bench_write_behind(writes, concurrency))
+        print(f'write-behind: {batched:10.0f} writes/s ({concurrency} concurrent writers, {batched / direct:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -5,11 +5,11 @@ import sys
 import discord
 from loguru import logger
 from discord.ext.commands.bot import Bot
-from ezjsonpy import load_language, set_language
 
 from .bot import DiscordBot
 from .constants import BotConstants
-from .database import Database
+from .database import Database, SQLiteDatabase, QueryProfiler
+from .utilities import MessageCatalog, WarmCache
 
 
 class Main:
@@ -17,13 +17,12 @@ class Main:
         self.debug: bool = debug
         subprocess.run('clear || cls', shell=True)
         
-        if not os.path.exists('lang.json'):
-            print('Lang.json file not found!')
+        if not os.path.exists(f'{BotConstants.LANG_PATH}/{BotConstants.DEFAULT_LOCALE}.json'):
+            print(f'{BotConstants.LANG_PATH}/{BotConstants.DEFAULT_LOCALE}.json file not found!')
             sys.exit(1)
         
-        load_language('lang', 'lang.json')
-        set_language('lang')
         self.logger_setup()
+        MessageCatalog.load(BotConstants.LANG_PATH)
         self._bot: Bot = DiscordBot.create_bot(
             command_prefix='!!!!!!!!!!!!!!',
             help_command=None,
@@ -49,5 +48,36 @@ class Main:
             logger.critical('No token found. Please set the DISCORD_TOKEN environment variable in a .env file.')
             sys.exit(1)
 
+        backend: type[Database] = Database.backend()
         Database()  # Initialize the database and test the connection
-        self._bot.run(BotConstants.TOKEN)
+        logger.info(f'Using the {BotConstants.DB_BACKEND} database backend.')
+
+        if BotConstants.DB_WRITE_BEHIND:
+            if backend is SQLiteDatabase:
+                SQLiteDatabase.start_write_behind(
+                    window=BotConstants.DB_BATCH_WINDOW_MS / 1000,
+                    max_batch=BotConstants.DB_BATCH_SIZE
+                )
+
+            else:
+                logger.warning('DB_WRITE_BEHIND only applies to the sqlite backend, ignoring it.')
+
+        if BotConstants.DB_PROFILE:
+            if backend is SQLiteDatabase:
+                profiler: QueryProfiler = SQLiteDatabase.enable_profiler(slow_threshold=BotConstants.DB_SLOW_QUERY_MS / 1000)
+                WarmCache.register('queries', dump=profiler.dump, load=profiler.load)
+
+            else:
+                logger.warning('DB_PROFILE only applies to the sqlite backend, ignoring it.')
+
+        if BotConstants.WARM_CACHE_PATH:
+            WarmCache.load(BotConstants.WARM_CACHE_PATH, data_version=Database().data_version())
+
+        try:
+            self._bot.run(BotConstants.TOKEN)
+
+        finally:
+            if BotConstants.WARM_CACHE_PATH:
+                WarmCache.save(BotConstants.WARM_CACHE_PATH)
+
+            backend.shutdown()  # Commit every queued write and close the connections before exiting
@@ -1,3 +1,3 @@
-from .bot import DiscordBot
+from .bot import DiscordBot, CogReload
 
-__all__ = ['DiscordBot']
+__all__ = ['DiscordBot', 'CogReload']
@@ -1,28 +1,89 @@
+import asyncio
+import hashlib
+import json
 import os
+import signal
 import sys
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
 
 import discord
 from loguru import logger
 from discord.ext.commands.bot import Bot
 
 from ..constants import BotConstants
+from ..utilities import LoopWatchdog, WarmCache, PlayerUUID
+from .utilities.translator import CatalogTranslator
+from .utilities.responder import InteractionResponder
+from .utilities.reservations import ReservationExpiry
+
+
+@dataclass
+class CogReload:
+    reloaded: list[str] = field(default_factory=list)
+    loaded: list[str] = field(default_factory=list)
+    unloaded: list[str] = field(default_factory=list)
+    failed: dict[str, str] = field(default_factory=dict)  # Cog module (or 'tree') -> error
+    synced: bool = False
 
 
 class DiscordBot(Bot):
     def __init__(self, command_prefix: str, *, intents: discord.Intents, **options: Any):
         super().__init__(command_prefix, intents=intents, **options)
         self.loaded_cogs: list[str] = []
+        self.cog_mtimes: dict[str, float] = {}  # Modification time of each cog file when it was loaded
+        self.tree_signature: Optional[str] = None
+        self._reload_lock: asyncio.Lock = asyncio.Lock()
+        WarmCache.register('mojang', dump=PlayerUUID.dump_cache, load=PlayerUUID.load_cache)
+        WarmCache.register('phases', dump=lambda: InteractionResponder.estimates, load=InteractionResponder.estimates.update)
+        self.reservations: ReservationExpiry = ReservationExpiry(self)
+        self.watchdog: LoopWatchdog = LoopWatchdog(
+            interval=BotConstants.LOOP_WATCHDOG_INTERVAL_MS / 1000,
+            threshold=BotConstants.LOOP_STALL_THRESHOLD_MS / 1000
+        )
 
     @logger.catch
     async def setup_hook(self) -> None:
         """Hook to be called after the bot has been initialized."""
+        if BotConstants.LOOP_STALL_THRESHOLD_MS > 0:
+            self.watchdog.start()
+
+        try:
+            # Deploys stop the process with SIGTERM: close like on Ctrl+C, so the caches are saved
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, lambda: asyncio.create_task(self.close()))
+
+        except NotImplementedError:
+            pass  # Windows event loops have no signal handlers
+
         await self._load_extensions()
+        await self.reservations.start()
+        await self.tree.set_translator(CatalogTranslator())
         await self.tree.sync()
+        self.tree_signature = self._tree_signature()
 
     @logger.catch
     async def _load_extensions(self) -> None:
         """Load the initial extensions."""
+        self.loaded_cogs.extend(self._discover_cogs())
+
+        for cog in self.loaded_cogs:
+            try:
+                await self.load_extension(cog)
+                self.cog_mtimes[cog] = self._cog_mtime(cog)
+                logger.info(f'Loaded extension {cog}')
+
+            except Exception as e:
+                logger.critical(f'Failed to load extension {cog}: {e}')
+                sys.exit(1)
+
+    @staticmethod
+    def _discover_cogs() -> list[str]:
+        """
+        Find the cog modules in the cogs folders.
+
+        :return: The module names, e.g. 'discordbot.bot.cogs.commands.all'.
+        """
+        cogs: list[str] = []
         cogs_folders: list[str] = [folder for folder in os.listdir(BotConstants.COGS_PATH) if folder != '__pycache__']
 
         for folder in cogs_folders:
@@ -35,17 +96,116 @@ class DiscordBot(Bot):
                 if not file.endswith('.py') or file == '__pycache__.py' or file == '__init__.py':
                     continue
 
-                cog: str = f'{BotConstants.COG_PATH}.{folder}.{file[:-3]}'
-                self.loaded_cogs.append(cog)
+                cogs.append(f'{BotConstants.COG_PATH}.{folder}.{file[:-3]}')
 
-        for cog in self.loaded_cogs:
-            try:
-                await self.load_extension(cog)
-                logger.info(f'Loaded extension {cog}')
+        return cogs
 
-            except Exception as e:
-                logger.critical(f'Failed to load extension {cog}: {e}')
-                sys.exit(1)
+    async def reload_cogs(self, cogs: Optional[list[str]] = None) -> CogReload:
+        """
+        Reload cogs without reconnecting to Discord.
+
+        Without arguments, the cogs whose file changed since they were loaded are reloaded, new cog files
+        are loaded and the cogs whose file was deleted are unloaded. A cog that fails to reload keeps
+        running its previous version (discord.py restores it). The command tree is only synced if the
+        commands changed.
+
+        Only the cog modules are reloaded: utilities, database and models keep their code and state.
+
+        :param cogs: The cog modules to reload, even if unchanged (optional).
+        :return: What was done.
+        """
+        async with self._reload_lock:
+            result: CogReload = CogReload()
+            discovered: list[str] = self._discover_cogs()
+            changed: Callable[[str], bool] = lambda cog: self._cog_mtime(cog) != self.cog_mtimes.get(cog)
+
+            if cogs is None:
+                cogs = [cog for cog in self.loaded_cogs if cog in discovered and changed(cog)]
+                added: list[str] = [cog for cog in discovered if cog not in self.loaded_cogs and changed(cog)]
+                deleted: list[str] = [cog for cog in self.loaded_cogs if cog not in discovered]
+
+            else:
+                added, deleted = [], []
+
+            for cog in cogs:
+                self.cog_mtimes[cog] = self._cog_mtime(cog)  # A broken version is not retried until the file changes again
+
+                try:
+                    await self.reload_extension(cog)
+                    result.reloaded.append(cog)
+                    logger.info(f'Reloaded extension {cog}')
+
+                except Exception as e:
+                    logger.error(f'Failed to reload extension {cog}, the previous version keeps running: {e}')
+                    result.failed[cog] = str(e)
+
+            for cog in added:
+                self.cog_mtimes[cog] = self._cog_mtime(cog)
+
+                try:
+                    await self.load_extension(cog)
+                    self.loaded_cogs.append(cog)
+                    result.loaded.append(cog)
+                    logger.info(f'Loaded extension {cog}')
+
+                except Exception as e:
+                    logger.error(f'Failed to load extension {cog}: {e}')
+                    result.failed[cog] = str(e)
+
+            for cog in deleted:
+                try:
+                    await self.unload_extension(cog)
+                    result.unloaded.append(cog)
+                    logger.info(f'Unloaded extension {cog}')
+
+                except Exception as e:
+                    logger.error(f'Failed to unload extension {cog}: {e}')
+                    result.failed[cog] = str(e)
+
+                self.loaded_cogs.remove(cog)
+
+            self.cog_mtimes = {cog: mtime for cog, mtime in self.cog_mtimes.items() if cog in discovered}  # Also forgets deleted broken files
+
+            signature: str = self._tree_signature()
+
+            if signature != self.tree_signature:
+                try:
+                    await self.tree.sync()
+                    self.tree_signature = signature
+                    result.synced = True
+
+                except discord.HTTPException as e:
+                    logger.error(f'Failed to sync the command tree after a reload: {e}')
+                    result.failed['tree'] = str(e)
+
+            return result
+
+    @staticmethod
+    def _cog_mtime(cog: str) -> float:
+        """
+        Get the modification time of a cog file.
+
+        :param cog: The cog module.
+        :return: The modification time, 0 if the file does not exist.
+        """
+        path: str = os.path.join(BotConstants.COGS_PATH, *cog[len(BotConstants.COG_PATH) + 1:].split('.')) + '.py'
+        return os.path.getmtime(path) if os.path.exists(path) else 0.0
+
+    def _tree_signature(self) -> str:
+        """
+        Hash the payload the command tree would sync, to know whether a sync is needed.
+
+        :return: The hash.
+        """
+        # Sorted, a reloaded cog adds its commands back at the end of the tree
+        payload: list[dict] = sorted((command.to_dict(self.tree) for command in self.tree.get_commands()), key=lambda command: (command['type'], command['name']))
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+    async def close(self) -> None:
+        """Stop the event loop watchdog and the reservation expiry, and close the bot."""
+        self.watchdog.stop()
+        self.reservations.stop()
+        await super().close()
 
     async def on_ready(self):
         """The on_ready function for the bot."""
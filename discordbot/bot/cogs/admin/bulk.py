@@ -0,0 +1,269 @@
+import asyncio
+import functools
+import re
+import time
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from discord.channel import CategoryChannel
+from loguru import logger
+
+from ....database import Database, AsyncDatabase
+from ....utilities import Validators, MessageCatalog
+from ....constants import AccountStatus, BotConstants
+from ....models import User
+from ...utilities.categories import CategoriesUtils
+from ...utilities.translator import CatalogTranslator
+from ...utilities.pacer import PacedQueue
+from ...utilities.locks import AccountLocks
+from ...utilities.watchlist import WatchlistFeed
+
+STATUS_CHOICES: list[app_commands.Choice[str]] = [
+    app_commands.Choice(name=status, value=status)
+    for status in (AccountStatus.SALE, AccountStatus.RESERVED, AccountStatus.INACTIVE)
+]
+
+
+class BulkCommands(commands.Cog):
+    bulk = app_commands.Group(name='bulk', description=CatalogTranslator.text('commands.bulk.description'))
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.queue: PacedQueue = PacedQueue(interval=BotConstants.CHANNEL_EDIT_INTERVAL_MS / 1000)
+        self.queue.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the channel edit queue when the cog is unloaded."""
+        self.queue.stop()
+
+    @bulk.command(name='status', description=CatalogTranslator.text('commands.bulk.status.description'))
+    @app_commands.choices(new_status=STATUS_CHOICES, status=STATUS_CHOICES)
+    @logger.catch
+    async def bulk_status_command(
+        self,
+        interaction: discord.Interaction,
+        new_status: str,
+        status: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        nicks: Optional[str] = None,
+        reason: str = 'Default',
+        hours: Optional[app_commands.Range[int, 0, 720]] = None
+    ) -> None:
+        """
+        Change the status of every selected account.
+
+        :param interaction: The interaction object.
+        :param new_status: The status to set.
+        :param status: Only select accounts with this status (optional).
+        :param min_price: Only select accounts with at least this price (optional).
+        :param max_price: Only select accounts with at most this price (optional).
+        :param nicks: Only select these accounts, separated by commas or spaces (optional).
+        :param reason: The inactivity reason when setting INACTIVE.
+        :param hours: Hours until the reservations expire when setting RESERVED, 0 to never expire (default RESERVATION_HOURS).
+        """
+        hours = BotConstants.RESERVATION_HOURS if hours is None else hours
+        await self._apply(
+            interaction,
+            selection={'status': status, 'min_price': min_price, 'max_price': max_price, 'nicks': nicks},
+            change=lambda account: (new_status, None),
+            reason=reason if new_status == AccountStatus.INACTIVE else None,
+            reserved_until=int(time.time()) + hours * 3600 if new_status == AccountStatus.RESERVED and hours > 0 else None
+        )
+
+    @bulk.command(name='price', description=CatalogTranslator.text('commands.bulk.price.description'))
+    @app_commands.choices(status=STATUS_CHOICES)
+    @logger.catch
+    async def bulk_price_command(
+        self,
+        interaction: discord.Interaction,
+        price: Optional[int] = None,
+        percent: Optional[float] = None,
+        status: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        nicks: Optional[str] = None
+    ) -> None:
+        """
+        Reprice every selected account, to a fixed price or by a percentage.
+
+        :param interaction: The interaction object.
+        :param price: The new price (optional, exclusive with percent).
+        :param percent: The change in percent, e.g. -10 for a 10% discount (optional, exclusive with price).
+        :param status: Only select accounts with this status (optional).
+        :param min_price: Only select accounts with at least this price (optional).
+        :param max_price: Only select accounts with at most this price (optional).
+        :param nicks: Only select these accounts, separated by commas or spaces (optional).
+        """
+        if (price is None) == (percent is None) or (price is not None and price <= 0):
+            await interaction.response.send_message(MessageCatalog.get('commands.bulk.price.invalid', interaction.locale), ephemeral=True)
+            return
+
+        def change(account: User) -> Optional[tuple[Optional[str], Optional[int]]]:
+            if price is not None:
+                return None, price
+
+            if account.price is None:
+                return None  # Nothing to apply a percentage to
+
+            return None, max(round(account.price * (1 + percent / 100)), 1)
+
+        await self._apply(
+            interaction,
+            selection={'status': status, 'min_price': min_price, 'max_price': max_price, 'nicks': nicks},
+            change=change
+        )
+
+    @bulk.command(name='release', description=CatalogTranslator.text('commands.bulk.release.description'))
+    @logger.catch
+    async def bulk_release_command(self, interaction: discord.Interaction, nicks: Optional[str] = None) -> None:
+        """
+        Return every reserved account (or the given ones) to sale.
+
+        :param interaction: The interaction object.
+        :param nicks: Only release these accounts, separated by commas or spaces (optional).
+        """
+        await self._apply(
+            interaction,
+            selection={'status': AccountStatus.RESERVED, 'nicks': nicks},
+            change=lambda account: (AccountStatus.SALE, None)
+        )
+
+    async def _apply(
+        self,
+        interaction: discord.Interaction,
+        selection: dict,
+        change,
+        reason: Optional[str] = None,
+        reserved_until: Optional[int] = None
+    ) -> None:
+        """
+        Select the accounts, update them in one transaction, publish them to the watchlists and queue their channel edits.
+
+        :param interaction: The interaction object.
+        :param selection: The iter_accounts filters; 'nicks' is the raw command text.
+        :param change: Function returning the (new status, new price) of an account, None keeps the value.
+            Returning None instead of a tuple leaves the account out.
+        :param reason: The inactivity reason (optional).
+        :param reserved_until: The reservation deadline of the accounts set to RESERVED, epoch seconds (optional).
+        """
+        if not Validators.is_admin(user=interaction.user):
+            await interaction.response.send_message(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        if selection.get('nicks') is not None:
+            selection['nicks'] = [nick for nick in re.split(r'[\s,]+', selection['nicks']) if nick]
+
+        locked: set[str] = await asyncio.to_thread(lambda: {account.nick.lower() for account in Database().iter_accounts(**selection)})
+
+        async with AccountLocks.hold_many(locked):
+            # Select again under the locks, single account commands may have changed the accounts meanwhile
+            accounts: list[User] = await asyncio.to_thread(
+                lambda: [
+                    account for account in Database().iter_accounts(**selection)
+                    if account.nick.lower() in locked and account.status != AccountStatus.SOLD and change(account) is not None
+                ]
+            )
+
+            if not accounts:
+                await interaction.followup.send(MessageCatalog.get('commands.bulk.noAccounts', interaction.locale), ephemeral=True)
+                return
+
+            changes: list[tuple[str, Optional[str], Optional[int]]] = [(account.nick, *change(account)) for account in accounts]
+            updated: int = await AsyncDatabase().bulk_update(changes, actor_id=interaction.user.id, reason=reason, reserved_until=reserved_until)
+
+            # Still under the locks, so a newer reservation of the same account is never replaced by this one
+            for nick, status, _ in changes if updated else []:
+                if status == AccountStatus.RESERVED and reserved_until is not None:
+                    self.bot.reservations.schedule(nick, reserved_until)
+
+                elif status is not None:
+                    self.bot.reservations.cancel(nick)
+
+        if updated == 0:
+            await interaction.followup.send(MessageCatalog.get('commandError', interaction.locale), ephemeral=True)
+            return
+
+        for account, (_, status, price) in zip(accounts, changes):
+            new_status: str = status if status is not None else account.status
+
+            if new_status in (AccountStatus.SALE, AccountStatus.RESERVED):
+                WatchlistFeed.publish(
+                    nick=account.nick,
+                    status=new_status,
+                    price=price if price is not None else account.price,
+                    channel_id=account.discord_channel_id,
+                    actor_id=interaction.user.id
+                )
+
+        message: discord.WebhookMessage = await interaction.followup.send(
+            MessageCatalog.get('commands.bulk.progress', interaction.locale, updated=updated, done=0, failed=0, total=len(accounts)),
+            ephemeral=True,
+            wait=True
+        )
+
+        reporting: bool = True
+
+        async def on_progress(done: int, failed: int, total: int) -> None:
+            nonlocal reporting
+
+            if not reporting:
+                return
+
+            try:
+                await message.edit(content=MessageCatalog.get(
+                    'commands.bulk.progress' if done + failed < total else 'commands.bulk.finished',
+                    interaction.locale,
+                    updated=updated,
+                    done=done,
+                    failed=failed,
+                    total=total
+                ))
+
+            except discord.HTTPException as e:
+                reporting = False  # The interaction token expires after 15 minutes, the channels keep being updated
+                logger.info(f'Stopped reporting the progress of a bulk change: {e}')
+
+        jobs: list = [functools.partial(self._sync_channel, interaction.guild, account.nick) for account in accounts]
+        self.queue.submit(jobs, on_progress=on_progress)
+
+    @staticmethod
+    async def _sync_channel(guild: discord.Guild, nick: str) -> None:
+        """
+        Rename and move the channel of an account to match its current status and price.
+
+        The job may run long after the bulk update, so the account is read again under its lock and the
+        channel follows the account as it is now. Sold and removed accounts are skipped.
+
+        :param guild: The guild holding the channel.
+        :param nick: The nickname of the account.
+        """
+        async with AccountLocks.hold(nick):
+            database: AsyncDatabase = AsyncDatabase()
+            account: Optional[User] = await database.get_account(nick=nick) if await database.account_exists(nick=nick) else None
+
+            if account is None or account.status == AccountStatus.SOLD:
+                return
+
+            channel: Optional[discord.abc.GuildChannel] = guild.get_channel(account.discord_channel_id) if account.discord_channel_id else None
+
+            if channel is None:
+                raise LookupError(f'Channel of {account.nick} not found')
+
+            category_name: Optional[str] = {AccountStatus.SALE: 'for_sale', AccountStatus.RESERVED: 'reservations'}.get(account.status)
+            category: Optional[CategoryChannel] = await CategoriesUtils.get_category(category_name, guild) if category_name else channel.category
+            name: str = f'💲│{account.price}-{account.nick}'
+
+            if channel.name == name.lower() and channel.category == category:
+                return
+
+            await channel.edit(name=name, category=category)
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Load the Cog with the bulk commands."""
+    await bot.add_cog(BulkCommands(bot))
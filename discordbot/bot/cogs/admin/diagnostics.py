@@ -0,0 +1,169 @@
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from loguru import logger
+
+from ....database import SQLiteDatabase, QueryProfiler, QueryStats
+from ....utilities import Validators, MessageCatalog, LoopWatchdog
+from ...utilities.embed import EmbedUtilities
+from ...utilities.translator import CatalogTranslator
+
+
+class DiagnosticsCommands(commands.Cog):
+    BAR_WIDTH: int = 12
+    TOP_HOTSPOTS: int = 5
+    RECENT_STALLS: int = 5
+    TOP_QUERIES: int = 10
+    QUERY_LENGTH: int = 300  # Characters of SQL shown per query, the embed fields hold 1024
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name='lag', description=CatalogTranslator.text('commands.lag.description'))
+    @logger.catch
+    async def lag_command(self, interaction: discord.Interaction) -> None:
+        """
+        Show the event loop lag histogram and the calls that blocked the loop.
+
+        :param interaction: The interaction object.
+        """
+        if not Validators.is_admin(user=interaction.user):
+            await interaction.response.send_message(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        watchdog: LoopWatchdog = self.bot.watchdog
+
+        if not watchdog.running:
+            await interaction.response.send_message(MessageCatalog.get('commands.lag.disabled', interaction.locale), ephemeral=True)
+            return
+
+        embed: discord.Embed = EmbedUtilities.create_embed(
+            title=MessageCatalog.get('commands.lag.embed.title', interaction.locale),
+            description=MessageCatalog.get(
+                'commands.lag.embed.description',
+                interaction.locale,
+                samples=watchdog.samples,
+                average=f'{watchdog.total_lag / watchdog.samples * 1000 if watchdog.samples else 0:.1f}',
+                max=f'{watchdog.max_lag * 1000:.0f}',
+                stalls=watchdog.stalled,
+                threshold=f'{watchdog.threshold * 1000:.0f}'
+            ),
+            color=discord.Color.blurple()
+        )
+        embed.add_field(
+            name=MessageCatalog.get('commands.lag.embed.histogram', interaction.locale),
+            value=f'```\n{self._histogram(watchdog)}\n```',
+            inline=False
+        )
+        embed.add_field(
+            name=MessageCatalog.get('commands.lag.embed.hotspots', interaction.locale),
+            value='\n'.join(
+                f'`{count}×` {location}' for location, count in watchdog.hotspots.most_common(self.TOP_HOTSPOTS)
+            ) or MessageCatalog.get('commands.lag.embed.none', interaction.locale),
+            inline=False
+        )
+        embed.add_field(
+            name=MessageCatalog.get('commands.lag.embed.recent', interaction.locale),
+            value='\n'.join(
+                f'<t:{int(stall.at)}:R> {stall.blocked * 1000:.0f} ms {stall.location or "?"}'
+                for stall in reversed(list(watchdog.stalls)[-self.RECENT_STALLS:])
+            ) or MessageCatalog.get('commands.lag.embed.none', interaction.locale),
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name='queries', description=CatalogTranslator.text('commands.queries.description'))
+    @app_commands.choices(sort=[app_commands.Choice(name=key, value=key) for key in QueryProfiler.SORT_KEYS])
+    @logger.catch
+    async def queries_command(self, interaction: discord.Interaction, sort: str = 'total', reset: bool = False) -> None:
+        """
+        Show the database statements that cost the most, with their full table scans.
+
+        :param interaction: The interaction object.
+        :param sort: Order by 'total' time, 'max' time or 'count' of executions.
+        :param reset: Forget the recorded statements after showing them.
+        """
+        if not Validators.is_admin(user=interaction.user):
+            await interaction.response.send_message(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        profiler: Optional[QueryProfiler] = SQLiteDatabase.profiler
+
+        if profiler is None:
+            await interaction.response.send_message(MessageCatalog.get('commands.queries.disabled', interaction.locale), ephemeral=True)
+            return
+
+        top: list[QueryStats] = profiler.top(self.TOP_QUERIES, key=sort)
+
+        if not top:
+            await interaction.response.send_message(MessageCatalog.get('commands.queries.empty', interaction.locale), ephemeral=True)
+            return
+
+        executions, total = profiler.totals()
+        embed: discord.Embed = EmbedUtilities.create_embed(
+            title=MessageCatalog.get('commands.queries.embed.title', interaction.locale),
+            description=MessageCatalog.get(
+                'commands.queries.embed.description',
+                interaction.locale,
+                queries=len(profiler.queries),
+                executions=executions,
+                total=f'{total * 1000:.0f}',
+                since=f'<t:{int(profiler.since)}:R>',
+                threshold=f'{profiler.slow_threshold * 1000:.0f}'
+            ),
+            color=discord.Color.blurple()
+        )
+
+        for position, stats in enumerate(top, start=1):
+            sql: str = stats.sql if len(stats.sql) <= self.QUERY_LENGTH else f'{stats.sql[:self.QUERY_LENGTH - 1]}…'
+            value: str = f'```sql\n{sql}\n```'
+
+            if stats.full_scan:
+                scans: list[str] = [detail for detail in stats.plan if QueryProfiler.is_full_scan(detail)]
+                value += MessageCatalog.get('commands.queries.embed.fullScan', interaction.locale, plan=', '.join(scans))
+
+            embed.add_field(
+                name=MessageCatalog.get(
+                    'commands.queries.embed.query',
+                    interaction.locale,
+                    position=position,
+                    count=stats.count,
+                    total=f'{stats.total * 1000:.0f}',
+                    average=f'{stats.total / stats.count * 1000:.2f}',
+                    max=f'{stats.max * 1000:.0f}',
+                    slow=stats.slow
+                ),
+                value=value,
+                inline=False
+            )
+
+        if reset:
+            profiler.reset()
+            embed.set_footer(text=MessageCatalog.get('commands.queries.embed.reset', interaction.locale))
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    def _histogram(self, watchdog: LoopWatchdog) -> str:
+        """
+        Render the lag histogram as text bars, one line per bucket.
+
+        :param watchdog: The watchdog holding the samples.
+        :return: The rendered lines.
+        """
+        largest: int = max(watchdog.histogram) or 1
+        lines: list[str] = []
+
+        for bound, count in zip(watchdog.BUCKETS, watchdog.histogram):
+            label: str = f'≤ {bound * 1000:g} ms' if bound != float('inf') else f'> {watchdog.BUCKETS[-2] * 1000:g} ms'
+            bar: str = '█' * round(count / largest * self.BAR_WIDTH)
+            share: float = count / watchdog.samples * 100 if watchdog.samples else 0.0
+            lines.append(f'{label:>10} {bar:<{self.BAR_WIDTH}} {count:>7} {share:5.1f}%')
+
+        return '\n'.join(lines)
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Load the Cog with the event loop and database diagnostics commands."""
+    await bot.add_cog(DiagnosticsCommands(bot))
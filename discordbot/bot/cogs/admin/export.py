@@ -0,0 +1,112 @@
+import asyncio
+import datetime
+from typing import Optional, BinaryIO
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from loguru import logger
+
+from ....database import Database
+from ....utilities import Validators, AccountExporter, MessageCatalog
+from ...utilities.translator import CatalogTranslator
+from ....constants import AccountStatus
+
+
+class ExportCommands(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name='export', description=CatalogTranslator.text('commands.export.description'))
+    @app_commands.choices(
+        fmt=[app_commands.Choice(name=fmt.upper(), value=fmt) for fmt in AccountExporter.FORMATS],
+        status=[
+            app_commands.Choice(name=status, value=status)
+            for status in (AccountStatus.SALE, AccountStatus.RESERVED, AccountStatus.SOLD, AccountStatus.INACTIVE)
+        ]
+    )
+    @app_commands.rename(fmt='format')
+    @logger.catch
+    async def export_command(
+        self,
+        interaction: discord.Interaction,
+        fmt: str = 'csv',
+        status: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        compress: bool = False
+    ) -> None:
+        """
+        Export the accounts table as a file attachment.
+
+        :param interaction: The interaction object.
+        :param fmt: The export format, 'csv' or 'ndjson'.
+        :param status: Only export accounts with this status (optional).
+        :param created_after: Only export accounts created on or after this date, YYYY-MM-DD (optional).
+        :param created_before: Only export accounts created before this date, YYYY-MM-DD (optional).
+        :param compress: Compress the file with gzip.
+        """
+        if not Validators.is_admin(user=interaction.user):
+            await interaction.response.send_message(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        for date in (created_after, created_before):
+            if date is not None and not Validators.validate_date(date=date):
+                await interaction.response.send_message(MessageCatalog.get('commands.export.invalidDate', interaction.locale), ephemeral=True)
+                return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        exporter: AccountExporter = AccountExporter(fmt=fmt, compress=compress)
+
+        try:
+            file, count = await asyncio.to_thread(self._build_export, exporter, status, created_after, created_before)
+
+        except Exception as e:
+            logger.error(f'Failed to export the accounts: {e}')
+            await interaction.followup.send(MessageCatalog.get('commands.export.failed', interaction.locale), ephemeral=True)
+            return
+
+        try:
+            size: int = file.seek(0, 2)
+            file.seek(0)
+
+            if size > interaction.guild.filesize_limit:
+                await interaction.followup.send(MessageCatalog.get('commands.export.tooLarge', interaction.locale), ephemeral=True)
+                return
+
+            filename: str = f'accounts-{datetime.datetime.now().strftime("%Y%m%d-%H%M%S")}.{exporter.filename_extension}'
+            await interaction.followup.send(
+                content=MessageCatalog.get('commands.export.success', interaction.locale, accounts=str(count)),
+                file=discord.File(file, filename=filename),
+                ephemeral=True
+            )
+
+        finally:
+            file.close()
+
+    @staticmethod
+    def _build_export(
+        exporter: AccountExporter,
+        status: Optional[str],
+        created_after: Optional[str],
+        created_before: Optional[str]
+    ) -> tuple[BinaryIO, int]:
+        """
+        Stream the filtered accounts into an export file. Runs in a worker thread.
+
+        :param exporter: The exporter configured with the format and compression.
+        :param status: The status filter.
+        :param created_after: The lower creation date bound.
+        :param created_before: The upper creation date bound.
+        :return: A tuple (file, count) with the export file and the number of exported accounts.
+        """
+        return exporter.export(Database().iter_accounts(
+            status=status,
+            created_after=created_after,
+            created_before=created_before
+        ))
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Load the Cog with the export command."""
+    await bot.add_cog(ExportCommands(bot))
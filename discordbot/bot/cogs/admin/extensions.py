@@ -0,0 +1,102 @@
+import asyncio
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from loguru import logger
+
+from ....utilities import Validators, MessageCatalog
+from ....constants import BotConstants
+from ...bot import CogReload
+from ...utilities.translator import CatalogTranslator
+
+
+class ExtensionsCommands(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+        if BotConstants.COG_AUTO_RELOAD:
+            self.watch_cogs_task.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the background tasks when the cog is unloaded."""
+        self.watch_cogs_task.cancel()
+
+    @tasks.loop(seconds=5)
+    @logger.catch
+    async def watch_cogs_task(self) -> None:
+        """Reload the cogs whose file changed on disk."""
+        # Shielded: reloading this cog cancels the task, which must not interrupt the reload halfway
+        result: CogReload = await asyncio.shield(self.bot.reload_cogs())
+
+        if result.reloaded or result.loaded or result.unloaded:
+            logger.info(f'Cog files changed: {self._summary(result, None)}')
+
+    @app_commands.command(name='reload', description=CatalogTranslator.text('commands.reload.description'))
+    @logger.catch
+    async def reload_command(self, interaction: discord.Interaction, cog: Optional[str] = None) -> None:
+        """
+        Reload the changed cogs, or the given one, without reconnecting to Discord.
+
+        :param interaction: The interaction object.
+        :param cog: The cog to reload even if unchanged, e.g. 'commands.all' (optional).
+        """
+        if not Validators.is_admin(user=interaction.user):
+            await interaction.response.send_message(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        module: Optional[str] = f'{BotConstants.COG_PATH}.{cog}' if cog else None
+
+        if module is not None and module not in self.bot.loaded_cogs:
+            await interaction.response.send_message(MessageCatalog.get('commands.reload.notFound', interaction.locale, cog=cog), ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        result: CogReload = await self.bot.reload_cogs([module] if module else None)
+        await interaction.followup.send(self._summary(result, interaction.locale), ephemeral=True)
+
+    @reload_command.autocomplete('cog')
+    async def reload_cog_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        """
+        Suggest the loaded cogs containing the typed text.
+
+        :param interaction: The interaction object.
+        :param current: The text typed so far.
+        :return: Up to 25 choices.
+        """
+        if not Validators.is_admin(user=interaction.user):
+            return []
+
+        names: list[str] = [cog[len(BotConstants.COG_PATH) + 1:] for cog in self.bot.loaded_cogs]
+        return [app_commands.Choice(name=name, value=name) for name in sorted(names) if current.lower() in name][:25]
+
+    @staticmethod
+    def _summary(result: CogReload, locale: Optional[discord.Locale]) -> str:
+        """
+        Describe a reload.
+
+        :param result: The reload result.
+        :param locale: The locale of the reader.
+        :return: One line per kind of change, or the nothing changed message.
+        """
+        short = lambda cogs: ', '.join(cog[len(BotConstants.COG_PATH) + 1:] if cog.startswith(BotConstants.COG_PATH) else cog for cog in cogs)
+        lines: list[str] = [
+            MessageCatalog.get(f'commands.reload.{kind}', locale, cogs=short(cogs))
+            for kind, cogs in (('reloaded', result.reloaded), ('loaded', result.loaded), ('unloaded', result.unloaded))
+            if cogs
+        ]
+        lines.extend(
+            MessageCatalog.get('commands.reload.failed', locale, cog=short([cog]), error=error)
+            for cog, error in result.failed.items()
+        )
+
+        if result.synced:
+            lines.append(MessageCatalog.get('commands.reload.synced', locale))
+
+        return '\n'.join(lines) or MessageCatalog.get('commands.reload.unchanged', locale)
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Load the Cog with the cog reload command."""
+    await bot.add_cog(ExtensionsCommands(bot))
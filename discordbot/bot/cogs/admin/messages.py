@@ -0,0 +1,62 @@
+import json
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from loguru import logger
+
+from ....utilities import Validators, MessageCatalog
+from ...utilities.translator import CatalogTranslator
+
+
+class MessagesCommands(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.watch_locales_task.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the background tasks when the cog is unloaded."""
+        self.watch_locales_task.cancel()
+
+    @tasks.loop(seconds=30)
+    @logger.catch
+    async def watch_locales_task(self) -> None:
+        """Reload the message catalog when a locale file changes on disk."""
+        if MessageCatalog.reload_if_changed():
+            logger.info('Locale files changed, message catalog reloaded.')
+
+    @app_commands.command(name='reloadlang', description=CatalogTranslator.text('commands.reloadlang.description'))
+    @logger.catch
+    async def reload_lang_command(self, interaction: discord.Interaction) -> None:
+        """
+        Reload the locale files without restarting the bot.
+
+        Command names and descriptions are only updated on Discord at the next tree sync. If a file
+        cannot be loaded, the previous messages stay in use and the error is sent back.
+
+        :param interaction: The interaction object.
+        """
+        if not Validators.is_admin(user=interaction.user):
+            await interaction.response.send_message(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        try:
+            MessageCatalog.load()
+
+        except (json.JSONDecodeError, OSError) as e:
+            logger.error(f'Failed to reload the locale files: {e}')
+            await interaction.response.send_message(
+                MessageCatalog.get('commands.reloadlang.failed', interaction.locale, error=str(e)),
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.send_message(
+            MessageCatalog.get('commands.reloadlang.success', interaction.locale, locales=', '.join(MessageCatalog.locales())),
+            ephemeral=True
+        )
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Load the Cog with the message catalog commands."""
+    await bot.add_cog(MessagesCommands(bot))
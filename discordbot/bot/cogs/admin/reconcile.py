@@ -0,0 +1,158 @@
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from loguru import logger
+
+from ....database import AsyncDatabase
+from ....utilities import Validators, MessageCatalog
+from ....constants import BotConstants, CategoriesConstants
+from ...utilities.embed import EmbedUtilities
+from ...utilities.translator import CatalogTranslator
+from ...utilities.reconciliation import ChannelReconciler, ReconciliationReport
+
+
+class ReconcileCommands(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.reconciler: ChannelReconciler = ChannelReconciler(bot)
+        self.reconcile_task.change_interval(minutes=BotConstants.RECONCILE_INTERVAL_MINUTES)
+        self.reconcile_task.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the background tasks when the cog is unloaded."""
+        self.reconcile_task.cancel()
+
+    @commands.Cog.listener()
+    async def on_ready(self) -> None:
+        """Index the account channels once the guild cache is available."""
+        self.reconciler.build()
+
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel) -> None:
+        """Keep the channel index current when a channel is created."""
+        self.reconciler.track(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel) -> None:
+        """Keep the channel index current when a channel is renamed or moved."""
+        self.reconciler.track(after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        """Keep the channel index current when a channel is deleted."""
+        self.reconciler.forget(channel.id)
+
+    @tasks.loop(minutes=10)
+    @logger.catch
+    async def reconcile_task(self) -> None:
+        """Periodically compare the database with the Discord channels and report (or repair) the differences."""
+        report: ReconciliationReport = await self._reconcile(apply=BotConstants.RECONCILE_AUTO_REPAIR)
+
+        if not report.is_clean:
+            logger.warning(
+                f'Reconciliation: {len(report.missing_channels)} accounts without channel, '
+                f'{len(report.untracked_channels)} channels without account, {len(report.relinks)} wrong links, '
+                f'{len(report.status_drift)} status mismatches, {len(report.duplicate_channels)} accounts with duplicate channels, '
+                f'{report.repaired} repaired.'
+            )
+
+    @reconcile_task.before_loop
+    async def before_reconcile_task(self) -> None:
+        """Wait until the guild cache is ready before the first run."""
+        await self.bot.wait_until_ready()
+
+    @app_commands.command(name='reconcile', description=CatalogTranslator.text('commands.reconcile.description'))
+    @logger.catch
+    async def reconcile_command(self, interaction: discord.Interaction, apply: bool = False) -> None:
+        """
+        Compare the database with the Discord channels.
+
+        :param interaction: The interaction object.
+        :param apply: Repair the differences instead of only reporting them (dry run by default).
+        """
+        if not Validators.is_admin(user=interaction.user):
+            await interaction.response.send_message(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+        report: ReconciliationReport = await self._reconcile(apply=apply)
+        await interaction.followup.send(embed=self._report_embed(report, apply, interaction.locale), ephemeral=True)
+
+    async def _reconcile(self, apply: bool) -> ReconciliationReport:
+        """
+        Diff the database against the channel index, repairing the differences if requested.
+
+        :param apply: Repair the differences.
+        :return: The report.
+        """
+        accounts: list = await AsyncDatabase().get_accounts()
+        report: ReconciliationReport = self.reconciler.diff(accounts)
+
+        if apply and not report.is_clean:
+            category_id: Optional[str] = CategoriesConstants.FOR_SALE_CATEGORY_ID
+            category: Optional[discord.abc.GuildChannel] = self.bot.get_channel(int(category_id)) if category_id else None
+
+            if category is None:
+                logger.error(f'Category channel not found, the differences are not repaired. ID not found! {category_id}')
+                report.missing_category = True
+                return report
+
+            await self.reconciler.repair(report, category.guild)
+
+        return report
+
+    @staticmethod
+    def _report_embed(report: ReconciliationReport, apply: bool, locale: discord.Locale) -> discord.Embed:
+        """
+        Render a reconciliation report.
+
+        :param report: The report.
+        :param apply: Whether the differences were repaired.
+        :param locale: The locale of the interaction.
+        :return: The embed to send.
+        """
+        limit: int = 10
+        sections: dict[str, list[str]] = {
+            'missingChannels': [account.nick for account in report.missing_channels],
+            'untrackedChannels': [f'<#{channel_id}>' for channel_id, _ in report.untracked_channels],
+            'relinks': [f'{account.nick} → <#{channel_id}>' for account, channel_id in report.relinks],
+            'statusDrift': [f'{account.nick}: {account.status} → {status}' for account, status in report.status_drift],
+            'duplicateChannels': [
+                f'{nick}: {" ".join(f"<#{channel_id}>" for channel_id in channel_ids)}' for nick, channel_ids in report.duplicate_channels
+            ],
+        }
+        embed: discord.Embed = EmbedUtilities.create_embed(
+            title=MessageCatalog.get('commands.reconcile.embed.title', locale),
+            description=MessageCatalog.get(
+                'commands.reconcile.embed.clean' if report.is_clean else
+                'commands.reconcile.embed.missingCategory' if report.missing_category else
+                'commands.reconcile.embed.repaired' if apply else 'commands.reconcile.embed.dryRun',
+                locale,
+                repaired=report.repaired
+            ),
+            color=discord.Color.green() if report.is_clean else discord.Color.orange()
+        )
+
+        for key, lines in sections.items():
+            if not lines:
+                continue
+
+            value: str = '\n'.join(lines[:limit])
+
+            if len(lines) > limit:
+                value += '\n' + MessageCatalog.get('commands.reconcile.embed.more', locale, count=len(lines) - limit)
+
+            embed.add_field(
+                name=f'{MessageCatalog.get(f"commands.reconcile.embed.{key}", locale)} ({len(lines)})',
+                value=value,
+                inline=False
+            )
+
+        return embed
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Load the Cog with the reconciliation service."""
+    await bot.add_cog(ReconcileCommands(bot))
@@ -0,0 +1,120 @@
+import asyncio
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from loguru import logger
+
+from ....database import Database
+from ....models import AccountTable
+from ....constants import AccountStatus
+from ....utilities import Validators, MessageCatalog, PlayerUUID
+from ...utilities.embed import EmbedUtilities
+from ...utilities.translator import CatalogTranslator
+from ...utilities.responder import InteractionResponder
+from ...utilities.locks import AccountLocks
+from ...utilities.watchlist import WatchlistFeed
+
+
+class StatsCommands(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(name='stats', description=CatalogTranslator.text('commands.stats.description'))
+    @logger.catch
+    @InteractionResponder.budgeted
+    async def stats_command(self, interaction: discord.Interaction) -> None:
+        """
+        Show the runtime counters of the bot.
+
+        :param interaction: The interaction object.
+        """
+        responder: InteractionResponder = InteractionResponder.of(interaction)
+
+        if not Validators.is_admin(user=interaction.user):
+            await responder.send(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        embed: discord.Embed = EmbedUtilities.create_embed(
+            title=MessageCatalog.get('commands.stats.embed.title', interaction.locale),
+            color=discord.Color.blurple()
+        )
+        stats: dict[str, int] = InteractionResponder.stats
+        embed.add_field(
+            name=MessageCatalog.get('commands.stats.embed.responses', interaction.locale),
+            value=MessageCatalog.get(
+                'commands.stats.embed.responsesValue',
+                interaction.locale,
+                interactions=stats['interactions'],
+                phase=stats['deferred_by_phase'],
+                timer=stats['deferred_by_timer'],
+                late=stats['late_responses']
+            ),
+            inline=False
+        )
+        embed.add_field(
+            name=MessageCatalog.get('commands.stats.embed.phases', interaction.locale),
+            value='\n'.join(f'{name}: {estimate * 1000:.0f} ms' for name, estimate in InteractionResponder.estimates.items()),
+            inline=False
+        )
+        embed.add_field(
+            name=MessageCatalog.get('commands.stats.embed.mojang', interaction.locale),
+            value=MessageCatalog.get(
+                'commands.stats.embed.mojangValue',
+                interaction.locale,
+                state=PlayerUUID.breaker.state,
+                opened=PlayerUUID.breaker.opened,
+                cached=len(PlayerUUID.cache)
+            ),
+            inline=False
+        )
+        locks: dict[str, float] = AccountLocks.stats
+        embed.add_field(
+            name=MessageCatalog.get('commands.stats.embed.locks', interaction.locale),
+            value=MessageCatalog.get(
+                'commands.stats.embed.locksValue',
+                interaction.locale,
+                acquired=locks['acquired'],
+                contended=locks['contended'],
+                average=f'{locks["wait_total"] / locks["contended"] * 1000 if locks["contended"] else 0:.0f}',
+                max=f'{locks["wait_max"] * 1000:.0f}',
+                locked=AccountLocks.locked(),
+                peak=locks['peak']
+            ),
+            inline=False
+        )
+        watchlists: dict[str, int] = WatchlistFeed.stats
+        embed.add_field(
+            name=MessageCatalog.get('commands.stats.embed.watchlists', interaction.locale),
+            value=MessageCatalog.get(
+                'commands.stats.embed.watchlistsValue',
+                interaction.locale,
+                published=watchlists['published'],
+                dropped=watchlists['dropped'],
+                pending=WatchlistFeed.pending(),
+                matched=watchlists['matched'],
+                delivered=watchlists['delivered'],
+                undeliverable=watchlists['undeliverable']
+            ),
+            inline=False
+        )
+
+        async with responder.phase('database'):
+            table: AccountTable = await asyncio.to_thread(lambda: AccountTable.from_accounts(Database().iter_accounts()))
+
+        counts: dict[AccountStatus, int] = table.counts()
+        embed.add_field(
+            name=MessageCatalog.get('commands.stats.embed.inventory', interaction.locale),
+            value='\n'.join(f'{status}: {count}' for status, count in counts.items()) + '\n' + MessageCatalog.get(
+                'commands.stats.embed.inventoryValue',
+                interaction.locale,
+                value=table.total_price(AccountStatus.SALE)
+            ),
+            inline=False
+        )
+        await responder.send(embed=embed, ephemeral=True)
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Load the Cog with the stats command."""
+    await bot.add_cog(StatsCommands(bot))
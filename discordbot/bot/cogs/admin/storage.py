@@ -0,0 +1,107 @@
+import asyncio
+import os
+import sqlite3
+import time
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from loguru import logger
+
+from ....database import Database, AsyncDatabase, SQLiteDatabase, BackupService, BackupResult
+from ....utilities import Validators, MessageCatalog
+from ...utilities.translator import CatalogTranslator
+from ....constants import BotConstants
+
+
+class StorageCommands(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.backups: BackupService = BackupService(
+            source=SQLiteDatabase.PATH,
+            directory=BotConstants.BACKUP_PATH,
+            keep=BotConstants.BACKUP_KEEP,
+            compress=BotConstants.BACKUP_COMPRESS
+        )
+        self.vacuum_task.start()
+
+        if BotConstants.BACKUP_INTERVAL_HOURS > 0 and Database.backend() is SQLiteDatabase:
+            self.backup_task.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the background tasks when the cog is unloaded."""
+        self.vacuum_task.cancel()
+        self.backup_task.cancel()
+
+    @tasks.loop(hours=BotConstants.DB_VACUUM_INTERVAL_HOURS)
+    @logger.catch
+    async def vacuum_task(self) -> None:
+        """Return the pages freed by deleted accounts and archived events to the filesystem."""
+        freed: int = await AsyncDatabase().vacuum()
+
+        if freed:
+            logger.info(f'Incremental vacuum freed {freed} database pages.')
+
+    @tasks.loop(hours=BotConstants.BACKUP_INTERVAL_HOURS or 24)
+    @logger.catch
+    async def backup_task(self) -> None:
+        """Write a scheduled backup, unless a recent one exists (e.g. right after a restart)."""
+        snapshots: list[str] = self.backups.snapshots()
+
+        if snapshots and time.time() - os.path.getmtime(snapshots[-1]) < BotConstants.BACKUP_INTERVAL_HOURS * 3600:
+            return
+
+        try:
+            await asyncio.to_thread(self.backups.run)
+
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f'Scheduled database backup failed: {e}')
+
+    @app_commands.command(name='backup', description=CatalogTranslator.text('commands.backup.description'))
+    @logger.catch
+    async def backup_command(self, interaction: discord.Interaction) -> None:
+        """
+        Write a backup of the database now.
+
+        :param interaction: The interaction object.
+        """
+        if not Validators.is_admin(user=interaction.user):
+            await interaction.response.send_message(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        if Database.backend() is not SQLiteDatabase:
+            await interaction.response.send_message(MessageCatalog.get('commands.backup.unsupported', interaction.locale), ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        try:
+            result: Optional[BackupResult] = await asyncio.to_thread(self.backups.run)
+
+        except (sqlite3.Error, OSError) as e:
+            logger.error(f'Database backup failed: {e}')
+            await interaction.followup.send(MessageCatalog.get('commands.backup.failed', interaction.locale, error=str(e)), ephemeral=True)
+            return
+
+        if result is None:
+            await interaction.followup.send(MessageCatalog.get('commands.backup.running', interaction.locale), ephemeral=True)
+            return
+
+        await interaction.followup.send(
+            MessageCatalog.get(
+                'commands.backup.success',
+                interaction.locale,
+                name=os.path.basename(result.path),
+                duration=f'{result.duration:.2f}',
+                size=f'{result.size / 1024 / 1024:.2f}',
+                pages=result.pages,
+                removed=result.removed
+            ),
+            ephemeral=True
+        )
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Load the Cog with the storage maintenance tasks and the backup command."""
+    await bot.add_cog(StorageCommands(bot))
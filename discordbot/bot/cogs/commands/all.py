@@ -1,32 +1,48 @@
 ###
 # Because the logic of the commands is short, for simplicity they were all placed in the same file.
 ###
+import asyncio
 import datetime
+import time
 import discord
-from typing import Optional, Dict
+from typing import Optional, Dict, Callable, Awaitable
 
 from discord.channel import CategoryChannel
 from discord.ext import commands
 from discord.ui import Button, View
 from discord import app_commands
-from ezjsonpy import translate_message
 from loguru import logger
 
-from ....database import Database
-from ....utilities import Validators, PlayerUUIDFormat, PlayerUUID
+from ....database import Database, AsyncDatabase
+from ....utilities import Validators, PlayerUUIDFormat, PlayerUUID, MessageCatalog, WarmCache
 from ...utilities.channel import ChannelUtils
 from ...utilities.categories import CategoriesUtils
 from ...utilities.embed import EmbedUtilities
-from ....constants import URLConstants, AccountStatus, CategoriesConstants, BotConstants
-from ....models import User
+from ...utilities.translator import CatalogTranslator
+from ...utilities.responder import InteractionResponder
+from ...utilities.locks import AccountLocks
+from ...utilities.watchlist import WatchlistFeed
+from ....constants import URLConstants, AccountStatus, BotConstants
+from ....models import User, AccountTable
 
 
 class BotCommands(commands.Cog):
+    INVENTORY_TTL: float = 30.0  # Seconds an autocomplete snapshot of the accounts is reused
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.inventory: Optional[AccountTable] = None
+        self.inventory_version: Optional[int] = None  # Database.data_version() when the inventory was read
+        self.inventory_loaded: float = 0.0
+        WarmCache.register('inventory', dump=self._dump_inventory, load=self._load_inventory, bound=True)
+
+    async def cog_unload(self) -> None:
+        """Keep the inventory snapshot for the next load of the cog or the next start."""
+        WarmCache.unregister('inventory')
 
-    @app_commands.command(name='nick', description=translate_message('commands.nick.description'))
+    @app_commands.command(name='nick', description=CatalogTranslator.text('commands.nick.description'))
     @logger.catch
+    @InteractionResponder.budgeted
     async def nick_command(self, interaction: discord.Interaction, username: str, price: int) -> None:
         """
         Add username to database.
@@ -35,53 +51,69 @@ class BotCommands(commands.Cog):
         :param username: The username to add.
         :param int: Account price
         """
+        responder: InteractionResponder = InteractionResponder.of(interaction)
+
         if not Validators.has_permissions_role(user=interaction.user, guild=interaction.guild):
-            await interaction.response.send_message(translate_message('noPerms'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
             return
         
         if not Validators.validate_username(username=username):
-            await interaction.response.send_message(content=translate_message('invalidUsername'), ephemeral=True)
+            await responder.send(content=MessageCatalog.get('invalidUsername', interaction.locale), ephemeral=True)
             return
             
-        if Database().account_exists(nick=username):
-            await interaction.response.send_message(content=translate_message('commands.nick.accountExists'), ephemeral=True)
-            return
-        
-        if price <= 0:
-            await interaction.response.send_message(content=translate_message('commands.nick.invalidPrice'), ephemeral=True)
-            return
-        
-        Database().add_account(nick=username, price=price)
-        category: Optional[CategoryChannel] = await CategoriesUtils.get_category('for_sale', interaction.guild)
-        
-        if category is None:
-            logger.warning(translate_message('categoryNotFound').replace('$category', 'sales').replace('$command', 'nick'))
-            await interaction.response.send_message(translate_message('commandError'), ephemeral=True)
-            return
-        
-        channel_id: Optional[int] = await ChannelUtils.create_username_channel(
-            username=username,
-            price=str(price),
-            category=category,
-            guild=interaction.guild
-        )
-        
-        if channel_id is None:
-            return
-        
-        Database().link_discord_channel(nick=username, channel_id=channel_id)
-        uuid: PlayerUUIDFormat = PlayerUUID(username=username).get_uuid()
+        async with AccountLocks.hold(username):
+            if await AsyncDatabase().account_exists(nick=username):
+                await responder.send(content=MessageCatalog.get('commands.nick.accountExists', interaction.locale), ephemeral=True)
+                return
+
+            if price <= 0:
+                await responder.send(content=MessageCatalog.get('commands.nick.invalidPrice', interaction.locale), ephemeral=True)
+                return
+
+            async with responder.phase('database'):
+                await AsyncDatabase().add_account(nick=username, price=price)
+                await AsyncDatabase().record_event(nick=username, actor_id=interaction.user.id, old_status=None, new_status=AccountStatus.SALE)
+
+            category: Optional[CategoryChannel] = await CategoriesUtils.get_category('for_sale', interaction.guild)
+
+            if category is None:
+                logger.warning(MessageCatalog.get('categoryNotFound', category='sales', command='nick'))
+                await responder.send(MessageCatalog.get('commandError', interaction.locale), ephemeral=True)
+                return
+
+            async with responder.phase('channel_create'):
+                channel_id: Optional[int] = await ChannelUtils.create_username_channel(
+                    username=username,
+                    price=str(price),
+                    category=category,
+                    guild=interaction.guild
+                )
+
+            if channel_id is None:
+                await responder.send(MessageCatalog.get('commandError', interaction.locale), ephemeral=True)
+                return
+
+            await AsyncDatabase().link_discord_channel(nick=username, channel_id=channel_id)
+            WatchlistFeed.publish(nick=username, status=AccountStatus.SALE, price=price, channel_id=channel_id, actor_id=interaction.user.id)
+
+        async with responder.phase('mojang'):
+            uuid: PlayerUUIDFormat = await PlayerUUID(username=username).resolve(
+                deadline=responder.deadline,
+                on_refresh=self._thumbnail_refresher(interaction)
+            )
+
         username_uuid: str = uuid.online_uuid if uuid.online_uuid else uuid.offline_uuid
         embed: discord.Embed = EmbedUtilities.create_embed(
-            title=translate_message('commands.nick.embed.title'),
-            description=translate_message('commands.nick.embed.description').replace('$name', username),
+            title=MessageCatalog.get('commands.nick.embed.title', interaction.locale),
+            description=MessageCatalog.get('commands.nick.embed.description', interaction.locale, name=username),
             thumbnail=f'{URLConstants.MCHEADS.replace("$uuid", username_uuid)}',
             timestamp=datetime.datetime.now(datetime.timezone.utc)
         )
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await responder.send(embed=embed, ephemeral=True)
 
-    @app_commands.command(name='sold', description=translate_message('commands.sold.description'))
+    @app_commands.command(name='sold', description=CatalogTranslator.text('commands.sold.description'))
     @logger.catch
+    @InteractionResponder.budgeted
     async def sold_command(self, interaction: discord.Interaction, buyer: str) -> None:
         """
         Set an account to sold status in database
@@ -89,97 +121,134 @@ class BotCommands(commands.Cog):
         :param interaction: The interaction object.
         :param buyer: The buyer of the account.
         """
+        responder: InteractionResponder = InteractionResponder.of(interaction)
+
         if not Validators.has_permissions_role(user=interaction.user, guild=interaction.guild):
-            await interaction.response.send_message(translate_message('noPerms'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
             return
         
         channel_name: str = interaction.channel.name
         new_channel_name: str = channel_name.replace('💲', '❌')
-        is_nick_channel: tuple[bool, Optional[str]] = ChannelUtils.nick_channel(channel_name=channel_name)
+        is_nick_channel: tuple[bool, Optional[str]] = await ChannelUtils.nick_channel(channel_name=channel_name)
         
         if not is_nick_channel[0]:
-            await interaction.response.send_message(translate_message('noAccountChannel'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noAccountChannel', interaction.locale), ephemeral=True)
             return
         
         if '❌' in channel_name:
-            await interaction.response.send_message(translate_message('alreadySold'), ephemeral=True)
+            await responder.send(MessageCatalog.get('alreadySold', interaction.locale), ephemeral=True)
             return
         
         nick: str = is_nick_channel[1]
-        account_data: User = Database().get_account(nick=nick)
-        
-        if account_data.status == AccountStatus.INACTIVE:
-            await interaction.response.send_message(translate_message('inactiveAccount'), ephemeral=True)
-            return
-        
-        category: Optional[CategoryChannel] = await CategoriesUtils.get_category('sold', interaction.guild)
-        
-        if category is None:
-            logger.warning(translate_message('categoryNotFound').replace('$category', 'sold').replace('$command', 'sold'))
-            await interaction.response.send_message(translate_message('commandError'), ephemeral=True)
-            return
-        
-        await interaction.channel.edit(name=new_channel_name, category=category)
-        Database().set_buyer(nick=nick, buyer=buyer)
-        Database().update_account_status(nick=nick, status=AccountStatus.SOLD)
-        await interaction.response.send_message(translate_message('commands.sold.success'), ephemeral=True)
 
-    @app_commands.command(name='reserve', description=translate_message('commands.reserve.description'))
+        async with AccountLocks.hold(nick):
+            account_data: User = await AsyncDatabase().get_account(nick=nick)
+
+            if account_data.status == AccountStatus.SOLD:  # Sold by a command that held the account first
+                await responder.send(MessageCatalog.get('alreadySold', interaction.locale), ephemeral=True)
+                return
+
+            if account_data.status == AccountStatus.INACTIVE:
+                await responder.send(MessageCatalog.get('inactiveAccount', interaction.locale), ephemeral=True)
+                return
+
+            category: Optional[CategoryChannel] = await CategoriesUtils.get_category('sold', interaction.guild)
+
+            if category is None:
+                logger.warning(MessageCatalog.get('categoryNotFound', category='sold', command='sold'))
+                await responder.send(MessageCatalog.get('commandError', interaction.locale), ephemeral=True)
+                return
+
+            async with responder.phase('channel_edit'):
+                await interaction.channel.edit(name=new_channel_name, category=category)
+
+            await AsyncDatabase().set_buyer(nick=nick, buyer=buyer)
+            await AsyncDatabase().update_account_status(nick=nick, status=AccountStatus.SOLD)
+            await AsyncDatabase().record_event(nick=nick, actor_id=interaction.user.id, old_status=account_data.status, new_status=AccountStatus.SOLD, details=buyer)
+            await responder.send(MessageCatalog.get('commands.sold.success', interaction.locale), ephemeral=True)
+
+    @app_commands.command(name='reserve', description=CatalogTranslator.text('commands.reserve.description'))
     @logger.catch
-    async def reserve_command(self, interaction: discord.Interaction) -> None:
+    @InteractionResponder.budgeted
+    async def reserve_command(self, interaction: discord.Interaction, hours: Optional[app_commands.Range[int, 0, 720]] = None) -> None:
         """
         Set an account to reservation status in database
 
         :param interaction: The interaction object.
+        :param hours: Hours until the reservation expires, 0 to never expire (default RESERVATION_HOURS).
         """
+        responder: InteractionResponder = InteractionResponder.of(interaction)
+
         if not Validators.has_permissions_role(user=interaction.user, guild=interaction.guild):
-            await interaction.response.send_message(translate_message('noPerms'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
             return
         
         channel_name: str = interaction.channel.name
-        is_nick_channel: tuple[bool, Optional[str]] = ChannelUtils.nick_channel(channel_name=channel_name)
+        is_nick_channel: tuple[bool, Optional[str]] = await ChannelUtils.nick_channel(channel_name=channel_name)
         
         if not is_nick_channel[0]:
-            await interaction.response.send_message(translate_message('noAccountChannel'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noAccountChannel', interaction.locale), ephemeral=True)
             return
         
         if '❌' in channel_name:
-            await interaction.response.send_message(translate_message('alreadySold'), ephemeral=True)
-            return
-        
-        account_data: User = Database().get_account(nick=is_nick_channel[1])
-        
-        if account_data.status == AccountStatus.INACTIVE:
-            await interaction.response.send_message(translate_message('inactiveAccount'), ephemeral=True)
+            await responder.send(MessageCatalog.get('alreadySold', interaction.locale), ephemeral=True)
             return
-                        
-        reservations_category: Optional[CategoryChannel] = await CategoriesUtils.get_category('reservations', interaction.guild)
-        for_sale_category: Optional[CategoryChannel] = await CategoriesUtils.get_category('for_sale', interaction.guild)
-        new_category: Optional[CategoryChannel] = None
         
-        if reservations_category is None:
-            logger.warning(translate_message('categoryNotFound').replace('$category', 'reservations').replace('$command', 'reserve'))
-            await interaction.response.send_message(translate_message('commandError'), ephemeral=True)
-            return
-        
-        if for_sale_category is None:
-            logger.warning(translate_message('categoryNotFound').replace('$category', 'sales').replace('$command', 'reserve'))
-            await interaction.response.send_message(translate_message('commandError'), ephemeral=True)
-            return
-        
-        new_category = for_sale_category if interaction.channel.category.id == CategoriesConstants.RESERVATIONS_CATEGORY_ID else reservations_category
-        await interaction.channel.edit(category=new_category)
-        
-        if new_category.id == CategoriesConstants.RESERVATIONS_CATEGORY_ID:
-            Database().update_account_status(nick=is_nick_channel[1], status=AccountStatus.RESERVED)
-            await interaction.response.send_message(translate_message('commands.reserve.success'), ephemeral=True)
-            
-        else:
-            Database().update_account_status(nick=is_nick_channel[1], status=AccountStatus.SALE)
-            await interaction.response.send_message(translate_message('commands.reserve.removeReservation'), ephemeral=True)
-        
-    @app_commands.command(name='inactive', description=translate_message('commands.inactive.description'))
+        async with AccountLocks.hold(is_nick_channel[1]):
+            account_data: User = await AsyncDatabase().get_account(nick=is_nick_channel[1])
+
+            if account_data.status == AccountStatus.SOLD:  # Sold by a command that held the account first
+                await responder.send(MessageCatalog.get('alreadySold', interaction.locale), ephemeral=True)
+                return
+
+            if account_data.status == AccountStatus.INACTIVE:
+                await responder.send(MessageCatalog.get('inactiveAccount', interaction.locale), ephemeral=True)
+                return
+
+            reservations_category: Optional[CategoryChannel] = await CategoriesUtils.get_category('reservations', interaction.guild)
+            for_sale_category: Optional[CategoryChannel] = await CategoriesUtils.get_category('for_sale', interaction.guild)
+            new_category: Optional[CategoryChannel] = None
+
+            if reservations_category is None:
+                logger.warning(MessageCatalog.get('categoryNotFound', category='reservations', command='reserve'))
+                await responder.send(MessageCatalog.get('commandError', interaction.locale), ephemeral=True)
+                return
+
+            if for_sale_category is None:
+                logger.warning(MessageCatalog.get('categoryNotFound', category='sales', command='reserve'))
+                await responder.send(MessageCatalog.get('commandError', interaction.locale), ephemeral=True)
+                return
+
+            # Decided from the status read under the lock, the cached channel category may be stale
+            new_category = for_sale_category if account_data.status == AccountStatus.RESERVED else reservations_category
+            async with responder.phase('channel_edit'):
+                await interaction.channel.edit(category=new_category)
+
+            if new_category is reservations_category:
+                hours = BotConstants.RESERVATION_HOURS if hours is None else hours
+                expires_at: Optional[int] = int(time.time()) + hours * 3600 if hours > 0 else None
+                await AsyncDatabase().update_account_status(nick=is_nick_channel[1], status=AccountStatus.RESERVED)
+                await AsyncDatabase().set_reservation(nick=is_nick_channel[1], expires_at=expires_at)
+                await AsyncDatabase().record_event(nick=is_nick_channel[1], actor_id=interaction.user.id, old_status=account_data.status, new_status=AccountStatus.RESERVED)
+                WatchlistFeed.publish(nick=is_nick_channel[1], status=AccountStatus.RESERVED, price=account_data.price, channel_id=interaction.channel.id, actor_id=interaction.user.id)
+
+                if expires_at is None:
+                    await responder.send(MessageCatalog.get('commands.reserve.success', interaction.locale), ephemeral=True)
+
+                else:
+                    self.bot.reservations.schedule(is_nick_channel[1], expires_at)
+                    await responder.send(MessageCatalog.get('commands.reserve.successExpires', interaction.locale, expires=f'<t:{expires_at}:R>'), ephemeral=True)
+
+            else:
+                self.bot.reservations.cancel(is_nick_channel[1])
+                await AsyncDatabase().update_account_status(nick=is_nick_channel[1], status=AccountStatus.SALE)
+                await AsyncDatabase().record_event(nick=is_nick_channel[1], actor_id=interaction.user.id, old_status=account_data.status, new_status=AccountStatus.SALE)
+                WatchlistFeed.publish(nick=is_nick_channel[1], status=AccountStatus.SALE, price=account_data.price, channel_id=interaction.channel.id, actor_id=interaction.user.id)
+                await responder.send(MessageCatalog.get('commands.reserve.removeReservation', interaction.locale), ephemeral=True)
+        
+    @app_commands.command(name='inactive', description=CatalogTranslator.text('commands.inactive.description'))
     @logger.catch
+    @InteractionResponder.budgeted
     async def inactive_command(self, interaction: discord.Interaction, reason: str = 'Default') -> None:
         """
         Set an account to inactive status in database
@@ -187,77 +256,66 @@ class BotCommands(commands.Cog):
         :param interaction: The interaction object.
         :param reason: Reason for inactivity
         """
+        responder: InteractionResponder = InteractionResponder.of(interaction)
+
         if not Validators.has_permissions_role(user=interaction.user, guild=interaction.guild):
-            await interaction.response.send_message(translate_message('noPerms'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
             return
         
         channel_name: str = interaction.channel.name
-        is_nick_channel: tuple[bool, Optional[str]] = ChannelUtils.nick_channel(channel_name=channel_name)
+        is_nick_channel: tuple[bool, Optional[str]] = await ChannelUtils.nick_channel(channel_name=channel_name)
         
         if not is_nick_channel[0]:
-            await interaction.response.send_message(translate_message('noAccountChannel'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noAccountChannel', interaction.locale), ephemeral=True)
             return
         
         if '❌' in channel_name:
-            await interaction.response.send_message(translate_message('alreadySold'), ephemeral=True)
+            await responder.send(MessageCatalog.get('alreadySold', interaction.locale), ephemeral=True)
             return
         
-        account_data: User = Database().get_account(nick=is_nick_channel[1])
-        
-        if account_data.status != AccountStatus.INACTIVE:
-            Database().update_account_status(nick=is_nick_channel[1], status=AccountStatus.INACTIVE)
-            Database().set_inactive_reason(nick=is_nick_channel[1], reason=reason)
-            await interaction.response.send_message(translate_message('commands.inactive.success'), ephemeral=True)
-            
-        else:
-            Database().update_account_status(nick=is_nick_channel[1], status=AccountStatus.SALE)
-            await interaction.response.send_message(translate_message('commands.inactive.removeInactivity'), ephemeral=True) 
+        async with AccountLocks.hold(is_nick_channel[1]):
+            account_data: User = await AsyncDatabase().get_account(nick=is_nick_channel[1])
 
-    @app_commands.command(name='list', description=translate_message('commands.list.description'))
+            if account_data.status == AccountStatus.SOLD:  # Sold by a command that held the account first
+                await responder.send(MessageCatalog.get('alreadySold', interaction.locale), ephemeral=True)
+                return
+
+            if account_data.status != AccountStatus.INACTIVE:
+                await AsyncDatabase().update_account_status(nick=is_nick_channel[1], status=AccountStatus.INACTIVE)
+                await AsyncDatabase().set_inactive_reason(nick=is_nick_channel[1], reason=reason)
+                await AsyncDatabase().record_event(nick=is_nick_channel[1], actor_id=interaction.user.id, old_status=account_data.status, new_status=AccountStatus.INACTIVE, details=reason)
+                await responder.send(MessageCatalog.get('commands.inactive.success', interaction.locale), ephemeral=True)
+
+            else:
+                await AsyncDatabase().update_account_status(nick=is_nick_channel[1], status=AccountStatus.SALE)
+                await AsyncDatabase().record_event(nick=is_nick_channel[1], actor_id=interaction.user.id, old_status=account_data.status, new_status=AccountStatus.SALE)
+                WatchlistFeed.publish(nick=is_nick_channel[1], status=AccountStatus.SALE, price=account_data.price, channel_id=interaction.channel.id, actor_id=interaction.user.id)
+                await responder.send(MessageCatalog.get('commands.inactive.removeInactivity', interaction.locale), ephemeral=True) 
+
+    @app_commands.command(name='list', description=CatalogTranslator.text('commands.list.description'))
     @logger.catch
+    @InteractionResponder.budgeted
     async def list_users_command(self, interaction: discord.Interaction) -> None:
         """
         Lists users in pages, 10 per page, and allows navigation between pages with buttons.
         
         :param interaction: The interaction object.
         """
+        responder: InteractionResponder = InteractionResponder.of(interaction)
+
         if not Validators.has_permissions_role(user=interaction.user, guild=interaction.guild):
-            await interaction.response.send_message(translate_message('noPerms'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
             return
         
-        accounts_by_status: Dict[str, list] = {
-            AccountStatus.SALE: [],
-            AccountStatus.RESERVED: [],
-            AccountStatus.SOLD: [],
-            AccountStatus.INACTIVE: [],
-        }
-        all_accounts: list = Database().get_accounts()
-
-        for account in all_accounts:            
-            if account.status == AccountStatus.SALE:
-                accounts_by_status[AccountStatus.SALE].append(account)
-            elif account.status == AccountStatus.RESERVED:
-                accounts_by_status[AccountStatus.RESERVED].append(account)
-            elif account.status == AccountStatus.SOLD:
-                accounts_by_status[AccountStatus.SOLD].append(account)
-            elif account.status == AccountStatus.INACTIVE:
-                accounts_by_status[AccountStatus.INACTIVE].append(account)
-
-        for status in accounts_by_status:
-            accounts_by_status[status].sort(key=lambda account: account.price, reverse=True)
-
-        all_grouped_accounts = (
-            accounts_by_status[AccountStatus.SALE] +
-            accounts_by_status[AccountStatus.RESERVED] +
-            accounts_by_status[AccountStatus.SOLD] +
-            accounts_by_status[AccountStatus.INACTIVE]
-        )
+        async with responder.phase('database'):
+            table: AccountTable = await asyncio.to_thread(lambda: AccountTable.from_accounts(Database().iter_accounts()))
 
-        view: PaginationView = PaginationView(all_grouped_accounts)
-        await interaction.response.send_message(embed=view.get_embed(), view=view, ephemeral=True, delete_after=600)
+        view: PaginationView = PaginationView(table, table.grouped(), locale=interaction.locale)
+        await responder.send(embed=view.get_embed(), view=view, ephemeral=True, delete_after=600)
         
-    @app_commands.command(name='status', description=translate_message('commands.status.description'))
+    @app_commands.command(name='status', description=CatalogTranslator.text('commands.status.description'))
     @logger.catch
+    @InteractionResponder.budgeted
     async def status_command(self, interaction: discord.Interaction, username: str) -> None:
         """
         Set an account to inactive status in database
@@ -265,16 +323,18 @@ class BotCommands(commands.Cog):
         :param interaction: The interaction object.
         :param username: The username to view.
         """
+        responder: InteractionResponder = InteractionResponder.of(interaction)
+
         if not Validators.has_permissions_role(user=interaction.user, guild=interaction.guild):
-            await interaction.response.send_message(translate_message('noPerms'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
             return
         
         if not Validators.validate_username(username=username):
-            await interaction.response.send_message(content=translate_message('invalidUsername'), ephemeral=True)
+            await responder.send(content=MessageCatalog.get('invalidUsername', interaction.locale), ephemeral=True)
             return
             
-        if not Database().account_exists(nick=username):
-            await interaction.response.send_message(content=translate_message('commands.status.accountNotFound'), ephemeral=True)
+        if not await AsyncDatabase().account_exists(nick=username):
+            await responder.send(content=MessageCatalog.get('commands.status.accountNotFound', interaction.locale), ephemeral=True)
             return
         
         dynamic_data: dict = {
@@ -292,31 +352,53 @@ class BotCommands(commands.Cog):
             },
         }
 
-        user_data: User = Database().get_account(nick=username)
-        uuid: PlayerUUIDFormat = PlayerUUID(username=username).get_uuid()
+        user_data: User = await AsyncDatabase().get_account(nick=username)
+
+        async with responder.phase('mojang'):
+            uuid: PlayerUUIDFormat = await PlayerUUID(username=username).resolve(
+                deadline=responder.deadline,
+                on_refresh=self._thumbnail_refresher(interaction)
+            )
+
         username_uuid: str = uuid.online_uuid if uuid.online_uuid else uuid.offline_uuid
         embed: discord.Embed = EmbedUtilities.create_embed(
-            title=translate_message('commands.status.embed.title').replace('$name', user_data.nick),
-            description=translate_message('commands.status.embed.description').replace('$name', user_data.nick),
+            title=MessageCatalog.get('commands.status.embed.title', interaction.locale, name=user_data.nick),
+            description=MessageCatalog.get('commands.status.embed.description', interaction.locale, name=user_data.nick),
             color=dynamic_data[user_data.status]['color'],
             thumbnail=f'{URLConstants.MCHEADS.replace("$uuid", username_uuid)}',
             timestamp=datetime.datetime.now(datetime.timezone.utc),
-            footer=f'Account created on {user_data.created_at}',
+            footer=MessageCatalog.get('commands.status.embed.footer', interaction.locale, date=user_data.created_at),
             fields=[
-                {'name': 'Status', 'value': user_data.status, 'inline': True}
+                {'name': MessageCatalog.get('commands.status.embed.status', interaction.locale), 'value': user_data.status, 'inline': True}
             ]
         )
         
         if user_data.status == AccountStatus.INACTIVE:
-            embed.add_field(name='Reason for inactivity', value=user_data.reason_inactive, inline=True)
+            embed.add_field(name=MessageCatalog.get('commands.status.embed.reason', interaction.locale), value=user_data.reason_inactive, inline=True)
             
         if user_data.status == AccountStatus.SOLD:
-            embed.add_field(name='Account Buyer', value=user_data.buyer, inline=True)
+            embed.add_field(name=MessageCatalog.get('commands.status.embed.buyer', interaction.locale), value=user_data.buyer, inline=True)
             
-        await interaction.response.send_message(content=' ', embed=embed, ephemeral=True)
+        await responder.send(content=' ', embed=embed, ephemeral=True)
+
+    @status_command.autocomplete('username')
+    async def status_username_autocomplete(self, interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
+        """
+        Suggest the accounts whose nick starts with the typed text.
 
-    @app_commands.command(name='remove', description=translate_message('commands.remove.description'))
+        :param interaction: The interaction object.
+        :param current: The text typed so far.
+        :return: Up to 25 choices.
+        """
+        if not Validators.has_permissions_role(user=interaction.user, guild=interaction.guild):
+            return []
+
+        table: AccountTable = await self._get_inventory()
+        return [app_commands.Choice(name=nick, value=nick) for nick in table.complete(current)]
+
+    @app_commands.command(name='remove', description=CatalogTranslator.text('commands.remove.description'))
     @logger.catch
+    @InteractionResponder.budgeted
     async def remove_command(self, interaction: discord.Interaction, password: str) -> None:
         """
         Delete account from database.
@@ -324,31 +406,116 @@ class BotCommands(commands.Cog):
         :param interaction: The interaction object.
         :param password: The password of this command.
         """
+        responder: InteractionResponder = InteractionResponder.of(interaction)
+
         if not Validators.has_permissions_role(user=interaction.user, guild=interaction.guild):
-            await interaction.response.send_message(translate_message('noPerms'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
             return
         
         channel_name: str = interaction.channel.name
-        is_nick_channel: tuple[bool, Optional[str]] = ChannelUtils.nick_channel(channel_name=channel_name)
+        is_nick_channel: tuple[bool, Optional[str]] = await ChannelUtils.nick_channel(channel_name=channel_name)
         
         if not is_nick_channel[0]:
-            await interaction.response.send_message(translate_message('noAccountChannel'), ephemeral=True)
+            await responder.send(MessageCatalog.get('noAccountChannel', interaction.locale), ephemeral=True)
             return
         
         if password != BotConstants.REMOVE_PASSWORD:
-            await interaction.response.send_message(translate_message('commands.remove.invalidPassword'), ephemeral=True)
+            await responder.send(MessageCatalog.get('commands.remove.invalidPassword', interaction.locale), ephemeral=True)
             return
         
-        Database().remove_account(nick=is_nick_channel[1])
-        await interaction.channel.delete(reason='User removed from database')
+        async with AccountLocks.hold(is_nick_channel[1]):
+            if not await AsyncDatabase().account_exists(nick=is_nick_channel[1]):  # Removed by a command that held the account first
+                await responder.send(MessageCatalog.get('commands.status.accountNotFound', interaction.locale), ephemeral=True)
+                return
+
+            account_data: User = await AsyncDatabase().get_account(nick=is_nick_channel[1])
+            await AsyncDatabase().record_event(nick=is_nick_channel[1], actor_id=interaction.user.id, old_status=account_data.status, new_status=None)
+            await AsyncDatabase().remove_account(nick=is_nick_channel[1])
+
+            # Answer before deleting the channel, a deferred followup would otherwise go to the deleted channel
+            await responder.send(MessageCatalog.get('commands.remove.success', interaction.locale, name=is_nick_channel[1]), ephemeral=True)
+            await interaction.channel.delete(reason='User removed from database')
+
+    async def _get_inventory(self) -> AccountTable:
+        """
+        Get a columnar snapshot of the accounts, checked when older than INVENTORY_TTL and reloaded if they changed.
+
+        Autocomplete fires on every keystroke, so it reads this snapshot instead of the database. A snapshot whose
+        data version still matches, such as one restored from the cache snapshot, is kept without reading the accounts.
+
+        :return: The snapshot.
+        """
+        if self.inventory is None or time.monotonic() - self.inventory_loaded > self.INVENTORY_TTL:
+            inventory: Optional[AccountTable] = self.inventory
+            inventory_version: Optional[int] = self.inventory_version
+
+            def load() -> tuple[Optional[int], AccountTable]:
+                database: Database = Database()
+                version: Optional[int] = database.data_version()  # Read first: a later write only makes the version stale
+
+                if inventory is not None and version is not None and version == inventory_version:
+                    return version, inventory
+
+                return version, AccountTable.from_accounts(database.iter_accounts())
+
+            self.inventory_version, self.inventory = await asyncio.to_thread(load)
+            self.inventory_loaded = time.monotonic()
+
+        return self.inventory
+
+    def _dump_inventory(self) -> Optional[tuple[int, dict]]:
+        """
+        Get the inventory for the cache snapshot.
+
+        :return: (data version, table dict), None if there is no inventory or its version is unknown.
+        """
+        if self.inventory is None or self.inventory_version is None:
+            return None
+
+        return self.inventory_version, self.inventory.to_dict()
+
+    def _load_inventory(self, snapshot: tuple[int, dict]) -> None:
+        """
+        Take back the inventory saved in the cache snapshot, as if it had just been read.
+
+        WarmCache only restores it while the data version is unchanged, and _get_inventory keeps it as long as it is.
+
+        :param snapshot: The output of _dump_inventory.
+        """
+        self.inventory_version, self.inventory = snapshot[0], AccountTable.from_dict(snapshot[1])
+        self.inventory_loaded = time.monotonic()
+
+    @staticmethod
+    def _thumbnail_refresher(interaction: discord.Interaction) -> Callable[[str], Awaitable[None]]:
+        """
+        Create the callback that swaps the offline head of a sent embed for the premium one.
+
+        :param interaction: The interaction whose response holds the embed.
+        :return: A coroutine function taking the online UUID.
+        """
+        async def refresh(online_uuid: str) -> None:
+            message: discord.InteractionMessage = await interaction.original_response()
+
+            if not message.embeds:
+                return
+
+            embed: discord.Embed = message.embeds[0]
+            embed.set_thumbnail(url=URLConstants.MCHEADS.replace('$uuid', online_uuid))
+            await interaction.edit_original_response(embed=embed)
+
+        return refresh
         
 
 class PaginationView(View):
-    def __init__(self, users: list, user_per_page: int = 15):
+    def __init__(self, table: AccountTable, rows: list[int], user_per_page: int = 15, locale: Optional[discord.Locale] = None):
         super().__init__(timeout=600)
-        self.users: list = users
+        self.table: AccountTable = table
+        self.rows: list[int] = rows  # Indexes of the table rows, in display order
         self.user_per_page: int = user_per_page
         self.current_page: int = 0
+        self.locale: Optional[discord.Locale] = locale
+        self.previous_page.label = MessageCatalog.get('commands.list.embed.buttons.previous', locale)
+        self.next_page.label = MessageCatalog.get('commands.list.embed.buttons.next', locale)
 
     def get_embed(self) -> discord.Embed:
         """
@@ -358,7 +525,7 @@ class PaginationView(View):
         """
         start: int = self.current_page * self.user_per_page
         end: int = start + self.user_per_page
-        page_users: list = self.users[start:end]
+        page_rows: list[int] = self.rows[start:end]
         status_to_emoji: Dict[str, str] = {
             AccountStatus.SALE: '🟢',
             AccountStatus.RESERVED: '🟠',
@@ -366,26 +533,32 @@ class PaginationView(View):
             AccountStatus.INACTIVE: '⚪',
         }
         embed: discord.Embed = EmbedUtilities.create_embed(
-            title=translate_message('commands.list.embed.title'),
-            description=translate_message('commands.list.embed.description').replace('$accounts', str(len(self.users))),
-            footer=f'Page {self.current_page + 1} of {(len(self.users) + self.user_per_page - 1) // self.user_per_page}',
+            title=MessageCatalog.get('commands.list.embed.title', self.locale),
+            description=MessageCatalog.get('commands.list.embed.description', self.locale, accounts=str(len(self.rows))),
+            footer=MessageCatalog.get(
+                'commands.list.embed.footer',
+                self.locale,
+                page=self.current_page + 1,
+                pages=(len(self.rows) + self.user_per_page - 1) // self.user_per_page
+            ),
             color=discord.Color.magenta(),
         )
         previous_status: Optional[str] = None
         
-        for user in page_users:
-            emoji: str = status_to_emoji.get(user.status, '⚫')
+        for row in page_rows:
+            status: AccountStatus = self.table.status(row)
+            emoji: str = status_to_emoji.get(status, '⚫')
 
-            if user.status != previous_status:
+            if status != previous_status:
                 if previous_status is not None:
                     embed.description = f'{embed.description}\n'
             
-            embed.description = f'{embed.description}\n{emoji} {user.nick} - ({user.status})'
-            previous_status = user.status
+            embed.description = f'{embed.description}\n{emoji} {self.table.nicks[row]} - ({status})'
+            previous_status = status
                 
         return embed
 
-    @discord.ui.button(label=translate_message('commands.list.embed.buttons.previous'), style=discord.ButtonStyle.blurple)
+    @discord.ui.button(label='Previous', style=discord.ButtonStyle.blurple)
     async def previous_page(self, interaction: discord.Interaction, button: Button):
         """
         Button to go to the previous page
@@ -394,13 +567,13 @@ class PaginationView(View):
         :param button: Button
         """
         if self.current_page == 0:
-            await interaction.response.send_message(translate_message('commands.list.embed.buttons.previousLimit'), ephemeral=True)
+            await interaction.response.send_message(MessageCatalog.get('commands.list.embed.buttons.previousLimit', interaction.locale), ephemeral=True)
             return
 
         self.current_page -= 1
         await interaction.response.edit_message(embed=self.get_embed(), view=self)
 
-    @discord.ui.button(label=translate_message('commands.list.embed.buttons.next'), style=discord.ButtonStyle.blurple)
+    @discord.ui.button(label='Next', style=discord.ButtonStyle.blurple)
     async def next_page(self, interaction: discord.Interaction, button: Button):
         """
         Button to go to the next page
@@ -408,8 +581,8 @@ class PaginationView(View):
         :param interaction: The interaction object.
         :param button: Button
         """
-        if self.current_page == (len(self.users) + self.user_per_page - 1) // self.user_per_page - 1:
-            await interaction.response.send_message(translate_message('commands.list.embed.buttons.nextLimit'), ephemeral=True)
+        if self.current_page == (len(self.rows) + self.user_per_page - 1) // self.user_per_page - 1:
+            await interaction.response.send_message(MessageCatalog.get('commands.list.embed.buttons.nextLimit', interaction.locale), ephemeral=True)
             return
 
         self.current_page += 1
@@ -0,0 +1,157 @@
+import datetime
+import time
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands, tasks
+from loguru import logger
+
+from ....database import AsyncDatabase
+from ....utilities import Validators, MessageCatalog
+from ...utilities.channel import ChannelUtils
+from ...utilities.embed import EmbedUtilities
+from ...utilities.translator import CatalogTranslator
+from ....constants import BotConstants
+from ....models import AccountEvent
+
+
+class HistoryCommands(commands.Cog):
+    LINE_LENGTH: int = 300  # Characters shown per event, the details are free text
+    DESCRIPTION_LENGTH: int = 4096  # Characters an embed description holds
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.compact_events_task.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the background tasks when the cog is unloaded."""
+        self.compact_events_task.cancel()
+
+    @tasks.loop(hours=24)
+    @logger.catch
+    async def compact_events_task(self) -> None:
+        """Archive the account events older than the retention period."""
+        before: int = int(time.time()) - BotConstants.EVENTS_RETENTION_DAYS * 86400
+        archived: int = await AsyncDatabase().compact_events(before=before)
+
+        if archived:
+            logger.info(f'Archived {archived} account events older than {BotConstants.EVENTS_RETENTION_DAYS} days.')
+
+    @app_commands.command(name='history', description=CatalogTranslator.text('commands.history.description'))
+    @logger.catch
+    async def history_command(self, interaction: discord.Interaction, username: Optional[str] = None) -> None:
+        """
+        Show the change history of an account.
+
+        :param interaction: The interaction object.
+        :param username: The account to show, defaults to the account of the current channel.
+        """
+        if not Validators.has_permissions_role(user=interaction.user, guild=interaction.guild):
+            await interaction.response.send_message(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        if username is None:
+            is_nick_channel: tuple[bool, Optional[str]] = await ChannelUtils.nick_channel(channel_name=interaction.channel.name)
+
+            if not is_nick_channel[0]:
+                await interaction.response.send_message(MessageCatalog.get('noAccountChannel', interaction.locale), ephemeral=True)
+                return
+
+            username = is_nick_channel[1]
+
+        events: list[AccountEvent] = await AsyncDatabase().get_account_events(nick=username)
+
+        if not events and not await AsyncDatabase().account_exists(nick=username):
+            await interaction.response.send_message(MessageCatalog.get('commands.status.accountNotFound', interaction.locale), ephemeral=True)
+            return
+
+        embed: discord.Embed = EmbedUtilities.create_embed(
+            title=MessageCatalog.get('commands.history.embed.title', interaction.locale, name=username),
+            description=self._format_events(events, interaction.locale),
+            color=discord.Color.blurple()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name='events', description=CatalogTranslator.text('commands.events.description'))
+    @logger.catch
+    async def events_command(self, interaction: discord.Interaction, since: str, until: Optional[str] = None) -> None:
+        """
+        Show the account changes of the whole shop in a date range.
+
+        :param interaction: The interaction object.
+        :param since: The first day of the range, YYYY-MM-DD.
+        :param until: The last day of the range, YYYY-MM-DD (inclusive, defaults to today).
+        """
+        if not Validators.has_permissions_role(user=interaction.user, guild=interaction.guild):
+            await interaction.response.send_message(MessageCatalog.get('noPerms', interaction.locale), ephemeral=True)
+            return
+
+        if not Validators.validate_date(date=since) or (until is not None and not Validators.validate_date(date=until)):
+            await interaction.response.send_message(MessageCatalog.get('commands.export.invalidDate', interaction.locale), ephemeral=True)
+            return
+
+        start: int = self._date_to_epoch(since)
+        end: int = self._date_to_epoch(until) + 86400 if until else int(time.time()) + 1
+        events: list[AccountEvent] = await AsyncDatabase().get_events(start=start, end=end)
+        embed: discord.Embed = EmbedUtilities.create_embed(
+            title=MessageCatalog.get('commands.events.embed.title', interaction.locale),
+            description=self._format_events(events, interaction.locale),
+            color=discord.Color.blurple()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @staticmethod
+    def _date_to_epoch(date: str) -> int:
+        """
+        Convert a YYYY-MM-DD date to epoch seconds at UTC midnight.
+
+        :param date: The date to convert.
+        :return: The epoch seconds.
+        """
+        return int(datetime.datetime.strptime(date, '%Y-%m-%d').replace(tzinfo=datetime.timezone.utc).timestamp())
+
+    @classmethod
+    def _format_events(cls, events: list[AccountEvent], locale: discord.Locale) -> str:
+        """
+        Render the events as embed description lines, cut to fit in the description.
+
+        :param events: The events to render, newest first.
+        :param locale: The locale of the interaction.
+        :return: One line per event and how many did not fit, or the empty history message.
+        """
+        if not events:
+            return MessageCatalog.get('commands.history.empty', locale)
+
+        lines: list[str] = []
+
+        for event in events:
+            old_status: str = event.old_status or MessageCatalog.get('commands.history.created', locale)
+            new_status: str = event.new_status or MessageCatalog.get('commands.history.removed', locale)
+            line: str = f'<t:{event.created_at}:f> **{event.nick}** {old_status} → {new_status}'
+
+            if event.price is not None:
+                line += f' (${event.price})'
+
+            if event.actor_id is not None:
+                line += f' - <@{event.actor_id}>'
+
+            if event.details:
+                line += f' - {event.details}'
+
+            lines.append(line if len(line) <= cls.LINE_LENGTH else f'{line[:cls.LINE_LENGTH - 1]}…')
+
+        description: str = '\n'.join(lines)
+        shown: int = len(lines)
+
+        while len(description) > cls.DESCRIPTION_LENGTH:  # Drop the oldest events, each line is short enough to end
+            shown -= 1
+            more: str = MessageCatalog.get('commands.history.more', locale, count=str(len(lines) - shown))
+            description = '\n'.join(lines[:shown] + [more])
+
+        return description
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Load the Cog with the history commands."""
+    await bot.add_cog(HistoryCommands(bot))
@@ -0,0 +1,180 @@
+from typing import Optional
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+from loguru import logger
+
+from ....database import AsyncDatabase
+from ....utilities import Validators, MessageCatalog
+from ....constants import AccountStatus, BotConstants
+from ....models import Watch
+from ...utilities.embed import EmbedUtilities
+from ...utilities.translator import CatalogTranslator
+from ...utilities.watchlist import WatchlistNotifier
+
+STATUS_CHOICES: list[app_commands.Choice[str]] = [
+    app_commands.Choice(name=status, value=status)
+    for status in (AccountStatus.SALE, AccountStatus.RESERVED)
+]
+
+
+class WatchlistCommands(commands.Cog):
+    watch = app_commands.Group(name='watch', description=CatalogTranslator.text('commands.watch.description'))
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.notifier: WatchlistNotifier = WatchlistNotifier(bot, interval=BotConstants.WATCHLIST_DM_INTERVAL_MS / 1000)
+        self.notifier.start()
+
+    async def cog_unload(self) -> None:
+        """Stop the notifier when the cog is unloaded."""
+        self.notifier.stop()
+
+    @watch.command(name='add', description=CatalogTranslator.text('commands.watch.add.description'))
+    @app_commands.choices(status=STATUS_CHOICES)
+    @logger.catch
+    async def watch_add_command(
+        self,
+        interaction: discord.Interaction,
+        username: Optional[str] = None,
+        min_price: Optional[app_commands.Range[int, 0]] = None,
+        max_price: Optional[app_commands.Range[int, 0]] = None,
+        status: str = AccountStatus.SALE
+    ) -> None:
+        """
+        Get a DM when an account matching the conditions changes to a status.
+
+        :param interaction: The interaction object.
+        :param username: Only this account (optional).
+        :param min_price: Only accounts with at least this price (optional).
+        :param max_price: Only accounts with at most this price (optional).
+        :param status: The status to watch for, 'FOR SALE' by default.
+        """
+        if username is not None and not Validators.validate_username(username=username):
+            await interaction.response.send_message(MessageCatalog.get('invalidUsername', interaction.locale), ephemeral=True)
+            return
+
+        if min_price is not None and max_price is not None and min_price > max_price:
+            await interaction.response.send_message(MessageCatalog.get('commands.watch.add.invalidRange', interaction.locale), ephemeral=True)
+            return
+
+        user_id: int = interaction.user.id
+        watches: list[Watch] = await AsyncDatabase().get_watches(user_id=user_id)
+
+        if len(watches) >= BotConstants.WATCHLIST_MAX_PER_USER:
+            await interaction.response.send_message(
+                MessageCatalog.get('commands.watch.add.limit', interaction.locale, max=BotConstants.WATCHLIST_MAX_PER_USER),
+                ephemeral=True
+            )
+            return
+
+        candidate: Watch = Watch(
+            id=0,
+            user_id=user_id,
+            status=AccountStatus(status),
+            nick=username.lower() if username else None,
+            min_price=min_price or None,
+            max_price=max_price,
+            locale=str(interaction.locale),
+            created_at=0
+        )
+
+        if any(self._conditions(watch) == self._conditions(candidate) for watch in watches):
+            await interaction.response.send_message(MessageCatalog.get('commands.watch.add.duplicate', interaction.locale), ephemeral=True)
+            return
+
+        await AsyncDatabase().add_watch(
+            user_id=user_id,
+            status=candidate.status,
+            nick=candidate.nick,
+            min_price=candidate.min_price,
+            max_price=candidate.max_price,
+            locale=candidate.locale
+        )
+        await interaction.response.send_message(
+            MessageCatalog.get('commands.watch.add.success', interaction.locale, watch=self._describe(candidate, interaction.locale)),
+            ephemeral=True
+        )
+
+    @watch.command(name='list', description=CatalogTranslator.text('commands.watch.list.description'))
+    @logger.catch
+    async def watch_list_command(self, interaction: discord.Interaction) -> None:
+        """
+        Show the watches of the user.
+
+        :param interaction: The interaction object.
+        """
+        user_id: int = interaction.user.id
+        watches: list[Watch] = await AsyncDatabase().get_watches(user_id=user_id)
+
+        if not watches:
+            await interaction.response.send_message(MessageCatalog.get('commands.watch.list.empty', interaction.locale), ephemeral=True)
+            return
+
+        embed: discord.Embed = EmbedUtilities.create_embed(
+            title=MessageCatalog.get('commands.watch.list.title', interaction.locale),
+            description='\n'.join(f'`#{watch.id}` {self._describe(watch, interaction.locale)}' for watch in watches),
+            color=discord.Color.gold(),
+            footer=MessageCatalog.get('commands.watch.list.footer', interaction.locale, count=len(watches), max=BotConstants.WATCHLIST_MAX_PER_USER)
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @watch.command(name='remove', description=CatalogTranslator.text('commands.watch.remove.description'))
+    @logger.catch
+    async def watch_remove_command(self, interaction: discord.Interaction, watch_id: int) -> None:
+        """
+        Remove a watch of the user.
+
+        :param interaction: The interaction object.
+        :param watch_id: The id of the watch, shown by /watch list.
+        """
+        user_id: int = interaction.user.id
+        watches: list[Watch] = await AsyncDatabase().get_watches(user_id=user_id)
+
+        if not any(watch.id == watch_id for watch in watches):
+            await interaction.response.send_message(MessageCatalog.get('commands.watch.remove.notFound', interaction.locale, id=watch_id), ephemeral=True)
+            return
+
+        await AsyncDatabase().remove_watch(user_id=user_id, watch_id=watch_id)
+        await interaction.response.send_message(MessageCatalog.get('commands.watch.remove.success', interaction.locale, id=watch_id), ephemeral=True)
+
+    @staticmethod
+    def _conditions(watch: Watch) -> tuple:
+        """
+        Get what a watch matches, to refuse duplicates.
+
+        :param watch: The watch.
+        :return: (status, nick, min_price, max_price).
+        """
+        return watch.status, watch.nick, watch.min_price, watch.max_price
+
+    @staticmethod
+    def _describe(watch: Watch, locale: discord.Locale) -> str:
+        """
+        Describe the conditions of a watch.
+
+        :param watch: The watch.
+        :param locale: The locale of the description.
+        :return: E.g. '**FOR SALE** · any account · 10 - 50'.
+        """
+        parts: list[str] = [
+            f'**{watch.status}**',
+            f'`{watch.nick}`' if watch.nick else MessageCatalog.get('commands.watch.anyAccount', locale)
+        ]
+
+        if watch.min_price is not None and watch.max_price is not None:
+            parts.append(MessageCatalog.get('commands.watch.priceRange', locale, min=watch.min_price, max=watch.max_price))
+
+        elif watch.min_price is not None:
+            parts.append(MessageCatalog.get('commands.watch.priceFrom', locale, min=watch.min_price))
+
+        elif watch.max_price is not None:
+            parts.append(MessageCatalog.get('commands.watch.priceUpTo', locale, max=watch.max_price))
+
+        return ' · '.join(parts)
+
+
+async def setup(bot: commands.Bot) -> None:
+    """Load the Cog with the watchlist commands."""
+    await bot.add_cog(WatchlistCommands(bot))
@@ -6,7 +6,7 @@ from discord.ext import commands
 from discord.guild import Guild
 from discord.channel import CategoryChannel, TextChannel
 
-from ....database import Database
+from ....database import AsyncDatabase
 
 
 class ChannelUtils:
@@ -43,24 +43,37 @@ class ChannelUtils:
         return None
     
     @staticmethod
-    @logger.catch
-    def nick_channel(channel_name: str) -> tuple[bool, Optional[str]]:
+    def parse_nick(channel_name: str) -> Optional[str]:
         """
-        Extracts the username from a channel name and checks if the account exists.
+        Extracts the username from an account channel name ('💲│price-username').
 
         :param channel_name: The channel name to extract the username from.
-        :return: A tuple (True, username) if valid, otherwise (False, None).
+        :return: The username, or None if the name does not follow the account channel format.
         """
         if '-' not in channel_name:
-            return False, None
-        
+            return None
+
         try:
-            nick: str = channel_name.split('-')[1]
-            
+            return channel_name.split('-')[1]
+
         except IndexError:
+            return None
+
+    @staticmethod
+    @logger.catch
+    async def nick_channel(channel_name: str) -> tuple[bool, Optional[str]]:
+        """
+        Extracts the username from a channel name and checks if the account exists.
+
+        :param channel_name: The channel name to extract the username from.
+        :return: A tuple (True, username) if valid, otherwise (False, None).
+        """
+        nick: Optional[str] = ChannelUtils.parse_nick(channel_name=channel_name)
+
+        if nick is None:
             return False, None
         
-        if not Database().account_exists(nick=nick):
+        if not await AsyncDatabase().account_exists(nick=nick):
             return False, None
 
         return True, nick
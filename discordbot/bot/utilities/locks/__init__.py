@@ -0,0 +1,5 @@
+from .utils import AccountLocks
+
+__all__ = [
+    'AccountLocks'
+]
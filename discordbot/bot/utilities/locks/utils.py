@@ -0,0 +1,107 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager, AsyncExitStack
+from typing import AsyncIterator, Iterable
+
+
+class _AccountLock:
+    __slots__ = ('lock', 'users')
+
+    def __init__(self) -> None:
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.users: int = 0  # Tasks holding or waiting for the lock
+
+
+class AccountLocks:
+    """
+    One asyncio lock per account, so commands touching the same account run one after another
+    while commands on different accounts never wait for each other.
+
+    Locks are created when an account is first held and dropped as soon as nobody holds or waits
+    for them, so the table only ever contains the accounts being worked on.
+    """
+    _locks: dict[str, _AccountLock] = {}
+    stats: dict[str, float] = {
+        'acquired': 0,
+        'contended': 0,  # Acquisitions that had to wait for another command
+        'wait_total': 0.0,  # Seconds
+        'wait_max': 0.0,
+        'peak': 0,  # Most accounts locked at the same time
+    }
+
+    @classmethod
+    @asynccontextmanager
+    async def hold(cls, nick: str) -> AsyncIterator[None]:
+        """
+        Hold the lock of an account for the duration of the block.
+
+        Not reentrant: a task holding an account must not hold it again.
+
+        :param nick: The nickname of the account, case insensitive.
+        """
+        key: str = nick.lower()
+        entry: _AccountLock = cls._locks.get(key)
+
+        if entry is None:
+            entry = cls._locks[key] = _AccountLock()
+            cls.stats['peak'] = max(cls.stats['peak'], len(cls._locks))
+
+        entry.users += 1
+
+        try:
+            contended: bool = entry.users > 1
+            started: float = time.monotonic()
+            await entry.lock.acquire()
+            cls._record(contended, time.monotonic() - started)
+
+            try:
+                yield
+
+            finally:
+                entry.lock.release()
+
+        finally:
+            entry.users -= 1
+
+            if entry.users == 0:
+                del cls._locks[key]
+
+    @classmethod
+    @asynccontextmanager
+    async def hold_many(cls, nicks: Iterable[str]) -> AsyncIterator[None]:
+        """
+        Hold the locks of several accounts for the duration of the block.
+
+        The locks are taken in sorted order, so two commands holding overlapping sets never deadlock.
+
+        :param nicks: The nicknames of the accounts, case insensitive.
+        """
+        async with AsyncExitStack() as stack:
+            for nick in sorted({nick.lower() for nick in nicks}):
+                await stack.enter_async_context(cls.hold(nick))
+
+            yield
+
+    @classmethod
+    def locked(cls) -> int:
+        """
+        Number of accounts currently held or waited for.
+
+        :return: The number of live locks.
+        """
+        return len(cls._locks)
+
+    @classmethod
+    def _record(cls, contended: bool, waited: float) -> None:
+        """
+        Update the contention counters after an acquisition.
+
+        :param contended: Whether another task held or was waiting for the lock.
+        :param waited: Seconds spent waiting for the lock.
+        """
+        cls.stats['acquired'] += 1
+
+        if contended:
+            cls.stats['contended'] += 1
+            cls.stats['wait_total'] += waited
+            cls.stats['wait_max'] = max(cls.stats['wait_max'], waited)
@@ -0,0 +1,5 @@
+from .utils import PacedQueue
+
+__all__ = [
+    'PacedQueue'
+]
@@ -0,0 +1,91 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+from loguru import logger
+
+Job = Callable[[], Awaitable[Any]]
+ProgressCallback = Callable[[int, int, int], Awaitable[Any]]  # (done, failed, total)
+
+
+class PacedQueue:
+    def __init__(self, interval: float, progress_every: int = 10) -> None:
+        """
+        Runs Discord API jobs one at a time with a fixed pause between them.
+
+        Used for bulk work (channel edits, DMs) so a large batch never bursts into Discord's rate limits
+        and never blocks the command that queued it.
+
+        :param interval: The pause in seconds between two jobs.
+        :param progress_every: Report the progress of a batch every this many jobs.
+        """
+        self.interval: float = interval
+        self.progress_every: int = progress_every
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Number of queued jobs."""
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the worker task."""
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop the worker task, dropping the queued jobs."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+
+    def submit(self, jobs: list[Job], on_progress: Optional[ProgressCallback] = None) -> asyncio.Future:
+        """
+        Queue a batch of jobs.
+
+        :param jobs: Coroutine functions without arguments, run in order.
+        :param on_progress: Coroutine function called with (done, failed, total) while the batch runs and once it ends.
+        :return: A future resolved with (done, failed) when the whole batch has run.
+        """
+        batch: dict = {
+            'total': len(jobs),
+            'done': 0,
+            'failed': 0,
+            'on_progress': on_progress,
+            'future': asyncio.get_running_loop().create_future(),
+        }
+
+        if not jobs:
+            batch['future'].set_result((0, 0))
+
+        for job in jobs:
+            self._queue.put_nowait((job, batch))
+
+        return batch['future']
+
+    async def _run(self) -> None:
+        """Worker loop."""
+        while True:
+            job, batch = await self._queue.get()
+
+            try:
+                await job()
+                batch['done'] += 1
+
+            except Exception as e:
+                logger.warning(f'Paced job failed: {e}')
+                batch['failed'] += 1
+
+            finished: int = batch['done'] + batch['failed']
+
+            if batch['on_progress'] is not None and (finished % self.progress_every == 0 or finished == batch['total']):
+                try:
+                    await batch['on_progress'](batch['done'], batch['failed'], batch['total'])
+
+                except Exception as e:
+                    logger.warning(f'Progress callback failed: {e}')
+
+            if finished == batch['total'] and not batch['future'].done():
+                batch['future'].set_result((batch['done'], batch['failed']))
+
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,6 @@
+from .utils import ChannelReconciler, ReconciliationReport
+
+__all__ = [
+    'ChannelReconciler',
+    'ReconciliationReport'
+]
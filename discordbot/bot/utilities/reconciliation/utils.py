@@ -0,0 +1,298 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+import discord
+from loguru import logger
+from discord.ext import commands
+from discord.guild import Guild
+from discord.channel import CategoryChannel
+
+from ....database import AsyncDatabase
+from ....constants import CategoriesConstants, AccountStatus
+from ....models import User, AccountEvent
+from ..channel import ChannelUtils
+from ..categories import CategoriesUtils
+from ..locks import AccountLocks
+
+
+@dataclass
+class ReconciliationReport:
+    missing_channels: list[User] = field(default_factory=list)
+    untracked_channels: list[tuple[int, str]] = field(default_factory=list)
+    relinks: list[tuple[User, int]] = field(default_factory=list)
+    status_drift: list[tuple[User, str]] = field(default_factory=list)
+    duplicate_channels: list[tuple[str, list[int]]] = field(default_factory=list)  # Nicks with several channels
+    repaired: int = 0
+    missing_category: bool = False  # The repair was skipped, the for sale category is not set or not found
+
+    @property
+    def is_clean(self) -> bool:
+        """True if the database and the Discord channels agree."""
+        return not (self.missing_channels or self.untracked_channels or self.relinks or self.status_drift or self.duplicate_channels)
+
+
+class ChannelReconciler:
+    # Statuses an account may have while its channel is in each category, the first one is used for repairs
+    CATEGORY_STATUSES: dict[str, tuple[str, ...]] = {
+        'for_sale': (AccountStatus.SALE, AccountStatus.INACTIVE),
+        'reservations': (AccountStatus.RESERVED, AccountStatus.INACTIVE),
+        'sold': (AccountStatus.SOLD,),
+    }
+    STATUS_CATEGORIES: dict[str, str] = {
+        AccountStatus.SALE: 'for_sale',
+        AccountStatus.INACTIVE: 'for_sale',
+        AccountStatus.RESERVED: 'reservations',
+    }
+
+    def __init__(self, bot: commands.Bot) -> None:
+        self.bot: commands.Bot = bot
+        self.channels: dict[int, tuple[str, str]] = {}  # channel id -> (lowercase nick, category name)
+        self.built: bool = False
+
+    @staticmethod
+    def _category_names() -> dict[int, str]:
+        """
+        Maps the configured category ids to their category names.
+
+        :return: A dict of category id to 'for_sale', 'sold' or 'reservations'.
+        """
+        category_ids: dict[str, Optional[str]] = {
+            'for_sale': CategoriesConstants.FOR_SALE_CATEGORY_ID,
+            'sold': CategoriesConstants.SOLD_CATEGORY_ID,
+            'reservations': CategoriesConstants.RESERVATIONS_CATEGORY_ID,
+        }
+        return {int(category_id): name for name, category_id in category_ids.items() if category_id}
+
+    def build(self) -> int:
+        """
+        Indexes the account channels with a single pass over the three categories.
+
+        :return: The number of indexed channels.
+        """
+        channels: dict[int, tuple[str, str]] = {}
+
+        for category_id, name in self._category_names().items():
+            category: Optional[discord.abc.GuildChannel] = self.bot.get_channel(category_id)
+
+            if not isinstance(category, CategoryChannel):
+                logger.error(f'Category channel not found. ID not found! {category_id}')
+                continue
+
+            for channel in category.text_channels:
+                nick: Optional[str] = ChannelUtils.parse_nick(channel_name=channel.name)
+
+                if nick is not None:
+                    channels[channel.id] = (nick.lower(), name)
+
+        self.channels = channels
+        self.built = True
+        logger.info(f'Indexed {len(channels)} account channels.')
+        return len(channels)
+
+    def track(self, channel: discord.abc.GuildChannel) -> None:
+        """
+        Updates the index after a channel was created, renamed or moved.
+
+        :param channel: The channel in its current state.
+        """
+        self.channels.pop(channel.id, None)
+        name: Optional[str] = self._category_names().get(channel.category_id)
+
+        if name is None or not isinstance(channel, discord.TextChannel):
+            return
+
+        nick: Optional[str] = ChannelUtils.parse_nick(channel_name=channel.name)
+
+        if nick is not None:
+            self.channels[channel.id] = (nick.lower(), name)
+
+    def forget(self, channel_id: int) -> None:
+        """
+        Removes a deleted channel from the index.
+
+        :param channel_id: The id of the deleted channel.
+        """
+        self.channels.pop(channel_id, None)
+
+    def channels_by_nick(self) -> dict[str, list[tuple[int, str]]]:
+        """
+        Groups the indexed channels by account, built once per run instead of scanning the index per account.
+
+        :return: A dict of lowercase nick to (channel id, category name) tuples, more than one if the
+                 account has duplicate channels.
+        """
+        channels_by_nick: dict[str, list[tuple[int, str]]] = {}
+
+        for channel_id, (nick, name) in self.channels.items():
+            channels_by_nick.setdefault(nick, []).append((channel_id, name))
+
+        return channels_by_nick
+
+    def diff(self, accounts: list[User]) -> ReconciliationReport:
+        """
+        Compares the accounts with the indexed channels, without any Discord API call.
+
+        Accounts with several channels are only reported as duplicates, which channel is the right
+        one is left to the staff.
+
+        :param accounts: Every account of the database.
+        :return: The differences found.
+        """
+        if not self.built:
+            self.build()
+
+        report: ReconciliationReport = ReconciliationReport()
+        pending_moves: dict[str, int] = self.bot.reservations.pending_moves  # Expired, the channel move is being retried
+        channels_by_nick: dict[str, list[tuple[int, str]]] = self.channels_by_nick()
+        account_nicks: set[str] = set()
+
+        for account in accounts:
+            nick: str = account.nick.lower()
+            account_nicks.add(nick)
+            channels: list[tuple[int, str]] = channels_by_nick.get(nick, [])
+
+            if not channels:
+                report.missing_channels.append(account)
+                continue
+
+            if len(channels) > 1:
+                report.duplicate_channels.append((account.nick, sorted(channel_id for channel_id, _ in channels)))
+                continue
+
+            channel_id, name = channels[0]
+
+            if account.discord_channel_id != channel_id:
+                report.relinks.append((account, channel_id))
+
+            if account.status not in self.CATEGORY_STATUSES[name] and nick not in pending_moves:
+                report.status_drift.append((account, self.CATEGORY_STATUSES[name][0]))
+
+        for nick, channels in channels_by_nick.items():
+            if nick in account_nicks:
+                continue
+
+            report.untracked_channels.extend((channel_id, nick) for channel_id, _ in channels)
+
+            if len(channels) > 1:
+                report.duplicate_channels.append((nick, sorted(channel_id for channel_id, _ in channels)))
+
+        return report
+
+    @staticmethod
+    async def _expired(nick: str) -> bool:
+        """
+        Tells whether the last change of an account was the expiry of its reservation.
+
+        :param nick: The nickname of the account.
+        :return: True if the account was returned to sale by an expiry.
+        """
+        events: list[AccountEvent] = await AsyncDatabase().get_account_events(nick=nick, limit=1)
+        return bool(events) and events[0].details == 'expired'
+
+    @staticmethod
+    async def _current(nick: str) -> Optional[User]:
+        """
+        Reads an account again, it may have changed since the diff.
+
+        :param nick: The nickname of the account.
+        :return: The account, None if it was removed.
+        """
+        database: AsyncDatabase = AsyncDatabase()
+        return await database.get_account(nick=nick) if await database.account_exists(nick=nick) else None
+
+    @staticmethod
+    async def _set_status(account: User, status: str) -> None:
+        """
+        Changes the status of an account to match its channel, recording the event.
+
+        :param account: The account, as read again before the repair.
+        :param status: The status of the category of its channel.
+        """
+        database: AsyncDatabase = AsyncDatabase()
+        await database.update_account_status(nick=account.nick, status=status)
+        await database.record_event(nick=account.nick, actor_id=None, old_status=account.status, new_status=status, details='reconcile')
+
+    async def repair(self, report: ReconciliationReport, guild: Guild) -> int:
+        """
+        Fixes the differences that can be repaired safely.
+
+        Channel links and statuses are updated from Discord, and missing channels are created again
+        for accounts that are not sold. Untracked and duplicate channels are only reported, never deleted.
+        An account whose reservation expired keeps its status, its channel move is retried instead.
+
+        Each account is read again under its lock and only repaired if the difference still holds, so a
+        command that changed the account after the diff is not undone.
+
+        :param report: The report returned by diff.
+        :param guild: The guild holding the account channels.
+        :return: The number of repaired differences.
+        """
+        channels_by_nick: dict[str, list[tuple[int, str]]] = self.channels_by_nick()
+        repaired: int = 0
+
+        for account, channel_id in report.relinks:
+            async with AccountLocks.hold(account.nick):
+                current: Optional[User] = await self._current(account.nick)
+
+                if current is None or [channel for channel, _ in channels_by_nick.get(current.nick.lower(), [])] != [channel_id]:
+                    continue
+
+                if current.discord_channel_id != channel_id:
+                    await AsyncDatabase().link_discord_channel(nick=current.nick, channel_id=channel_id)
+                    repaired += 1
+
+        for account, _ in report.status_drift:
+            async with AccountLocks.hold(account.nick):
+                current: Optional[User] = await self._current(account.nick)
+                channels: list[tuple[int, str]] = channels_by_nick.get(account.nick.lower(), [])
+
+                if current is None or len(channels) != 1 or current.status in self.CATEGORY_STATUSES[channels[0][1]]:
+                    continue
+
+                if current.nick.lower() in self.bot.reservations.pending_moves:
+                    continue
+
+                status: str = self.CATEGORY_STATUSES[channels[0][1]][0]
+
+                if current.status == AccountStatus.SALE and status == AccountStatus.RESERVED and await self._expired(current.nick):
+                    # The reservation expired but its channel was never moved (e.g. the bot restarted meanwhile)
+                    self.bot.reservations.move_later(current.nick.lower())
+                    continue
+
+                await self._set_status(current, status)
+                repaired += 1
+
+        for account in report.missing_channels:
+            async with AccountLocks.hold(account.nick):
+                current: Optional[User] = await self._current(account.nick)
+
+                if current is None or current.nick.lower() in channels_by_nick:
+                    continue
+
+                category_name: Optional[str] = self.STATUS_CATEGORIES.get(current.status)
+
+                if category_name is None:
+                    continue
+
+                category: Optional[CategoryChannel] = await CategoriesUtils.get_category(category_name, guild)
+
+                if category is None:
+                    continue
+
+                channel_id: Optional[int] = await ChannelUtils.create_username_channel(
+                    username=current.nick,
+                    price=str(current.price),
+                    category=category,
+                    guild=guild
+                )
+
+                if channel_id is None:
+                    continue
+
+                await AsyncDatabase().link_discord_channel(nick=current.nick, channel_id=channel_id)
+                self.channels[channel_id] = (current.nick.lower(), category_name)
+                channels_by_nick[current.nick.lower()] = [(channel_id, category_name)]
+                repaired += 1
+
+        report.repaired = repaired
+        return repaired
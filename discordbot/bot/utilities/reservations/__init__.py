@@ -0,0 +1,5 @@
+from .utils import ReservationExpiry
+
+__all__ = [
+    'ReservationExpiry'
+]
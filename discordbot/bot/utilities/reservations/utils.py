@@ -0,0 +1,164 @@
+import time
+from typing import Optional
+
+import discord
+from loguru import logger
+from discord.ext import commands
+from discord.channel import CategoryChannel
+
+from ....database import AsyncDatabase
+from ....constants import AccountStatus
+from ....models import User
+from ....utilities import DeadlineScheduler
+from ..categories import CategoriesUtils
+from ..locks import AccountLocks
+from ..watchlist import WatchlistFeed
+
+
+class ReservationExpiry:
+    MOVE_RETRY_MIN: int = 5  # Seconds before retrying a failed channel move, doubled after each failure
+    MOVE_RETRY_MAX: int = 600
+
+    def __init__(self, bot: commands.Bot) -> None:
+        """
+        Returns reserved accounts to sale when their reservation expires.
+
+        The deadlines live in the accounts table (reserved_until). On start they are loaded through
+        its index into a DeadlineScheduler, which sleeps until the next one; deadlines that passed
+        while the bot was down fire right away. The database only expires an account still reserved
+        with the exact deadline that fired, so a release, a sale or a new reservation in between
+        turns a pending expiry into a no-op and nothing ever expires twice.
+
+        A channel that could not be moved back to the sales category is retried with backoff until it
+        moves; meanwhile its nick is in pending_moves, so the reconciler does not take the channel's
+        category for the truth and reserve the account again.
+
+        :param bot: The bot, to move the account channels.
+        """
+        self.bot: commands.Bot = bot
+        self.scheduler: DeadlineScheduler = DeadlineScheduler(self._expire)
+        self.retries: DeadlineScheduler = DeadlineScheduler(self._retry_move)
+        self.pending_moves: dict[str, int] = {}  # Lowercase nick -> failed attempts to move its channel
+        self.expired: int = 0
+
+    async def start(self) -> None:
+        """Load the reservation deadlines and start the scheduler."""
+        reservations: list[tuple[str, int]] = await AsyncDatabase().get_reservations()
+
+        for nick, expires_at in reservations:
+            self.scheduler.schedule(nick.lower(), expires_at)
+
+        self.scheduler.start()
+        self.retries.start()
+        logger.info(f'Scheduled the expiry of {len(reservations)} reservations.')
+
+    def stop(self) -> None:
+        """Stop the schedulers."""
+        self.scheduler.stop()
+        self.retries.stop()
+
+    def schedule(self, nick: str, expires_at: int) -> None:
+        """
+        Expire the reservation of an account at a deadline, stored with Database.set_reservation.
+
+        :param nick: The nickname of the account.
+        :param expires_at: The deadline as epoch seconds.
+        """
+        self.scheduler.schedule(nick.lower(), expires_at)
+
+    def cancel(self, nick: str) -> None:
+        """
+        Forget the expiry of an account whose reservation was removed.
+
+        :param nick: The nickname of the account.
+        """
+        self.scheduler.cancel(nick.lower())
+
+    async def _expire(self, nick: str, expires_at: int) -> None:
+        """
+        Return an account to sale and move its channel back to the sales category.
+
+        :param nick: The nickname of the account, lowercase.
+        :param expires_at: The deadline that fired.
+        """
+        await self.bot.wait_until_ready()  # The channels are only cached once the bot is ready
+
+        async with AccountLocks.hold(nick):
+            if not await AsyncDatabase().expire_reservation(nick=nick, expires_at=expires_at):
+                return  # Released, sold or reserved again since it was scheduled
+
+            self.expired += 1
+            account: User = await AsyncDatabase().get_account(nick=nick)
+            logger.info(f'The reservation of {account.nick} expired, it is for sale again.')
+
+            if not await self._move_channel(account):
+                self.move_later(nick)
+
+        WatchlistFeed.publish(nick=account.nick, status=AccountStatus.SALE, price=account.price, channel_id=account.discord_channel_id)
+
+    def move_later(self, nick: str) -> None:
+        """
+        Schedule another attempt to move the channel of an expired reservation.
+
+        :param nick: The nickname of the account, lowercase.
+        """
+        attempts: int = self.pending_moves.get(nick, 0) + 1
+        self.pending_moves[nick] = attempts
+        delay: int = min(self.MOVE_RETRY_MIN * 2 ** (attempts - 1), self.MOVE_RETRY_MAX)
+        self.retries.schedule(nick, int(time.time()) + delay)
+        logger.warning(f'Moving the channel of {nick} back to the sales category failed {attempts} times, retrying in {delay} s.')
+
+    async def _retry_move(self, nick: str, deadline: int) -> None:
+        """
+        Retry moving the channel of an expired reservation, unless the account changed since.
+
+        :param nick: The nickname of the account, lowercase.
+        :param deadline: The retry time that fired.
+        """
+        async with AccountLocks.hold(nick):
+            database: AsyncDatabase = AsyncDatabase()
+            account: Optional[User] = await database.get_account(nick=nick) if await database.account_exists(nick=nick) else None
+
+            if account is None or account.status != AccountStatus.SALE:
+                self.pending_moves.pop(nick, None)  # Removed, or its new status moved the channel already
+                return
+
+            if await self._move_channel(account):
+                self.pending_moves.pop(nick, None)
+                logger.info(f'The channel of {account.nick} was moved back to the sales category.')
+                return
+
+            self.move_later(nick)
+
+    async def _move_channel(self, account: User) -> bool:
+        """
+        Move the channel of an account to the sales category.
+
+        :param account: The account.
+        :return: False if the move failed and should be retried, True otherwise.
+        """
+        channel: Optional[discord.abc.GuildChannel] = self.bot.get_channel(account.discord_channel_id) if account.discord_channel_id else None
+
+        if channel is None:
+            logger.warning(f'The channel of {account.nick} was not found, the reconciler recreates it in the sales category.')
+            return True
+
+        category: Optional[CategoryChannel] = await CategoriesUtils.get_category('for_sale', channel.guild)
+
+        if category is None:
+            return False
+
+        if channel.category == category:
+            return True
+
+        try:
+            await channel.edit(category=category)
+
+        except discord.NotFound:
+            return True  # Deleted meanwhile, same as not found
+
+        except discord.HTTPException as e:
+            logger.warning(f'Failed to move the channel of {account.nick} back to the sales category: {e}')
+            return False
+
+        return True
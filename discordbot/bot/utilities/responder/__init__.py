@@ -0,0 +1,5 @@
+from .utils import InteractionResponder
+
+__all__ = [
+    'InteractionResponder'
+]
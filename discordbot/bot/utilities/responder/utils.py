@@ -0,0 +1,197 @@
+import asyncio
+import functools
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+import discord
+from loguru import logger
+
+from ....constants import BotConstants
+from ....utilities import MessageCatalog
+
+
+class InteractionResponder:
+    # Running estimates (seconds) of how long each slow phase takes, updated after every phase
+    estimates: dict[str, float] = {
+        'database': 0.05,
+        'channel_create': 0.5,
+        'channel_edit': 0.5,
+        'mojang': 1.0,
+    }
+    stats: dict[str, int] = {
+        'interactions': 0,
+        'deferred_by_phase': 0,
+        'deferred_by_timer': 0,
+        'late_responses': 0,
+    }
+    ESTIMATE_WEIGHT: float = 0.2
+
+    def __init__(self, interaction: discord.Interaction, budget: float = BotConstants.INTERACTION_BUDGET_MS / 1000, ephemeral: bool = True) -> None:
+        """
+        Tracks the time spent on an interaction and defers it before Discord's 3 second acknowledgement window ends.
+
+        :param interaction: The interaction to respond to.
+        :param budget: Seconds after which the interaction is deferred if it has not been answered yet.
+        :param ephemeral: Whether the deferred "thinking" state and the followups are ephemeral.
+        """
+        self.interaction: discord.Interaction = interaction
+        self.budget: float = budget
+        self.ephemeral: bool = ephemeral
+        self.started: float = time.monotonic()
+        self.deferred: bool = False
+        self.sent: bool = False
+        self._lock: asyncio.Lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+
+    @classmethod
+    def of(cls, interaction: discord.Interaction) -> 'InteractionResponder':
+        """
+        Gets the responder attached to an interaction by the budgeted decorator.
+
+        :param interaction: The interaction object.
+        :return: The responder of the interaction.
+        """
+        return interaction.extras['responder']
+
+    @staticmethod
+    def budgeted(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        """
+        Decorator for cog command handlers that attaches a responder to the interaction.
+
+        The responder arms a timer that defers the interaction when the budget runs out, and once the
+        handler returns it makes sure a deferred interaction always gets a followup.
+
+        :param func: The command handler, called as func(self, interaction, ...).
+        :return: The wrapped handler.
+        """
+        @functools.wraps(func)
+        async def wrapper(self: Any, interaction: discord.Interaction, *args: Any, **kwargs: Any) -> Any:
+            responder: InteractionResponder = InteractionResponder(interaction)
+            interaction.extras['responder'] = responder
+            responder.start()
+
+            try:
+                return await func(self, interaction, *args, **kwargs)
+
+            finally:
+                await responder.finish()
+
+        return wrapper
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the handler started."""
+        return time.monotonic() - self.started
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left before the interaction has to be deferred."""
+        return self.budget - self.elapsed
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """Seconds a slow call may take, None if the interaction is already acknowledged and can wait."""
+        if self.interaction.response.is_done():
+            return None
+
+        return max(self.remaining, 0.0)
+
+    def start(self) -> None:
+        """Arm the deferral timer."""
+        InteractionResponder.stats['interactions'] += 1
+        self._timer = asyncio.create_task(self._defer_on_deadline())
+
+    async def finish(self) -> None:
+        """Disarm the timer and answer a deferred interaction that the handler left without response."""
+        if self._timer is not None:
+            self._timer.cancel()
+
+        if self.deferred and not self.sent:
+            try:
+                await self.interaction.followup.send(
+                    MessageCatalog.get('commandError', self.interaction.locale),
+                    ephemeral=self.ephemeral
+                )
+
+            except discord.HTTPException:
+                pass  # The channel may have been deleted meanwhile
+
+    @asynccontextmanager
+    async def phase(self, name: str) -> AsyncIterator[None]:
+        """
+        Wrap a potentially slow step of the handler.
+
+        If the estimated duration of the step does not fit in the remaining budget, the interaction is
+        deferred before the step starts. This matters for blocking calls (sqlite, requests), during which
+        the timer cannot run. The measured duration updates the estimate of the phase.
+
+        :param name: The name of the phase, e.g. 'mojang'.
+        """
+        estimate: float = InteractionResponder.estimates.get(name, 0.0)
+
+        if estimate >= self.remaining and await self.defer():
+            InteractionResponder.stats['deferred_by_phase'] += 1
+            logger.debug(f'Deferred /{self._command_name()} before {name} ({self.elapsed:.2f}s elapsed, {estimate:.2f}s expected)')
+
+        started: float = time.monotonic()
+
+        try:
+            yield
+
+        finally:
+            duration: float = time.monotonic() - started
+            InteractionResponder.estimates[name] = (
+                (1 - self.ESTIMATE_WEIGHT) * estimate + self.ESTIMATE_WEIGHT * duration if estimate else duration
+            )
+
+    async def defer(self) -> bool:
+        """
+        Defer the interaction if it has not been answered yet.
+
+        :return: True if this call deferred the interaction.
+        """
+        async with self._lock:
+            if self.interaction.response.is_done():
+                return False
+
+            await self.interaction.response.defer(ephemeral=self.ephemeral, thinking=True)
+            self.deferred = True
+            return True
+
+    async def send(self, content: Optional[str] = None, *, delete_after: Optional[float] = None, **kwargs: Any) -> None:
+        """
+        Answer the interaction, as the initial response or as a followup if it was already deferred.
+
+        :param content: The message content.
+        :param delete_after: Delete the message after this many seconds (optional).
+        :param kwargs: Any other argument of InteractionResponse.send_message (embed, view, ephemeral...).
+        """
+        async with self._lock:
+            kwargs.setdefault('ephemeral', self.ephemeral)
+
+            if not self.interaction.response.is_done():
+                if self.elapsed > 3:
+                    InteractionResponder.stats['late_responses'] += 1
+
+                await self.interaction.response.send_message(content, delete_after=delete_after, **kwargs)
+
+            else:
+                message: discord.WebhookMessage = await self.interaction.followup.send(content, wait=True, **kwargs)
+
+                if delete_after is not None:
+                    await message.delete(delay=delete_after)
+
+            self.sent = True
+
+    async def _defer_on_deadline(self) -> None:
+        """Timer task: defer the interaction when the budget runs out."""
+        await asyncio.sleep(max(self.remaining, 0))
+
+        if await self.defer():
+            InteractionResponder.stats['deferred_by_timer'] += 1
+            logger.debug(f'Deferred /{self._command_name()} after {self.elapsed:.2f}s')
+
+    def _command_name(self) -> str:
+        """The name of the command being answered, for logging."""
+        return self.interaction.command.name if self.interaction.command else 'unknown'
@@ -0,0 +1,5 @@
+from .utils import CatalogTranslator
+
+__all__ = [
+    'CatalogTranslator'
+]
@@ -0,0 +1,40 @@
+from typing import Optional
+
+import discord
+from discord import app_commands
+
+from ....utilities import MessageCatalog
+
+
+class CatalogTranslator(app_commands.Translator):
+    async def translate(
+        self,
+        string: app_commands.locale_str,
+        locale: discord.Locale,
+        context: app_commands.TranslationContextTypes
+    ) -> Optional[str]:
+        """
+        Translates command names, descriptions and choices created with CatalogTranslator.text.
+
+        :param string: The string to translate, its 'key' extra holds the message path.
+        :param locale: The Discord locale to translate to.
+        :param context: The translation context.
+        :return: The translated string, or None to keep the default one.
+        """
+        key: Optional[str] = string.extras.get('key')
+
+        if key is None:
+            return None
+
+        translated: str = MessageCatalog.get(key, locale)
+        return translated if translated != string.message else None
+
+    @staticmethod
+    def text(key: str) -> app_commands.locale_str:
+        """
+        Creates a translatable string from a message path, using the default locale as the default text.
+
+        :param key: The dotted message path, e.g. 'commands.nick.description'.
+        :return: The translatable string.
+        """
+        return app_commands.locale_str(MessageCatalog.get(key), key=key)
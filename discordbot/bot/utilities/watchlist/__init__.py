@@ -0,0 +1,7 @@
+from .utils import WatchlistFeed, WatchlistNotifier, WatchEvent
+
+__all__ = [
+    'WatchlistFeed',
+    'WatchlistNotifier',
+    'WatchEvent'
+]
@@ -0,0 +1,174 @@
+import asyncio
+import functools
+from dataclasses import dataclass
+from typing import Optional
+
+import discord
+from loguru import logger
+from discord.ext import commands
+
+from ....database import AsyncDatabase
+from ....constants import AccountStatus
+from ....models import Watch
+from ....utilities import MessageCatalog
+from ..embed import EmbedUtilities
+from ..pacer import PacedQueue
+
+
+@dataclass(frozen=True)
+class WatchEvent:
+    nick: str
+    status: AccountStatus  # The new status of the account
+    price: Optional[int]
+    channel_id: Optional[int]
+    actor_id: Optional[int]  # Who made the change, never notified about it
+
+
+class WatchlistFeed:
+    """
+    Account changes waiting to be matched against the watchlists.
+
+    Commands publish their changes here and return: publishing never waits, and when the notifier falls
+    too far behind, new changes are dropped (and counted) instead of queuing without bound.
+    """
+    MAX_PENDING: int = 1000
+    _events: Optional[asyncio.Queue] = None
+    stats: dict[str, int] = {
+        'published': 0,
+        'dropped': 0,
+        'matched': 0,  # Notifications queued, one per subscriber and change
+        'delivered': 0,
+        'undeliverable': 0,  # Subscribers with closed DMs or who left
+    }
+
+    @classmethod
+    def _queue(cls) -> asyncio.Queue:
+        """Get the event queue, created on first use."""
+        if cls._events is None:
+            cls._events = asyncio.Queue(maxsize=cls.MAX_PENDING)
+
+        return cls._events
+
+    @classmethod
+    def publish(cls, nick: str, status: str, price: Optional[int], channel_id: Optional[int] = None, actor_id: Optional[int] = None) -> None:
+        """
+        Publish an account change to the watchers.
+
+        :param nick: The nickname of the account.
+        :param status: The new status of the account.
+        :param price: The price of the account.
+        :param channel_id: The channel of the account, linked in the notification (optional).
+        :param actor_id: The Discord id of the user who made the change (optional).
+        """
+        try:
+            cls._queue().put_nowait(WatchEvent(nick, AccountStatus(status), price, channel_id, actor_id))
+            cls.stats['published'] += 1
+
+        except asyncio.QueueFull:
+            cls.stats['dropped'] += 1
+            logger.warning(f'Watchlist feed full, {nick} changing to {status} is not notified.')
+
+    @classmethod
+    async def next(cls) -> WatchEvent:
+        """
+        Wait for the next published change.
+
+        :return: The change.
+        """
+        return await cls._queue().get()
+
+    @classmethod
+    def pending(cls) -> int:
+        """Number of changes waiting to be matched."""
+        return cls._queue().qsize()
+
+
+class WatchlistNotifier:
+    def __init__(self, bot: commands.Bot, interval: float) -> None:
+        """
+        Matches the published changes against the watchlists and DMs the subscribers.
+
+        Each change is matched with one indexed query off the event loop, then one DM per subscriber
+        (however many of their watches match) is queued on a PacedQueue, so a listing watched by
+        thousands of buyers is delivered at a steady pace without hitting the rate limits or
+        blocking any command.
+
+        :param bot: The bot, to reach the subscribers.
+        :param interval: The pause in seconds between two DMs.
+        """
+        self.bot: commands.Bot = bot
+        self.queue: PacedQueue = PacedQueue(interval=interval)
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the fan-out worker and the DM queue."""
+        if self._worker is None:
+            self.queue.start()
+            self._worker = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop the fan-out worker and the DM queue, dropping the queued DMs."""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+            self.queue.stop()
+
+    async def _run(self) -> None:
+        """Worker loop."""
+        while True:
+            event: WatchEvent = await WatchlistFeed.next()
+
+            try:
+                await self.fan_out(event)
+
+            except Exception as e:
+                logger.error(f'Failed to notify the watchers of {event.nick}: {e}')
+
+    async def fan_out(self, event: WatchEvent) -> int:
+        """
+        Queue the DMs of the subscribers matching a change.
+
+        :param event: The change.
+        :return: The number of queued DMs.
+        """
+        watches: list[Watch] = await AsyncDatabase().match_watches(event.nick, event.status, event.price)
+        recipients: dict[int, Watch] = {}
+
+        for watch in watches:
+            if watch.user_id != event.actor_id:
+                recipients.setdefault(watch.user_id, watch)
+
+        if recipients:
+            WatchlistFeed.stats['matched'] += len(recipients)
+            self.queue.submit([functools.partial(self._notify, watch, event) for watch in recipients.values()])
+
+        return len(recipients)
+
+    async def _notify(self, watch: Watch, event: WatchEvent) -> None:
+        """
+        DM a subscriber about a change.
+
+        :param watch: The first watch of the subscriber matching the change.
+        :param event: The change.
+        """
+        try:
+            user: discord.User = self.bot.get_user(watch.user_id) or await self.bot.fetch_user(watch.user_id)
+            embed: discord.Embed = EmbedUtilities.create_embed(
+                title=MessageCatalog.get('commands.watch.notification.title', watch.locale, name=event.nick, status=event.status),
+                description=MessageCatalog.get(
+                    'commands.watch.notification.description',
+                    watch.locale,
+                    name=event.nick,
+                    status=event.status,
+                    price=event.price
+                ) + (f'\n<#{event.channel_id}>' if event.channel_id else ''),
+                color=discord.Color.gold(),
+                footer=MessageCatalog.get('commands.watch.notification.footer', watch.locale, id=watch.id)
+            )
+            await user.send(embed=embed)
+
+        except (discord.Forbidden, discord.NotFound):
+            WatchlistFeed.stats['undeliverable'] += 1
+            return
+
+        WatchlistFeed.stats['delivered'] += 1
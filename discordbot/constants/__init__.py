@@ -1,9 +1,11 @@
-from .bot import BotConstants, ChannelConstants, CategoriesConstants, URLConstants, AccountStatus
+from .bot import BotConstants, ChannelConstants, CategoriesConstants, URLConstants, MojangConstants, AccountStatus, IDs
 
 __all__ = [
-    'BotConstants'
+    'BotConstants',
     'ChannelConstants',
     'CategoriesConstants',
     'URLConstants',
-    'AccountStatus'
-]
\ No newline at end of file
+    'MojangConstants',
+    'AccountStatus',
+    'IDs'
+]
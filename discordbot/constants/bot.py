@@ -1,4 +1,5 @@
 import os
+from enum import Enum
 from typing import Optional, Any
 
 from dotenv import load_dotenv
@@ -13,6 +14,35 @@ class BotConstants:
     REMOVE_PASSWORD: Any = os.getenv('REMOVE_PASSWORD')
     PERMISSIONS_ROLE_ID: Any = os.getenv('PERMISSIONS_ROLE_ID')
     DB_FILENAME: str = 'accounts.db'
+    DB_BACKEND: str = os.getenv('DB_BACKEND', 'sqlite').lower()  # sqlite, memory or postgres
+    DATABASE_URL: Optional[str] = os.getenv('DATABASE_URL')  # postgres backend only
+    DB_POOL_MIN_SIZE: int = int(os.getenv('DB_POOL_MIN_SIZE', 1))
+    DB_POOL_MAX_SIZE: int = int(os.getenv('DB_POOL_MAX_SIZE', 10))
+    LANG_PATH: str = 'lang'  # Directory with one <locale>.json file per language
+    DEFAULT_LOCALE: str = os.getenv('DEFAULT_LOCALE', 'en')
+    INTERACTION_BUDGET_MS: int = int(os.getenv('INTERACTION_BUDGET_MS', 2000))  # Discord allows 3000 ms to acknowledge
+    EVENTS_RETENTION_DAYS: int = int(os.getenv('EVENTS_RETENTION_DAYS', 180))
+    DB_WRITE_BEHIND: bool = os.getenv('DB_WRITE_BEHIND', 'false').lower() in ('1', 'true', 'yes')
+    DB_BATCH_WINDOW_MS: int = int(os.getenv('DB_BATCH_WINDOW_MS', 5))
+    DB_BATCH_SIZE: int = int(os.getenv('DB_BATCH_SIZE', 100))
+    DB_READ_POOL_SIZE: int = int(os.getenv('DB_READ_POOL_SIZE', 4))
+    DB_PROFILE: bool = os.getenv('DB_PROFILE', 'false').lower() in ('1', 'true', 'yes')
+    DB_SLOW_QUERY_MS: int = int(os.getenv('DB_SLOW_QUERY_MS', 100))
+    DB_VACUUM_INTERVAL_HOURS: float = float(os.getenv('DB_VACUUM_INTERVAL_HOURS', 24))
+    BACKUP_PATH: str = os.getenv('BACKUP_PATH', 'backups')
+    BACKUP_INTERVAL_HOURS: float = float(os.getenv('BACKUP_INTERVAL_HOURS', 24))  # 0 disables the scheduled backups
+    BACKUP_KEEP: int = int(os.getenv('BACKUP_KEEP', 7))
+    BACKUP_COMPRESS: bool = os.getenv('BACKUP_COMPRESS', 'true').lower() in ('1', 'true', 'yes')
+    RECONCILE_INTERVAL_MINUTES: int = int(os.getenv('RECONCILE_INTERVAL_MINUTES', 10))
+    RECONCILE_AUTO_REPAIR: bool = os.getenv('RECONCILE_AUTO_REPAIR', 'false').lower() in ('1', 'true', 'yes')
+    CHANNEL_EDIT_INTERVAL_MS: int = int(os.getenv('CHANNEL_EDIT_INTERVAL_MS', 1500))  # Pause between bulk channel edits
+    LOOP_WATCHDOG_INTERVAL_MS: int = int(os.getenv('LOOP_WATCHDOG_INTERVAL_MS', 100))
+    LOOP_STALL_THRESHOLD_MS: int = int(os.getenv('LOOP_STALL_THRESHOLD_MS', 250))  # 0 disables the event loop watchdog
+    COG_AUTO_RELOAD: bool = os.getenv('COG_AUTO_RELOAD', 'false').lower() in ('1', 'true', 'yes')
+    RESERVATION_HOURS: int = int(os.getenv('RESERVATION_HOURS', 48))  # Default length of a /reserve, 0 never expires
+    WATCHLIST_DM_INTERVAL_MS: int = int(os.getenv('WATCHLIST_DM_INTERVAL_MS', 1000))  # Pause between two watchlist DMs
+    WATCHLIST_MAX_PER_USER: int = int(os.getenv('WATCHLIST_MAX_PER_USER', 10))
+    WARM_CACHE_PATH: str = os.getenv('WARM_CACHE_PATH', 'db/cache.json.gz')  # Empty disables the cache snapshot
 
 
 class ChannelConstants:
@@ -25,15 +55,52 @@ class CategoriesConstants:
     RESERVATIONS_CATEGORY_ID: Any = os.getenv('RESERVATIONS_CATEGORY_ID')
     
 
-class AccountStatus:
-    SALE: str = 'FOR SALE'
-    RESERVED: str = 'RESERVERD'
-    SOLD: str = 'SOLD'
-    INACTIVE: str = 'INACTIVE'
+class AccountStatus(str, Enum):
+    # Members compare equal to the strings stored in the database; the declaration order defines their codes
+    SALE = 'FOR SALE'
+    RESERVED = 'RESERVERD'
+    SOLD = 'SOLD'
+    INACTIVE = 'INACTIVE'
+
+    __str__ = str.__str__  # f'{status}' gives the stored string, not 'AccountStatus.SALE'
+
+    @property
+    def code(self) -> int:
+        """Small integer identifying the status, for compact representations."""
+        return _STATUS_CODES[self]
+
+    @classmethod
+    def from_code(cls, code: int) -> 'AccountStatus':
+        """
+        Gets the status identified by a code.
+
+        :param code: The code, as returned by AccountStatus.code.
+        :return: The status.
+        """
+        return _STATUSES[code]
+
+
+_STATUSES: tuple[AccountStatus, ...] = tuple(AccountStatus)
+_STATUS_CODES: dict[AccountStatus, int] = {status: code for code, status in enumerate(_STATUSES)}
 
 
 class URLConstants:
     MCHEADS: str = 'https://mc-heads.net/avatar/$uuid/100/nohelm'
+    MOJANG_PROFILE: str = 'https://api.mojang.com/users/profiles/minecraft/$name'
+
+
+class MojangConstants:
+    TIMEOUT: float = float(os.getenv('MOJANG_TIMEOUT', 3.0))  # Seconds to wait for Mojang when there is no tighter deadline
+    MIN_DEADLINE: float = 0.3  # Below this remaining time the lookup is not even attempted
+    BREAKER_WINDOW: float = 60.0
+    BREAKER_FAILURE_RATE: float = 0.5
+    BREAKER_MIN_CALLS: int = 4
+    BREAKER_OPEN_SECONDS: float = 30.0
+    REFRESH_INTERVAL: float = 5.0
+    REFRESH_WINDOW: float = 14 * 60  # Interaction tokens expire after 15 minutes
+    CACHE_SIZE: int = 10000  # Usernames kept, the least recently used are evicted
+    CACHE_TTL: float = 30 * 86400  # A name can pass to another account after a name change
+    NEGATIVE_CACHE_TTL: float = 3600  # A name that is not premium can be bought at any time
 
 
 class IDs:
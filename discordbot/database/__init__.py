@@ -1,5 +1,18 @@
-from .database import Database
+from .database import Database, AsyncDatabase
+from .sqlite import SQLiteDatabase
+from .memory import MemoryDatabase
+from .postgres import PostgresDatabase
+from .backup import BackupService, BackupResult
+from .profiler import QueryProfiler, QueryStats
 
 __all__ = [
-    'Database'
-]
\ No newline at end of file
+    'Database',
+    'AsyncDatabase',
+    'SQLiteDatabase',
+    'MemoryDatabase',
+    'PostgresDatabase',
+    'BackupService',
+    'BackupResult',
+    'QueryProfiler',
+    'QueryStats'
+]
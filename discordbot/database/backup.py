@@ -0,0 +1,195 @@
+import gzip
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from loguru import logger
+
+
+@dataclass
+class BackupResult:
+    path: str
+    size: int  # Bytes of the written snapshot, after compression
+    pages: int
+    duration: float  # Seconds
+    removed: int  # Old snapshots deleted by the rotation
+
+
+class BackupService:
+    PAGES_PER_STEP: int = 256  # Pages copied while the source is locked, ~1 MiB with the default page size
+    STEP_PAUSE: float = 0.005  # Seconds between steps, so writers can take the lock
+    PREFIX: str = 'accounts-'
+    STAMP_FORMAT: str = '%Y%m%d-%H%M%S'  # Followed by the microseconds, so two snapshots never share a name
+    _lock: threading.Lock = threading.Lock()
+
+    def __init__(self, source: str, directory: str, keep: int, compress: bool) -> None:
+        """
+        Takes consistent snapshots of a live SQLite database with the online backup API.
+
+        The copy runs in small steps, so the bot keeps reading and writing while it runs. Meant to be
+        called from a worker thread (asyncio.to_thread), never on the event loop.
+
+        :param source: The path of the database file.
+        :param directory: The directory where the snapshots are written.
+        :param keep: The number of snapshots kept, older ones are deleted.
+        :param compress: Whether the snapshots are gzip compressed.
+        """
+        self.source: str = source
+        self.directory: str = directory
+        self.keep: int = keep
+        self.compress: bool = compress
+
+    @property
+    def running(self) -> bool:
+        """Whether a backup is in progress."""
+        return self._lock.locked()
+
+    def run(self) -> Optional[BackupResult]:
+        """
+        Writes a new snapshot, verifies it and rotates the old ones.
+
+        :return: The result, None if another backup is already running.
+        :raises sqlite3.DatabaseError: If the copy fails or the snapshot does not pass the integrity check.
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+
+        try:
+            return self._run()
+
+        finally:
+            self._lock.release()
+
+    def snapshots(self) -> list[str]:
+        """
+        Lists the snapshots written by this service, compressed or not.
+
+        :return: Their paths, oldest first.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+
+        paths: list[str] = [
+            os.path.join(self.directory, name) for name in os.listdir(self.directory)
+            if name.startswith(self.PREFIX) and name.endswith(('.db', '.db.gz'))
+        ]
+        return sorted(paths, key=self._taken_at)
+
+    def _taken_at(self, path: str) -> tuple[float, str]:
+        """
+        Gets the time a snapshot was taken from its name, or from its modification time if the name has no timestamp.
+
+        :param path: The path of the snapshot.
+        :return: The time, with the path to break ties.
+        """
+        stamp: str = os.path.basename(path)[len(self.PREFIX):].split('.', 1)[0]
+        seconds, _, micros = stamp.rpartition('-')
+
+        try:
+            return time.mktime(time.strptime(seconds, self.STAMP_FORMAT)) + int(micros) / 1e6, path
+
+        except ValueError:
+            return os.path.getmtime(path), path
+
+    def _run(self) -> BackupResult:
+        """Backup without the concurrency guard."""
+        started: float = time.monotonic()
+        os.makedirs(self.directory, exist_ok=True)
+        now: float = time.time()
+        name: str = f'{self.PREFIX}{time.strftime(self.STAMP_FORMAT, time.localtime(now))}-{int(now % 1 * 1e6):06d}.db'
+        path: str = os.path.join(self.directory, f'{name}.gz' if self.compress else name)
+        partial: str = os.path.join(self.directory, f'{name}.partial')
+
+        try:
+            pages: int = self._copy(partial)
+            self._verify(partial)
+
+            if self.compress:
+                with open(partial, 'rb') as source, gzip.open(path, 'wb', compresslevel=6) as target:
+                    shutil.copyfileobj(source, target)
+
+                os.remove(partial)
+
+            else:
+                os.replace(partial, path)
+
+        except (sqlite3.Error, OSError):
+            for leftover in (partial, path):
+                if os.path.exists(leftover):
+                    os.remove(leftover)
+
+            raise
+
+        removed: int = self._rotate()
+        result: BackupResult = BackupResult(
+            path=path,
+            size=os.path.getsize(path),
+            pages=pages,
+            duration=time.monotonic() - started,
+            removed=removed
+        )
+        logger.info(f'Database backup written to {path} ({result.size} bytes, {pages} pages) in {result.duration:.2f}s.')
+        return result
+
+    def _copy(self, target: str) -> int:
+        """
+        Copies the database page by page into a new file.
+
+        If another connection writes between two steps, SQLite restarts the copy, so the snapshot is
+        always a consistent state of the database.
+
+        :param target: The path of the copy.
+        :return: The number of copied pages.
+        """
+        copied: list[int] = [0]
+
+        def progress(status: int, remaining: int, total: int) -> None:
+            copied[0] = total
+            time.sleep(self.STEP_PAUSE)
+
+        source: sqlite3.Connection = sqlite3.connect(self.source)
+        destination: sqlite3.Connection = sqlite3.connect(target)
+
+        try:
+            source.backup(destination, pages=self.PAGES_PER_STEP, progress=progress)
+            return copied[0]
+
+        finally:
+            destination.close()
+            source.close()
+
+    @staticmethod
+    def _verify(path: str) -> None:
+        """
+        Runs PRAGMA integrity_check on a snapshot.
+
+        :param path: The path of the snapshot.
+        :raises sqlite3.DatabaseError: If the snapshot is corrupt.
+        """
+        conn: sqlite3.Connection = sqlite3.connect(path)
+
+        try:
+            problems: list = conn.execute('PRAGMA integrity_check;').fetchall()
+
+        finally:
+            conn.close()
+
+        if problems != [('ok',)]:
+            raise sqlite3.DatabaseError(f'Backup failed the integrity check: {"; ".join(row[0] for row in problems[:5])}')
+
+    def _rotate(self) -> int:
+        """
+        Deletes the oldest snapshots beyond the retention.
+
+        :return: The number of deleted snapshots.
+        """
+        old: list[str] = self.snapshots()[:-self.keep] if self.keep > 0 else []
+
+        for path in old:
+            os.remove(path)
+
+        return len(old)
@@ -1,167 +1,132 @@
-import sqlite3
+import asyncio
+import functools
+import inspect
 import sys
-import os
-
-from typing import Optional
-from contextlib import contextmanager
+from abc import ABC, abstractmethod
+from concurrent.futures import Future
+from typing import Optional, Iterator, Any, Callable, Awaitable
 
 from loguru import logger
 
-from ..models import User
-from ..constants import BotConstants
+from ..models import User, AccountEvent, Watch
+from ..constants import BotConstants, AccountStatus
 
 
-class Database:
-    def __init__(self) -> None:
-        if not os.path.exists('db'):
-            os.makedirs('db')
+class Database(ABC):
+    """
+    Storage interface of the bot.
 
-        if not os.path.exists(f'db/{BotConstants.DB_FILENAME}'):
-            open(f'db/{BotConstants.DB_FILENAME}', 'w').close()
+    Calling Database() returns an instance of the backend selected with the DB_BACKEND setting
+    ('sqlite', 'memory' or 'postgres'), so callers never depend on a concrete backend. Write methods
+    may return a future when the backend commits them asynchronously, otherwise None.
 
-        try:
-            self.conn: sqlite3.Connection = sqlite3.connect(f'db/{BotConstants.DB_FILENAME}')
+    The methods are blocking. Code running on the bot's event loop goes through AsyncDatabase instead.
+    """
+    EVENT_COLUMNS: str = 'id, account_id, nick, actor_id, old_status, new_status, price, details, created_at'
+    ACCOUNT_COLUMNS: str = 'id, nick, status, price, sold_to, reason_inactive, discord_channel_id, created_at'
+    WATCH_COLUMNS: str = 'id, user_id, status, nick, min_price, max_price, locale, created_at'
 
-        except sqlite3.Error as e:
-            logger.critical(f'Failed to connect to the database: {e}')
-            sys.exit(1)
+    def __new__(cls, *args, **kwargs) -> 'Database':
+        if cls is Database:
+            cls = Database.backend()
 
-        self._create_table()
-
-    @contextmanager
-    def _get_cursor(self):
-        """Context manager for database cursor."""
-        cursor: Optional[sqlite3.Cursor] = None
-
-        try:
-            cursor = self.conn.cursor()
-            yield cursor
-
-        except sqlite3.Error as e:
-            logger.error(f'Database error: {e}')
-            self.conn.rollback()
-            raise
-
-        finally:
-            if cursor:
-                cursor.close()
-
-    def _create_table(self) -> None:
-        """Creates the users table if it doesn't exist."""
-        try:
-            with self._get_cursor() as cursor:
-                cursor.execute('''
-                CREATE TABLE IF NOT EXISTS accounts (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    nick TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    price INTEGER,
-                    sold_to TEXT,
-                    reason_inactive TEXT,
-                    discord_channel_id INTEGER,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                );
-                ''')
-                self.conn.commit()
-
-        except sqlite3.Error as e:
-            logger.critical(f'Failed to create table: {e}')
-            sys.exit(1)
-    def _execute_query(self, query: str, params: tuple = ()) -> None:
+        return super().__new__(cls)
+
+    @staticmethod
+    def backend(name: str = BotConstants.DB_BACKEND) -> type['Database']:
         """
-        Executes an insert or update query on the database.
+        Gets the backend class for a DB_BACKEND name.
 
-        :param query: The SQL query to execute.
-        :param params: The parameters for the query, default is an empty tuple.
+        :param name: The backend name.
+        :return: The Database subclass implementing it.
         """
-        try:
-            with self._get_cursor() as cursor:
-                cursor.execute(query, params)
-                self.conn.commit()
-        except sqlite3.Error as e:
-            logger.error(f'Error executing query: {e}')
+        from .sqlite import SQLiteDatabase
+        from .memory import MemoryDatabase
+        from .postgres import PostgresDatabase
+
+        backends: dict[str, type[Database]] = {
+            'sqlite': SQLiteDatabase,
+            'memory': MemoryDatabase,
+            'postgres': PostgresDatabase,
+        }
+
+        if name not in backends:
+            logger.critical(f'Unknown database backend "{name}". Valid values: {", ".join(backends)}.')
+            sys.exit(1)
+
+        return backends[name]
 
-    def _fetch_data(self, query: str, params: tuple = ()) -> list:
+    @classmethod
+    async def run_async(cls, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """
-        Fetches data from the database.
+        Runs a method of the backend without blocking the event loop.
 
-        :param query: The SQL query to fetch data.
-        :param params: The parameters for the query, default is an empty tuple.
-        :return: A list of tuples containing the fetched data.
+        The method runs in a worker thread on a new instance. A returned future (a queued write) is then
+        awaited as well, so the call only completes once the write is committed.
+
+        :param function: The method, taken from the backend class.
+        :param args: The positional arguments of the method.
+        :param kwargs: The keyword arguments of the method.
+        :return: The result of the method.
         """
-        try:
-            with self._get_cursor() as cursor:
-                cursor.execute(query, params)
-                return cursor.fetchall()
-        except sqlite3.Error as e:
-            logger.error(f'Error fetching data: {e}')
-            return []
-        
-    def add_account(self, nick: str, price: int = None) -> None:
+        result: Any = await asyncio.to_thread(lambda: function(cls(), *args, **kwargs))
+
+        if isinstance(result, Future):
+            return await asyncio.wrap_future(result)
+
+        return result
+
+    @abstractmethod
+    def add_account(self, nick: str, price: int = None) -> Optional[Future]:
         """
         Adds a new account with 'FOR SALE' as the default status and prevents other statuses.
 
         :param nick: The nickname of the account.
         :param price: The price of the account, default is None.
+        :return: A future resolved once the write is committed, or None if it already is.
         """
-        status: str = 'FOR SALE'
-        self._execute_query('''
-        INSERT INTO accounts (nick, status, price)
-        VALUES (?, ?, ?);
-        ''', (nick, status, price))
-        
-    def update_account_status(self, nick: str, status: str) -> None:
+
+    @abstractmethod
+    def update_account_status(self, nick: str, status: str) -> Optional[Future]:
         """
-        Updates the status of an existing account.
+        Updates the status of an existing account, clearing its reservation deadline.
 
         :param nick: The nickname of the account.
         :param status: The new status for the account.
+        :return: A future resolved once the write is committed, or None if it already is.
         """
-        self._execute_query('''
-        UPDATE accounts
-        SET status = ?
-        WHERE LOWER(nick) = LOWER(?);
-        ''', (status, nick))
-        
-    def link_discord_channel(self, nick: str, channel_id: int) -> None:
+
+    @abstractmethod
+    def link_discord_channel(self, nick: str, channel_id: int) -> Optional[Future]:
         """
         Links a Discord channel to an account.
 
         :param nick: The nickname of the account.
         :param channel_id: The ID of the Discord channel to link.
+        :return: A future resolved once the write is committed, or None if it already is.
         """
-        self._execute_query('''
-        UPDATE accounts
-        SET discord_channel_id = ?
-        WHERE LOWER(nick) = LOWER(?);
-        ''', (channel_id, nick))
-        
-    def set_buyer(self, nick: str, buyer: str) -> None:
+
+    @abstractmethod
+    def set_buyer(self, nick: str, buyer: str) -> Optional[Future]:
         """
         Sets the buyer of an account.
 
         :param nick: The nickname of the account.
         :param buyer: The buyer's name.
+        :return: A future resolved once the write is committed, or None if it already is.
         """
-        self._execute_query('''
-        UPDATE accounts
-        SET sold_to = ?
-        WHERE LOWER(nick) = LOWER(?);
-        ''', (buyer, nick))
-        
-    def set_inactive_reason(self, nick: str, reason: str) -> None:
+
+    @abstractmethod
+    def set_inactive_reason(self, nick: str, reason: str) -> Optional[Future]:
         """
         Sets the reason for an account's inactivity.
 
         :param nick: The nickname of the account.
         :param reason: The reason for inactivity.
+        :return: A future resolved once the write is committed, or None if it already is.
         """
-        self._execute_query('''
-        UPDATE accounts
-        SET reason_inactive = ?
-        WHERE LOWER(nick) = LOWER(?);
-        ''', (reason, nick))
-        
+
+    @abstractmethod
     def account_exists(self, nick: str) -> bool:
         """
         Checks if an account with the given nick already exists in the database, ignoring case.
@@ -169,43 +134,27 @@ class Database:
         :param nick: The nickname of the account to check.
         :return: True if the account exists, otherwise False.
         """
-        query: str = 'SELECT COUNT(*) FROM accounts WHERE LOWER(nick) = LOWER(?);'
-        result: list = self._fetch_data(query, (nick,))
-        return result[0][0] > 0
 
-    def remove_account(self, nick: str) -> None:
+    @abstractmethod
+    def remove_account(self, nick: str) -> Optional[Future]:
         """
         Removes an account by its nick.
 
         :param nick: The nickname of the account to remove.
+        :return: A future resolved once the write is committed, or None if it already is.
         """
-        self._execute_query('''
-        DELETE FROM accounts
-        WHERE LOWER(nick) = LOWER(?);
-        ''', (nick,))
-        logger.info(f'Account with nick "{nick}" removed successfully.')
-    
+
+    @abstractmethod
     def get_account(self, nick: str) -> User:
         """
         Fetches an account by its nick.
 
         :param nick: The nickname of the account to fetch.
         :return: A User object representing the account.
+        :raises IndexError: If the account does not exist.
         """
-        query: str = 'SELECT id, nick, status, price, sold_to, reason_inactive, discord_channel_id, created_at FROM accounts WHERE LOWER(nick) = LOWER(?)'
-        user_data: list = self._fetch_data(query, (nick,))
-        user: User = User(
-            id=user_data[0][0],
-            nick=user_data[0][1],
-            status=user_data[0][2],
-            price=user_data[0][3],
-            buyer=user_data[0][4],
-            reason_inactive=user_data[0][5],
-            discord_channel_id=user_data[0][6],
-            created_at=user_data[0][7]
-        )
-        return user
-    
+
+    @abstractmethod
     def get_accounts(self, status: Optional[str] = None) -> list:
         """
         Lists accounts filtered by status and returns a list of User objects.
@@ -213,34 +162,288 @@ class Database:
         :param status: The status to filter accounts by (optional).
         :return: A list of User objects representing the accounts.
         """
-        query: str = 'SELECT id, nick, status, price, sold_to, reason_inactive, discord_channel_id, created_at FROM accounts'
-
-        if status:
-            query += ' WHERE status = ?'
-
-        user_data_list: list = self._fetch_data(query, (status,) if status else ())
-
-        users: list = []
-        for user_data in user_data_list:
-            user: User = User(
-                id=user_data[0],
-                nick=user_data[1],
-                status=user_data[2],
-                price=user_data[3],
-                buyer=user_data[4],
-                reason_inactive=user_data[5],
-                discord_channel_id=user_data[6],
-                created_at=user_data[7]
-            )
-            users.append(user)
-        
-        return users
-
-    def _close(self) -> None:
-        """Closes the database connection."""
-        try:
-            self.conn.close()
-            logger.info('Database connection closed successfully.')
-
-        except sqlite3.Error as e:
-            logger.error(f'Failed to close database connection: {e}')
+
+    @abstractmethod
+    def iter_accounts(
+        self,
+        status: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        nicks: Optional[list[str]] = None,
+        chunk_size: int = 500
+    ) -> Iterator[User]:
+        """
+        Streams accounts from the database without materializing the whole table.
+
+        :param status: The status to filter accounts by (optional).
+        :param created_after: Only include accounts created on or after this date, 'YYYY-MM-DD' (optional).
+        :param created_before: Only include accounts created before this date, 'YYYY-MM-DD' (optional).
+        :param min_price: Only include accounts with at least this price (optional).
+        :param max_price: Only include accounts with at most this price (optional).
+        :param nicks: Only include these accounts, ignoring case (optional).
+        :param chunk_size: The number of rows fetched per round trip.
+        :return: An iterator of User objects ordered by id.
+        """
+
+    @abstractmethod
+    def bulk_update(
+        self,
+        changes: list[tuple[str, Optional[str], Optional[int]]],
+        actor_id: Optional[int],
+        reason: Optional[str] = None,
+        reserved_until: Optional[int] = None
+    ) -> int:
+        """
+        Changes the status and/or price of many accounts in a single transaction.
+
+        An account event is recorded for every change in the same transaction, so the history
+        never disagrees with the accounts table. A status change replaces the reservation deadline:
+        accounts set to RESERVED get reserved_until, any other status clears it.
+
+        :param changes: (nick, new status or None to keep it, new price or None to keep it) tuples.
+        :param actor_id: The Discord id of the user who made the change.
+        :param reason: The inactivity reason, stored on the accounts set to INACTIVE (optional).
+        :param reserved_until: The reservation deadline of the accounts set to RESERVED, epoch seconds (optional).
+        :return: The number of updated accounts, 0 if the transaction failed.
+        """
+
+    @abstractmethod
+    def record_event(
+        self,
+        nick: str,
+        actor_id: Optional[int],
+        old_status: Optional[str],
+        new_status: Optional[str],
+        details: Optional[str] = None
+    ) -> Optional[Future]:
+        """
+        Appends a state change of an account to its event history.
+
+        The account id and current price are copied from the account, so this must be
+        called while the account still exists.
+
+        :param nick: The nickname of the account.
+        :param actor_id: The Discord id of the user who made the change.
+        :param old_status: The status before the change, None for new accounts.
+        :param new_status: The status after the change, None for removed accounts.
+        :param details: Extra information such as the buyer or the inactivity reason (optional).
+        :return: A future resolved once the write is committed, or None if it already is.
+        """
+
+    @abstractmethod
+    def get_account_events(self, nick: str, limit: int = 25) -> list[AccountEvent]:
+        """
+        Fetches the most recent events of an account, newest first.
+
+        :param nick: The nickname of the account.
+        :param limit: The maximum number of events to return.
+        :return: A list of AccountEvent objects.
+        """
+
+    @abstractmethod
+    def get_events(self, start: int, end: int, limit: int = 25) -> list[AccountEvent]:
+        """
+        Fetches the events of the whole shop in a time range, newest first.
+
+        :param start: The lower bound as epoch seconds (inclusive).
+        :param end: The upper bound as epoch seconds (exclusive).
+        :param limit: The maximum number of events to return.
+        :return: A list of AccountEvent objects.
+        """
+
+    @abstractmethod
+    def compact_events(self, before: int) -> int:
+        """
+        Moves the events older than the given time to the archive.
+
+        :param before: Events created before this epoch time are archived.
+        :return: The number of archived events.
+        """
+
+    @abstractmethod
+    def set_reservation(self, nick: str, expires_at: Optional[int]) -> Optional[Future]:
+        """
+        Sets when the reservation of an account expires. Call it after setting the RESERVED status,
+        which clears the deadline.
+
+        :param nick: The nickname of the account.
+        :param expires_at: The deadline as epoch seconds, None for a reservation that never expires.
+        :return: A future resolved once the write is committed, or None if it already is.
+        """
+
+    @abstractmethod
+    def get_reservations(self) -> list[tuple[str, int]]:
+        """
+        Fetches the reserved accounts that have a deadline, soonest first.
+
+        :return: (nick, expires_at) tuples.
+        """
+
+    @abstractmethod
+    def expire_reservation(self, nick: str, expires_at: int) -> bool:
+        """
+        Returns an account to FOR SALE if it is still reserved with this deadline, recording the event
+        in the same transaction.
+
+        The deadline acts as a version: an account released, sold or reserved again meanwhile is left
+        untouched, so an expiry fired twice or after a change is a no-op.
+
+        :param nick: The nickname of the account.
+        :param expires_at: The deadline the expiry was scheduled for.
+        :return: True if the account was returned to sale.
+        """
+
+    @abstractmethod
+    def add_watch(
+        self,
+        user_id: int,
+        status: str,
+        nick: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        locale: Optional[str] = None
+    ) -> Optional[Future]:
+        """
+        Subscribes a user to the accounts changing to a status.
+
+        :param user_id: The Discord id of the subscriber.
+        :param status: Notify when an account changes to this status.
+        :param nick: Only for this account, ignoring case (optional).
+        :param min_price: Only for accounts with at least this price (optional).
+        :param max_price: Only for accounts with at most this price (optional).
+        :param locale: The locale of the subscriber, for the notifications (optional).
+        :return: A future resolved once the write is committed, or None if it already is.
+        """
+
+    @abstractmethod
+    def remove_watch(self, user_id: int, watch_id: int) -> Optional[Future]:
+        """
+        Removes a subscription of a user.
+
+        :param user_id: The Discord id of the subscriber, so users can only remove their own.
+        :param watch_id: The id of the subscription.
+        :return: A future resolved once the write is committed, or None if it already is.
+        """
+
+    @abstractmethod
+    def get_watches(self, user_id: int) -> list[Watch]:
+        """
+        Fetches the subscriptions of a user, oldest first.
+
+        :param user_id: The Discord id of the subscriber.
+        :return: A list of Watch objects.
+        """
+
+    @abstractmethod
+    def match_watches(self, nick: str, status: str, price: Optional[int]) -> list[Watch]:
+        """
+        Fetches the subscriptions matching an account change, through an index rather than a scan.
+
+        :param nick: The nickname of the account.
+        :param status: The new status of the account.
+        :param price: The price of the account.
+        :return: A list of Watch objects, ordered by id.
+        """
+
+    def vacuum(self, pages: Optional[int] = None) -> int:
+        """
+        Returns the space left by deleted rows to the filesystem, for backends that need it.
+
+        :param pages: The maximum number of pages to free, None for all of them.
+        :return: The number of freed pages, 0 if the backend has nothing to do.
+        """
+        return 0
+
+    def data_version(self) -> Optional[int]:
+        """
+        Gets a number that changes whenever an account is added, changed or removed, also across restarts.
+
+        Caches built from the accounts are saved with it and only reused while it is unchanged.
+
+        :return: The version, None if the backend cannot tell (such caches are then never reused).
+        """
+        return None
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Flushes pending writes and releases the resources shared by every instance of the backend."""
+
+    @staticmethod
+    def _to_event(row: tuple) -> AccountEvent:
+        """
+        Builds an AccountEvent object from an account_events row.
+
+        :param row: The row, in the EVENT_COLUMNS order.
+        :return: An AccountEvent object representing the event.
+        """
+        return AccountEvent(*row)
+
+    @staticmethod
+    def _to_watch(row: tuple) -> Watch:
+        """
+        Builds a Watch object from a watchlists row.
+
+        The '' nick and 0 min_price stored for "any" (so they can be part of the index) are mapped back to None.
+
+        :param row: The row, in the WATCH_COLUMNS order.
+        :return: A Watch object representing the subscription.
+        """
+        return Watch(
+            id=row[0],
+            user_id=row[1],
+            status=AccountStatus(row[2]),
+            nick=row[3] or None,
+            min_price=row[4] or None,
+            max_price=row[5],
+            locale=row[6],
+            created_at=row[7]
+        )
+
+    @staticmethod
+    def _to_user(row: tuple) -> User:
+        """
+        Builds a User object from an accounts row.
+
+        The status string is swapped for the shared AccountStatus member, so rows don't each keep a copy.
+
+        :param row: The row, in the ACCOUNT_COLUMNS order.
+        :return: A User object representing the account.
+        """
+        return User(
+            id=row[0],
+            nick=row[1],
+            status=AccountStatus(row[2]),
+            price=row[3],
+            buyer=row[4],
+            reason_inactive=row[5],
+            discord_channel_id=row[6],
+            created_at=row[7]
+        )
+
+
+class AsyncDatabase:
+    """
+    Awaitable view of the storage interface, for code running on the bot's event loop.
+
+    AsyncDatabase() wraps the backend selected with DB_BACKEND and exposes every method of Database as a
+    coroutine function: await AsyncDatabase().get_account(nick=nick). How a call is awaited is up to the
+    backend (see Database.run_async). Streaming methods such as iter_accounts are not wrapped, they are
+    consumed from a worker thread with the blocking interface.
+    """
+
+    def __init__(self, backend: Optional[type[Database]] = None) -> None:
+        self.backend: type[Database] = backend or Database.backend()
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[Any]]:
+        function: Callable[..., Any] = getattr(self.backend, name)
+
+        if name.startswith('_') or not callable(function) or inspect.isgeneratorfunction(function):
+            raise AttributeError(f'{name} has no awaitable version')
+
+        @functools.wraps(function)
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            return await self.backend.run_async(function, *args, **kwargs)
+
+        return method
@@ -0,0 +1,355 @@
+import dataclasses
+import threading
+import time
+from typing import Optional, Iterator, Callable, Any
+
+from loguru import logger
+
+from ..models import User, AccountEvent, Watch
+from ..constants import AccountStatus
+from .database import Database
+
+
+class MemoryDatabase(Database):
+    """
+    Volatile backend keeping every table in process memory, for tests and benchmarks.
+
+    The tables are class attributes, so every MemoryDatabase() instance sees the same data until
+    reset() is called. Accounts are frozen, so they are returned as stored and replaced on every change;
+    events are copied out.
+    """
+    _lock: threading.RLock = threading.RLock()
+    _accounts: dict[int, User] = {}
+    _events: list[AccountEvent] = []
+    _archive: list[AccountEvent] = []
+    _reservations: dict[int, int] = {}  # Account id -> reservation deadline, User has no field for it
+    _watches: dict[tuple[AccountStatus, str], dict[int, Watch]] = {}  # (status, nick or '') -> id -> watch, like idx_watchlists_match
+    _ids: dict[str, int] = {'accounts': 0, 'events': 0, 'watches': 0}
+
+    @classmethod
+    async def run_async(cls, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return function(cls(), *args, **kwargs)  # Nothing blocks, a worker thread would only add latency
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drops every account, reservation, event and watch."""
+        with cls._lock:
+            cls._accounts.clear()
+            cls._events.clear()
+            cls._archive.clear()
+            cls._reservations.clear()
+            cls._watches.clear()
+            cls._ids.update(accounts=0, events=0, watches=0)
+
+    def _next_id(self, table: str) -> int:
+        """
+        Allocates the next id of a table, like an AUTOINCREMENT column.
+
+        :param table: 'accounts', 'events' or 'watches'.
+        :return: The new id.
+        """
+        self._ids[table] += 1
+        return self._ids[table]
+
+    def _matching(self, nick: str) -> list[User]:
+        """
+        Gets the stored accounts with the given nick, ignoring case.
+
+        :param nick: The nickname of the account.
+        :return: The stored (not copied) User objects.
+        """
+        nick = nick.lower()
+        return [account for account in self._accounts.values() if account.nick.lower() == nick]
+
+    def _update(self, nick: str, **fields) -> None:
+        """
+        Sets fields on every account with the given nick.
+
+        :param nick: The nickname of the account.
+        :param fields: The User fields to set.
+        """
+        with self._lock:
+            for account in self._matching(nick):
+                self._accounts[account.id] = dataclasses.replace(account, **fields)
+
+                if 'status' in fields:
+                    self._reservations.pop(account.id, None)
+
+    def add_account(self, nick: str, price: int = None) -> None:
+        with self._lock:
+            account_id: int = self._next_id('accounts')
+            self._accounts[account_id] = User(
+                id=account_id,
+                nick=nick,
+                status=AccountStatus.SALE,
+                price=price,
+                buyer=None,
+                reason_inactive=None,
+                discord_channel_id=None,
+                created_at=time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
+            )
+
+    def update_account_status(self, nick: str, status: str) -> None:
+        self._update(nick, status=AccountStatus(status))
+
+    def link_discord_channel(self, nick: str, channel_id: int) -> None:
+        self._update(nick, discord_channel_id=channel_id)
+
+    def set_buyer(self, nick: str, buyer: str) -> None:
+        self._update(nick, buyer=buyer)
+
+    def set_inactive_reason(self, nick: str, reason: str) -> None:
+        self._update(nick, reason_inactive=reason)
+
+    def account_exists(self, nick: str) -> bool:
+        with self._lock:
+            return bool(self._matching(nick))
+
+    def remove_account(self, nick: str) -> None:
+        with self._lock:
+            for account in self._matching(nick):
+                del self._accounts[account.id]
+                self._reservations.pop(account.id, None)
+
+        logger.info(f'Account with nick "{nick}" removed successfully.')
+
+    def get_account(self, nick: str) -> User:
+        with self._lock:
+            return self._matching(nick)[0]
+
+    def get_accounts(self, status: Optional[str] = None) -> list:
+        with self._lock:
+            return [account for account in self._accounts.values() if not status or account.status == status]
+
+    def iter_accounts(
+        self,
+        status: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        nicks: Optional[list[str]] = None,
+        chunk_size: int = 500
+    ) -> Iterator[User]:
+        lowered: Optional[set[str]] = {nick.lower() for nick in nicks} if nicks is not None else None
+        conditions: list[Callable[[User], bool]] = []
+
+        if status:
+            conditions.append(lambda account: account.status == status)
+
+        if created_after:
+            conditions.append(lambda account: account.created_at >= created_after)
+
+        if created_before:
+            conditions.append(lambda account: account.created_at < created_before)
+
+        if min_price is not None:
+            conditions.append(lambda account: account.price is not None and account.price >= min_price)
+
+        if max_price is not None:
+            conditions.append(lambda account: account.price is not None and account.price <= max_price)
+
+        if lowered is not None:
+            conditions.append(lambda account: account.nick.lower() in lowered)
+
+        with self._lock:
+            account_ids: list[int] = list(self._accounts)  # Insertion order is id order
+
+        for offset in range(0, len(account_ids), chunk_size):
+            # Filter one chunk at a time, so the lock is never held while the caller consumes the rows
+            with self._lock:
+                chunk: list[User] = [
+                    self._accounts[account_id]
+                    for account_id in account_ids[offset:offset + chunk_size]
+                    if account_id in self._accounts and all(condition(self._accounts[account_id]) for condition in conditions)
+                ]
+
+            yield from chunk
+
+    def bulk_update(
+        self,
+        changes: list[tuple[str, Optional[str], Optional[int]]],
+        actor_id: Optional[int],
+        reason: Optional[str] = None,
+        reserved_until: Optional[int] = None
+    ) -> int:
+        now: int = int(time.time())
+        updated: int = 0
+
+        with self._lock:
+            for nick, status, price in changes:
+                for account in self._matching(nick):
+                    new_status: AccountStatus = AccountStatus(status) if status is not None else account.status
+                    new_price: int = price if price is not None else account.price
+                    self._events.append(AccountEvent(
+                        id=self._next_id('events'),
+                        account_id=account.id,
+                        nick=account.nick,
+                        actor_id=actor_id,
+                        old_status=account.status,
+                        new_status=new_status,
+                        price=new_price,
+                        details=reason or 'bulk',
+                        created_at=now
+                    ))
+                    self._accounts[account.id] = dataclasses.replace(
+                        account,
+                        status=new_status,
+                        price=new_price,
+                        reason_inactive=reason if status == AccountStatus.INACTIVE and reason is not None else account.reason_inactive
+                    )
+                    updated += 1
+
+                    if status == AccountStatus.RESERVED and reserved_until is not None:
+                        self._reservations[account.id] = reserved_until
+
+                    elif status is not None:
+                        self._reservations.pop(account.id, None)
+
+        return updated
+
+    def record_event(
+        self,
+        nick: str,
+        actor_id: Optional[int],
+        old_status: Optional[str],
+        new_status: Optional[str],
+        details: Optional[str] = None
+    ) -> None:
+        now: int = int(time.time())
+
+        with self._lock:
+            for account in self._matching(nick):
+                self._events.append(AccountEvent(
+                    id=self._next_id('events'),
+                    account_id=account.id,
+                    nick=account.nick,
+                    actor_id=actor_id,
+                    old_status=old_status,
+                    new_status=new_status,
+                    price=account.price,
+                    details=details,
+                    created_at=now
+                ))
+
+    def get_account_events(self, nick: str, limit: int = 25) -> list[AccountEvent]:
+        nick = nick.lower()
+
+        with self._lock:
+            return self._newest([event for event in self._events if event.nick.lower() == nick], limit)
+
+    def get_events(self, start: int, end: int, limit: int = 25) -> list[AccountEvent]:
+        with self._lock:
+            return self._newest([event for event in self._events if start <= event.created_at < end], limit)
+
+    def compact_events(self, before: int) -> int:
+        with self._lock:
+            old: list[AccountEvent] = [event for event in self._events if event.created_at < before]
+            self._archive.extend(old)
+            self._events[:] = [event for event in self._events if event.created_at >= before]
+            return len(old)
+
+    def set_reservation(self, nick: str, expires_at: Optional[int]) -> None:
+        with self._lock:
+            for account in self._matching(nick):
+                if expires_at is None:
+                    self._reservations.pop(account.id, None)
+                else:
+                    self._reservations[account.id] = expires_at
+
+    def get_reservations(self) -> list[tuple[str, int]]:
+        with self._lock:
+            return sorted(
+                (
+                    (self._accounts[account_id].nick, expires_at) for account_id, expires_at in self._reservations.items()
+                    if self._accounts[account_id].status == AccountStatus.RESERVED
+                ),
+                key=lambda reservation: reservation[1]
+            )
+
+    def expire_reservation(self, nick: str, expires_at: int) -> bool:
+        with self._lock:
+            accounts: list[User] = [
+                account for account in self._matching(nick)
+                if account.status == AccountStatus.RESERVED and self._reservations.get(account.id) == expires_at
+            ]
+
+            for account in accounts:
+                self._events.append(AccountEvent(
+                    id=self._next_id('events'),
+                    account_id=account.id,
+                    nick=account.nick,
+                    actor_id=None,
+                    old_status=AccountStatus.RESERVED,
+                    new_status=AccountStatus.SALE,
+                    price=account.price,
+                    details='expired',
+                    created_at=int(time.time())
+                ))
+                self._accounts[account.id] = dataclasses.replace(account, status=AccountStatus.SALE)
+                del self._reservations[account.id]
+
+            return bool(accounts)
+
+    def add_watch(
+        self,
+        user_id: int,
+        status: str,
+        nick: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        locale: Optional[str] = None
+    ) -> None:
+        with self._lock:
+            watch: Watch = Watch(
+                id=self._next_id('watches'),
+                user_id=user_id,
+                status=AccountStatus(status),
+                nick=nick.lower() if nick else None,
+                min_price=min_price or None,
+                max_price=max_price,
+                locale=locale,
+                created_at=int(time.time())
+            )
+            self._watches.setdefault((watch.status, watch.nick or ''), {})[watch.id] = watch
+
+    def remove_watch(self, user_id: int, watch_id: int) -> None:
+        with self._lock:
+            for key, watches in self._watches.items():
+                if watch_id in watches and watches[watch_id].user_id == user_id:
+                    del watches[watch_id]
+
+                    if not watches:
+                        del self._watches[key]
+
+                    return
+
+    def get_watches(self, user_id: int) -> list[Watch]:
+        with self._lock:
+            return sorted(
+                (watch for watches in self._watches.values() for watch in watches.values() if watch.user_id == user_id),
+                key=lambda watch: watch.id
+            )
+
+    def match_watches(self, nick: str, status: str, price: Optional[int]) -> list[Watch]:
+        status = AccountStatus(status)
+
+        with self._lock:
+            candidates: list[Watch] = [
+                *self._watches.get((status, ''), {}).values(),
+                *self._watches.get((status, nick.lower()), {}).values()
+            ]
+
+        return sorted((watch for watch in candidates if watch.matches(nick, status, price)), key=lambda watch: watch.id)
+
+    @staticmethod
+    def _newest(events: list[AccountEvent], limit: int) -> list[AccountEvent]:
+        """
+        Sorts events newest first and copies the first ones.
+
+        :param events: The stored events.
+        :param limit: The maximum number of events to return.
+        :return: The copied events.
+        """
+        events = sorted(events, key=lambda event: (event.created_at, event.id), reverse=True)[:limit]
+        return [dataclasses.replace(event) for event in events]
@@ -0,0 +1,488 @@
+import asyncio
+import functools
+import sys
+import threading
+import time
+from typing import Optional, Iterator, Any, Coroutine, Callable
+
+from loguru import logger
+
+from ..models import User, AccountEvent, Watch
+from ..constants import BotConstants, AccountStatus
+from .database import Database
+
+try:
+    import asyncpg
+
+except ImportError:
+    asyncpg = None
+
+
+def _blocking(coroutine_function: Callable[..., Coroutine]) -> Callable[..., Any]:
+    """
+    Exposes a coroutine method of the backend with the blocking interface of Database.
+
+    The coroutine function is kept as the `coroutine` attribute of the method, run_async awaits it directly.
+
+    :param coroutine_function: The async implementation of the method.
+    :return: The blocking method.
+    """
+    @functools.wraps(coroutine_function)
+    def method(self: 'PostgresDatabase', *args: Any, **kwargs: Any) -> Any:
+        return self._run(coroutine_function(self, *args, **kwargs))
+
+    method.coroutine = coroutine_function
+    return method
+
+
+class PostgresDatabase(Database):
+    """
+    PostgreSQL backend, so several bot processes can share the same accounts.
+
+    Queries run on an asyncpg connection pool owned by a private event loop in a daemon thread. The methods
+    are coroutines on that loop. Through AsyncDatabase the bot's event loop awaits them without blocking any
+    thread; the blocking interface of Database submits them to the loop and waits for the result.
+    """
+    # Same layout as SQLiteDatabase: status as an account_statuses code, created_at as epoch seconds
+    SCHEMA: str = '''
+    CREATE TABLE IF NOT EXISTS account_statuses (
+        code INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+    );
+    CREATE TABLE IF NOT EXISTS accounts (
+        id BIGSERIAL PRIMARY KEY,
+        nick TEXT NOT NULL,
+        status INTEGER NOT NULL REFERENCES account_statuses (code),
+        price INTEGER,
+        sold_to TEXT,
+        reason_inactive TEXT,
+        discord_channel_id BIGINT,
+        created_at BIGINT NOT NULL DEFAULT EXTRACT(EPOCH FROM now())::bigint
+    );
+    CREATE INDEX IF NOT EXISTS idx_accounts_nick ON accounts (LOWER(nick));
+    CREATE INDEX IF NOT EXISTS idx_accounts_created_at ON accounts (created_at);
+    ALTER TABLE accounts ADD COLUMN IF NOT EXISTS reserved_until BIGINT;
+    CREATE INDEX IF NOT EXISTS idx_accounts_reserved_until ON accounts (reserved_until) WHERE reserved_until IS NOT NULL;
+    CREATE TABLE IF NOT EXISTS account_events (
+        id BIGSERIAL PRIMARY KEY,
+        account_id BIGINT,
+        nick TEXT NOT NULL,
+        actor_id BIGINT,
+        old_status TEXT,
+        new_status TEXT,
+        price INTEGER,
+        details TEXT,
+        created_at BIGINT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS account_events_archive (LIKE account_events);
+    CREATE INDEX IF NOT EXISTS idx_account_events_nick_time ON account_events (LOWER(nick), created_at);
+    CREATE INDEX IF NOT EXISTS idx_account_events_time ON account_events (created_at);
+    CREATE TABLE IF NOT EXISTS watchlists (
+        id BIGSERIAL PRIMARY KEY,
+        user_id BIGINT NOT NULL,
+        status INTEGER NOT NULL REFERENCES account_statuses (code),
+        nick TEXT NOT NULL DEFAULT '',
+        min_price INTEGER NOT NULL DEFAULT 0,
+        max_price INTEGER,
+        locale TEXT,
+        created_at BIGINT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_watchlists_match ON watchlists (status, nick, min_price);
+    CREATE INDEX IF NOT EXISTS idx_watchlists_user ON watchlists (user_id);
+    '''
+    # Status codes are mapped back to AccountStatus in _to_user, created_at is rendered as before
+    ACCOUNT_COLUMNS: str = (
+        "id, nick, status, price, sold_to, reason_inactive, discord_channel_id, "
+        "to_char(to_timestamp(created_at) AT TIME ZONE 'UTC', 'YYYY-MM-DD HH24:MI:SS')"
+    )
+    SCHEMA_LOCK: int = 0x6D636163  # pg_advisory_xact_lock key, so concurrent processes create the schema once
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _pool: Optional['asyncpg.Pool'] = None
+    _init_lock: threading.Lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self._ensure_pool()
+
+    @classmethod
+    def _ensure_pool(cls) -> None:
+        """Starts the event loop thread and the connection pool on first use, and creates the tables."""
+        with cls._init_lock:
+            if cls._pool is not None:
+                return
+
+            if asyncpg is None:
+                logger.critical('The postgres database backend requires asyncpg. Install the requirements with "pip install -r requirements.txt".')
+                sys.exit(1)
+
+            if not BotConstants.DATABASE_URL:
+                logger.critical('No DATABASE_URL found. Please set it in the .env file to use the postgres backend.')
+                sys.exit(1)
+
+            loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='postgres-loop', daemon=True).start()
+
+            try:
+                cls._pool = asyncio.run_coroutine_threadsafe(cls._create_pool(), loop).result()
+
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.critical(f'Failed to connect to the database: {e}')
+                loop.call_soon_threadsafe(loop.stop)
+                sys.exit(1)
+
+            cls._loop = loop
+
+    @classmethod
+    async def _create_pool(cls) -> 'asyncpg.Pool':
+        """
+        Opens the connection pool and creates the tables if they don't exist.
+
+        :return: The connection pool.
+        """
+        pool: asyncpg.Pool = await asyncpg.create_pool(
+            dsn=BotConstants.DATABASE_URL,
+            min_size=BotConstants.DB_POOL_MIN_SIZE,
+            max_size=BotConstants.DB_POOL_MAX_SIZE
+        )
+
+        async with pool.acquire() as conn, conn.transaction():
+            await conn.execute('SELECT pg_advisory_xact_lock($1);', cls.SCHEMA_LOCK)
+            await conn.execute(cls.SCHEMA)
+            await conn.executemany(
+                'INSERT INTO account_statuses (code, name) VALUES ($1, $2) ON CONFLICT DO NOTHING;',
+                [(status.code, status.value) for status in AccountStatus]
+            )
+
+        return pool
+
+    @classmethod
+    def shutdown(cls) -> None:
+        with cls._init_lock:
+            if cls._pool is None:
+                return
+
+            loop: asyncio.AbstractEventLoop = cls._loop
+            asyncio.run_coroutine_threadsafe(cls._pool.close(), loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            cls._pool = cls._loop = None
+
+    @classmethod
+    async def run_async(cls, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        coroutine_function: Optional[Callable[..., Coroutine]] = getattr(function, 'coroutine', None)
+
+        if coroutine_function is None:
+            return await super().run_async(function, *args, **kwargs)
+
+        database: PostgresDatabase = cls()
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coroutine_function(database, *args, **kwargs), cls._loop))
+
+    def _run(self, coro: Coroutine) -> Any:
+        """
+        Runs a coroutine on the pool's event loop and waits for its result.
+
+        :param coro: The coroutine.
+        :return: The result of the coroutine.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _execute_query(self, query: str, *args: Any) -> str:
+        """
+        Executes an insert, update or delete query on the database.
+
+        :param query: The SQL query to execute, with $n placeholders.
+        :param args: The parameters for the query.
+        :return: The command status, e.g. 'UPDATE 2', or an empty string if the query failed.
+        """
+        try:
+            return await self._pool.execute(query, *args)
+
+        except (OSError, asyncpg.PostgresError) as e:
+            logger.error(f'Error executing query: {e}')
+            return ''
+
+    async def _fetch_data(self, query: str, *args: Any) -> list:
+        """
+        Fetches data from the database.
+
+        :param query: The SQL query to fetch data, with $n placeholders.
+        :param args: The parameters for the query.
+        :return: A list of records containing the fetched data.
+        """
+        try:
+            return await self._pool.fetch(query, *args)
+
+        except (OSError, asyncpg.PostgresError) as e:
+            logger.error(f'Error fetching data: {e}')
+            return []
+
+    @staticmethod
+    def _count(status: str) -> int:
+        """
+        Gets the number of affected rows from a command status such as 'INSERT 0 3'.
+
+        :param status: The command status.
+        :return: The number of rows, 0 if the status is empty.
+        """
+        return int(status.split()[-1]) if status else 0
+
+    @_blocking
+    async def add_account(self, nick: str, price: int = None) -> None:
+        await self._execute_query('INSERT INTO accounts (nick, status, price) VALUES ($1, $2, $3);', nick, AccountStatus.SALE.code, price)
+
+    @_blocking
+    async def update_account_status(self, nick: str, status: str) -> None:
+        await self._execute_query('UPDATE accounts SET status = $1, reserved_until = NULL WHERE LOWER(nick) = LOWER($2);', AccountStatus(status).code, nick)
+
+    @_blocking
+    async def link_discord_channel(self, nick: str, channel_id: int) -> None:
+        await self._execute_query('UPDATE accounts SET discord_channel_id = $1 WHERE LOWER(nick) = LOWER($2);', channel_id, nick)
+
+    @_blocking
+    async def set_buyer(self, nick: str, buyer: str) -> None:
+        await self._execute_query('UPDATE accounts SET sold_to = $1 WHERE LOWER(nick) = LOWER($2);', buyer, nick)
+
+    @_blocking
+    async def set_inactive_reason(self, nick: str, reason: str) -> None:
+        await self._execute_query('UPDATE accounts SET reason_inactive = $1 WHERE LOWER(nick) = LOWER($2);', reason, nick)
+
+    @_blocking
+    async def account_exists(self, nick: str) -> bool:
+        result: list = await self._fetch_data('SELECT EXISTS (SELECT 1 FROM accounts WHERE LOWER(nick) = LOWER($1));', nick)
+        return bool(result and result[0][0])
+
+    @_blocking
+    async def remove_account(self, nick: str) -> None:
+        await self._execute_query('DELETE FROM accounts WHERE LOWER(nick) = LOWER($1);', nick)
+        logger.info(f'Account with nick "{nick}" removed successfully.')
+
+    @_blocking
+    async def get_account(self, nick: str) -> User:
+        user_data: list = await self._fetch_data(f'SELECT {self.ACCOUNT_COLUMNS} FROM accounts WHERE LOWER(nick) = LOWER($1) ORDER BY id;', nick)
+        return self._to_user(user_data[0])
+
+    @_blocking
+    async def get_accounts(self, status: Optional[str] = None) -> list:
+        if status:
+            user_data_list: list = await self._fetch_data(f'SELECT {self.ACCOUNT_COLUMNS} FROM accounts WHERE status = $1 ORDER BY id;', AccountStatus(status).code)
+
+        else:
+            user_data_list = await self._fetch_data(f'SELECT {self.ACCOUNT_COLUMNS} FROM accounts ORDER BY id;')
+
+        return [self._to_user(user_data) for user_data in user_data_list]
+
+    def iter_accounts(
+        self,
+        status: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        nicks: Optional[list[str]] = None,
+        chunk_size: int = 500
+    ) -> Iterator[User]:
+        conditions: list[str] = ['id > $1']
+        params: list = [0]
+
+        def add(condition: str, value: Any) -> None:
+            params.append(value)
+            conditions.append(condition.replace('$?', f'${len(params)}'))
+
+        if status:
+            add('status = $?', AccountStatus(status).code)
+
+        if created_after:
+            add("created_at >= EXTRACT(EPOCH FROM to_date($?, 'YYYY-MM-DD'))::bigint", created_after)
+
+        if created_before:
+            add("created_at < EXTRACT(EPOCH FROM to_date($?, 'YYYY-MM-DD'))::bigint", created_before)
+
+        if min_price is not None:
+            add('price >= $?', min_price)
+
+        if max_price is not None:
+            add('price <= $?', max_price)
+
+        if nicks is not None:
+            add('LOWER(nick) = ANY($?::text[])', [nick.lower() for nick in nicks])
+
+        # Keyset pagination: no connection or cursor is held while the caller consumes a chunk
+        query: str = f'''
+        SELECT {self.ACCOUNT_COLUMNS} FROM accounts
+        WHERE {' AND '.join(conditions)}
+        ORDER BY id
+        LIMIT {int(chunk_size)}
+        '''
+
+        while True:
+            rows: list = self._run(self._pool.fetch(query, *params))  # Raises, a partial result must not pass for the whole table
+
+            for row in rows:
+                yield self._to_user(row)
+
+            if len(rows) < chunk_size:
+                return
+
+            params[0] = rows[-1][0]
+
+    @_blocking
+    async def bulk_update(
+        self,
+        changes: list[tuple[str, Optional[str], Optional[int]]],
+        actor_id: Optional[int],
+        reason: Optional[str] = None,
+        reserved_until: Optional[int] = None
+    ) -> int:
+        nicks: list[str] = [nick for nick, _, _ in changes]
+        statuses: list[Optional[str]] = [str(status) if status is not None else None for _, status, _ in changes]
+        codes: list[Optional[int]] = [AccountStatus(status).code if status is not None else None for status in statuses]
+        prices: list[Optional[int]] = [price for _, _, price in changes]
+        reasons: list[Optional[str]] = [reason if status == AccountStatus.INACTIVE else None for status in statuses]
+
+        async def apply() -> str:
+            async with self._pool.acquire() as conn, conn.transaction():
+                await conn.execute('''
+                INSERT INTO account_events (account_id, nick, actor_id, old_status, new_status, price, details, created_at)
+                SELECT a.id, a.nick, $1::bigint, s.name, COALESCE(c.status, s.name), COALESCE(c.price, a.price), $2::text, $3::bigint
+                FROM accounts a
+                JOIN account_statuses s ON s.code = a.status
+                JOIN unnest($4::text[], $5::text[], $6::int[]) AS c(nick, status, price) ON LOWER(a.nick) = LOWER(c.nick);
+                ''', actor_id, reason or 'bulk', int(time.time()), nicks, statuses, prices)
+                return await conn.execute('''
+                UPDATE accounts a
+                SET status = COALESCE(c.status, a.status),
+                    price = COALESCE(c.price, a.price),
+                    reason_inactive = COALESCE(c.reason, a.reason_inactive),
+                    reserved_until = CASE WHEN c.status IS NULL THEN a.reserved_until WHEN c.status = $5 THEN $6::bigint END
+                FROM unnest($1::text[], $2::int[], $3::int[], $4::text[]) AS c(nick, status, price, reason)
+                WHERE LOWER(a.nick) = LOWER(c.nick);
+                ''', nicks, codes, prices, reasons, AccountStatus.RESERVED.code, reserved_until)
+
+        try:
+            return self._count(await apply())
+
+        except (OSError, asyncpg.PostgresError) as e:
+            logger.error(f'Error applying bulk update: {e}')
+            return 0
+
+    @_blocking
+    async def record_event(
+        self,
+        nick: str,
+        actor_id: Optional[int],
+        old_status: Optional[str],
+        new_status: Optional[str],
+        details: Optional[str] = None
+    ) -> None:
+        await self._execute_query('''
+        INSERT INTO account_events (account_id, nick, actor_id, old_status, new_status, price, details, created_at)
+        SELECT id, nick, $1::bigint, $2::text, $3::text, price, $4::text, $5::bigint
+        FROM accounts
+        WHERE LOWER(nick) = LOWER($6);
+        ''', actor_id, old_status, new_status, details, int(time.time()), nick)
+
+    @_blocking
+    async def get_account_events(self, nick: str, limit: int = 25) -> list[AccountEvent]:
+        query: str = f'''
+        SELECT {self.EVENT_COLUMNS} FROM account_events
+        WHERE LOWER(nick) = LOWER($1)
+        ORDER BY created_at DESC, id DESC
+        LIMIT $2
+        '''
+        return [self._to_event(row) for row in await self._fetch_data(query, nick, limit)]
+
+    @_blocking
+    async def get_events(self, start: int, end: int, limit: int = 25) -> list[AccountEvent]:
+        query: str = f'''
+        SELECT {self.EVENT_COLUMNS} FROM account_events
+        WHERE created_at >= $1 AND created_at < $2
+        ORDER BY created_at DESC, id DESC
+        LIMIT $3
+        '''
+        return [self._to_event(row) for row in await self._fetch_data(query, start, end, limit)]
+
+    @_blocking
+    async def compact_events(self, before: int) -> int:
+        return self._count(await self._execute_query(f'''
+        WITH moved AS (
+            DELETE FROM account_events WHERE created_at < $1 RETURNING {self.EVENT_COLUMNS}
+        )
+        INSERT INTO account_events_archive ({self.EVENT_COLUMNS})
+        SELECT {self.EVENT_COLUMNS} FROM moved;
+        ''', before))
+
+    @_blocking
+    async def set_reservation(self, nick: str, expires_at: Optional[int]) -> None:
+        await self._execute_query('UPDATE accounts SET reserved_until = $1 WHERE LOWER(nick) = LOWER($2);', expires_at, nick)
+
+    @_blocking
+    async def get_reservations(self) -> list[tuple[str, int]]:
+        query: str = '''
+        SELECT nick, reserved_until FROM accounts
+        WHERE reserved_until IS NOT NULL AND status = $1
+        ORDER BY reserved_until
+        '''
+        return [(row[0], row[1]) for row in await self._fetch_data(query, AccountStatus.RESERVED.code)]
+
+    @_blocking
+    async def expire_reservation(self, nick: str, expires_at: int) -> bool:
+        return self._count(await self._execute_query('''
+        WITH expired AS (
+            UPDATE accounts SET status = $1, reserved_until = NULL
+            WHERE LOWER(nick) = LOWER($2) AND status = $3 AND reserved_until = $4
+            RETURNING id, nick, price
+        )
+        INSERT INTO account_events (account_id, nick, actor_id, old_status, new_status, price, details, created_at)
+        SELECT id, nick, NULL, $5::text, $6::text, price, 'expired', $7::bigint FROM expired;
+        ''', AccountStatus.SALE.code, nick, AccountStatus.RESERVED.code, expires_at, AccountStatus.RESERVED.value, AccountStatus.SALE.value, int(time.time()))) > 0
+
+    @_blocking
+    async def add_watch(
+        self,
+        user_id: int,
+        status: str,
+        nick: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        locale: Optional[str] = None
+    ) -> None:
+        await self._execute_query('''
+        INSERT INTO watchlists (user_id, status, nick, min_price, max_price, locale, created_at)
+        VALUES ($1, $2, $3, $4, $5, $6, $7);
+        ''', user_id, AccountStatus(status).code, (nick or '').lower(), min_price or 0, max_price, locale, int(time.time()))
+
+    @_blocking
+    async def remove_watch(self, user_id: int, watch_id: int) -> None:
+        await self._execute_query('DELETE FROM watchlists WHERE id = $1 AND user_id = $2;', watch_id, user_id)
+
+    @_blocking
+    async def get_watches(self, user_id: int) -> list[Watch]:
+        rows: list = await self._fetch_data(f'SELECT {self.WATCH_COLUMNS} FROM watchlists WHERE user_id = $1 ORDER BY id;', user_id)
+        return [self._to_watch(row) for row in rows]
+
+    @_blocking
+    async def match_watches(self, nick: str, status: str, price: Optional[int]) -> list[Watch]:
+        query: str = f'''
+        SELECT {self.WATCH_COLUMNS} FROM watchlists
+        WHERE status = $1 AND nick IN ('', $2) AND min_price <= $3 AND (max_price IS NULL OR max_price >= $3)
+        ORDER BY id
+        '''
+        return [self._to_watch(row) for row in await self._fetch_data(query, AccountStatus(status).code, nick.lower(), price or 0)]
+
+    @staticmethod
+    def _to_watch(row: tuple) -> Watch:
+        """
+        Builds a Watch object from a watchlists row, whose status is stored as a code.
+
+        :param row: The row, in the WATCH_COLUMNS order.
+        :return: A Watch object representing the subscription.
+        """
+        return Database._to_watch((*row[:2], AccountStatus.from_code(row[2]), *row[3:]))
+
+    @staticmethod
+    def _to_user(row: tuple) -> User:
+        """
+        Builds a User object from an accounts row, whose status is stored as a code.
+
+        :param row: The row, in the ACCOUNT_COLUMNS order.
+        :return: A User object representing the account.
+        """
+        return Database._to_user((*row[:2], AccountStatus.from_code(row[2]), *row[3:]))
@@ -0,0 +1,265 @@
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Optional
+
+from loguru import logger
+
+
+@dataclass
+class QueryStats:
+    sql: str  # Normalized statement
+    count: int = 0
+    total: float = 0.0  # Seconds, execution and fetching
+    max: float = 0.0
+    slow: int = 0  # Executions over the slow query threshold
+    plan: Optional[list[str]] = None  # EXPLAIN QUERY PLAN details, None if the statement has no plan
+    full_scan: bool = False
+
+
+class QueryProfiler:
+    SORT_KEYS: tuple[str, ...] = ('total', 'max', 'count')
+    _WHITESPACE: re.Pattern = re.compile(r'\s+')
+    _STRING: re.Pattern = re.compile(r"'(?:[^']|'')*'")
+    _NUMBER: re.Pattern = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])')
+    _IN_LIST: re.Pattern = re.compile(r'\bIN \((?:\s*\?\s*,)*\s*\?\s*\)', re.IGNORECASE)
+
+    def __init__(self, slow_threshold: float = 0.1) -> None:
+        """
+        Times the SQLite statements and aggregates them by normalized SQL text.
+
+        Literals are replaced with ? and IN lists collapsed, so the same query with other values is
+        counted once. The first execution of each statement is explained with EXPLAIN QUERY PLAN; plans
+        scanning a whole table without an index (e.g. the LOWER(nick) filters) are flagged. Executions
+        slower than `slow_threshold` are logged with their plan.
+
+        :param slow_threshold: The seconds above which a statement is logged as slow.
+        """
+        self.slow_threshold: float = slow_threshold
+        self.queries: dict[str, QueryStats] = {}
+        self.since: float = time.time()
+        self._lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def normalize(cls, sql: str) -> str:
+        """
+        Normalizes a statement, so executions with other values share their stats.
+
+        :param sql: The SQL statement.
+        :return: The statement with collapsed whitespace, ? for literals and IN (...) for lists.
+        """
+        sql = cls._WHITESPACE.sub(' ', sql).strip().rstrip(';').strip()
+        sql = cls._STRING.sub('?', sql)
+        sql = cls._NUMBER.sub('?', sql)
+        return cls._IN_LIST.sub('IN (...)', sql)
+
+    def cursor(self, conn: sqlite3.Connection) -> 'ProfiledCursor':
+        """
+        Opens a cursor whose statements are recorded by this profiler.
+
+        :param conn: The connection.
+        :return: The profiled cursor.
+        """
+        return ProfiledCursor(self, conn)
+
+    def record(self, conn: sqlite3.Connection, sql: str, params: Any, elapsed: float) -> None:
+        """
+        Records one execution of a statement.
+
+        :param conn: The connection that ran it, used to explain the statement the first time.
+        :param sql: The SQL statement.
+        :param params: The parameters it ran with.
+        :param elapsed: The seconds spent executing it and fetching its rows.
+        """
+        key: str = self.normalize(sql)
+
+        with self._lock:
+            stats: Optional[QueryStats] = self.queries.get(key)
+            explain: bool = stats is None
+
+            if stats is None:
+                stats = self.queries[key] = QueryStats(sql=key)
+
+            stats.count += 1
+            stats.total += elapsed
+            stats.max = max(stats.max, elapsed)
+            slow: bool = elapsed >= self.slow_threshold
+
+            if slow:
+                stats.slow += 1
+
+        if explain:
+            plan: Optional[list[str]] = self._explain(conn, sql, params)
+
+            with self._lock:
+                stats.plan = plan
+                stats.full_scan = any(self.is_full_scan(detail) for detail in plan or [])
+
+        if slow:
+            plan_text: str = '\n'.join(f'  {detail}' for detail in stats.plan or []) or '  (no plan)'
+            logger.warning(
+                f'Slow query ({elapsed * 1000:.0f} ms{", full table scan" if stats.full_scan else ""}): {key}\n{plan_text}'
+            )
+
+    @staticmethod
+    def is_full_scan(detail: str) -> bool:
+        """
+        Tells whether a plan step reads a whole table.
+
+        :param detail: The detail column of an EXPLAIN QUERY PLAN row.
+        :return: True for 'SCAN accounts', False for 'SEARCH ...' or a scan of a covering index.
+        """
+        return detail.startswith('SCAN ') and 'INDEX' not in detail and 'CONSTANT ROW' not in detail
+
+    @staticmethod
+    def _explain(conn: sqlite3.Connection, sql: str, params: Any) -> Optional[list[str]]:
+        """
+        Gets the query plan of a statement.
+
+        :param conn: The connection to explain it with.
+        :param sql: The SQL statement.
+        :param params: The parameters it ran with.
+        :return: The detail of each plan step, None if the statement cannot be explained (e.g. BEGIN).
+        """
+        try:
+            rows: list[tuple] = conn.execute(f'EXPLAIN QUERY PLAN {sql}', params if params is not None else ()).fetchall()
+
+        except sqlite3.Error:
+            return None
+
+        return [row[3] for row in rows] or None
+
+    def top(self, limit: int = 10, key: str = 'total') -> list[QueryStats]:
+        """
+        Gets the statements that cost the most.
+
+        :param limit: The number of statements.
+        :param key: The ordering, one of SORT_KEYS.
+        :return: The statements, most expensive first.
+        """
+        with self._lock:
+            return sorted(self.queries.values(), key=lambda stats: getattr(stats, key), reverse=True)[:limit]
+
+    def totals(self) -> tuple[int, float]:
+        """
+        Gets the executions and seconds recorded across every statement.
+
+        :return: (executions, seconds).
+        """
+        with self._lock:
+            return sum(stats.count for stats in self.queries.values()), sum(stats.total for stats in self.queries.values())
+
+    def reset(self) -> None:
+        """Forgets every recorded statement."""
+        with self._lock:
+            self.queries.clear()
+            self.since = time.time()
+
+    def dump(self) -> dict:
+        """
+        Gets the aggregates as JSON serializable data, to keep them across restarts.
+
+        :return: The data.
+        """
+        with self._lock:
+            return {'since': self.since, 'queries': [asdict(stats) for stats in self.queries.values()]}
+
+    def load(self, data: dict) -> None:
+        """
+        Adds saved aggregates to the current ones.
+
+        :param data: The data returned by dump.
+        """
+        with self._lock:
+            self.since = min(self.since, data['since'])
+
+            for saved in data['queries']:
+                saved = QueryStats(**saved)
+                stats: Optional[QueryStats] = self.queries.get(saved.sql)
+
+                if stats is None:
+                    self.queries[saved.sql] = saved
+                    continue
+
+                stats.count += saved.count
+                stats.total += saved.total
+                stats.max = max(stats.max, saved.max)
+                stats.slow += saved.slow
+
+
+class ProfiledCursor:
+    def __init__(self, profiler: QueryProfiler, conn: sqlite3.Connection) -> None:
+        """
+        Cursor wrapper timing each statement, from execute until the next statement or close.
+
+        The time spent fetching the rows is added to the statement that produced them: SQLite runs
+        most of a SELECT while its rows are stepped through, not in execute.
+
+        :param profiler: The profiler recording the statements.
+        :param conn: The connection to open the cursor on.
+        """
+        self._profiler: QueryProfiler = profiler
+        self._conn: sqlite3.Connection = conn
+        self._cursor: sqlite3.Cursor = conn.cursor()
+        self._statement: Optional[tuple[str, Any]] = None
+        self._elapsed: float = 0.0
+
+    def _timed(self, method: str, *args: Any) -> Any:
+        """
+        Calls a method of the wrapped cursor, adding its duration to the current statement.
+
+        :param method: The method name.
+        :param args: Its arguments.
+        :return: What it returned.
+        """
+        started: float = time.perf_counter()
+
+        try:
+            return getattr(self._cursor, method)(*args)
+
+        finally:
+            self._elapsed += time.perf_counter() - started
+
+    def _flush(self) -> None:
+        """Records the current statement."""
+        if self._statement is not None:
+            sql, params = self._statement
+            self._statement = None
+            self._profiler.record(self._conn, sql, params, self._elapsed)
+
+    def execute(self, sql: str, params: Any = ()) -> 'ProfiledCursor':
+        self._flush()
+        self._statement, self._elapsed = (sql, params), 0.0
+        self._timed('execute', sql, params)
+        return self
+
+    def executemany(self, sql: str, seq_of_params: Any) -> 'ProfiledCursor':
+        self._flush()
+        seq_of_params = list(seq_of_params)
+        self._statement, self._elapsed = (sql, seq_of_params[0] if seq_of_params else None), 0.0
+        self._timed('executemany', sql, seq_of_params)
+        return self
+
+    def fetchone(self) -> Any:
+        return self._timed('fetchone')
+
+    def fetchmany(self, size: int = 1) -> list:
+        return self._timed('fetchmany', size)
+
+    def fetchall(self) -> list:
+        return self._timed('fetchall')
+
+    def __iter__(self) -> 'ProfiledCursor':
+        return self
+
+    def __next__(self) -> Any:
+        return self._timed('__next__')
+
+    def close(self) -> None:
+        self._flush()
+        self._cursor.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)  # rowcount, lastrowid, description...
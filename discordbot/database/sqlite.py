@@ -0,0 +1,940 @@
+import pathlib
+import queue
+import sqlite3
+import sys
+import os
+import threading
+import time
+
+from typing import Optional, Iterator
+from contextlib import contextmanager
+from concurrent.futures import Future
+
+from loguru import logger
+
+from ..models import User, AccountEvent, Watch
+from ..constants import BotConstants, AccountStatus
+from .database import Database
+from .writer import WriteBehindQueue
+from .profiler import QueryProfiler
+
+
+class SQLiteDatabase(Database):
+    """
+    Single file SQLite backend, optionally with write-behind group commits.
+
+    The database runs in WAL mode. Every instance shares one writer connection, serialized by a lock,
+    and a pool of read-only connections, so reads see a consistent snapshot and never wait for writes.
+    """
+    PATH: str = f'db/{BotConstants.DB_FILENAME}'
+    SCHEMA_VERSION: int = 1  # 1: status as an account_statuses code, created_at as epoch seconds
+    AUTO_VACUUM_INCREMENTAL: int = 2
+    # Status codes are mapped back to AccountStatus in _to_user, created_at is rendered as before
+    ACCOUNT_COLUMNS: str = "id, nick, status, price, sold_to, reason_inactive, discord_channel_id, datetime(created_at, 'unixepoch')"
+    READ_POOL_SIZE: int = BotConstants.DB_READ_POOL_SIZE
+    writer: Optional[WriteBehindQueue] = None
+    profiler: Optional[QueryProfiler] = None  # Set by enable_profiler, times every statement of the cursors
+    _write_conn: Optional[sqlite3.Connection] = None
+    _write_lock: threading.RLock = threading.RLock()
+    _readers: Optional[queue.LifoQueue] = None
+    _opened: Optional[str] = None  # Absolute path the shared connections point to
+    _init_lock: threading.Lock = threading.Lock()
+
+    def __init__(self) -> None:
+        with SQLiteDatabase._init_lock:
+            if SQLiteDatabase._opened != os.path.abspath(self.PATH):
+                self._connect()
+
+    def _connect(self) -> None:
+        """Opens the shared writer connection, prepares the schema and fills the reader pool."""
+        SQLiteDatabase._close_connections()
+        os.makedirs(os.path.dirname(self.PATH) or '.', exist_ok=True)
+
+        try:
+            SQLiteDatabase._write_conn = sqlite3.connect(self.PATH, check_same_thread=False)
+
+        except sqlite3.Error as e:
+            logger.critical(f'Failed to connect to the database: {e}')
+            sys.exit(1)
+
+        self._create_table()
+        SQLiteDatabase._readers = queue.LifoQueue(maxsize=self.READ_POOL_SIZE)
+
+        for _ in range(self.READ_POOL_SIZE):
+            SQLiteDatabase._readers.put_nowait(self._open_reader())
+
+        SQLiteDatabase._opened = os.path.abspath(self.PATH)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """
+        Opens a read-only connection to the database.
+
+        :return: The connection.
+        """
+        return sqlite3.connect(f'{pathlib.Path(self.PATH).resolve().as_uri()}?mode=ro', uri=True, check_same_thread=False)
+
+    @classmethod
+    def _close_connections(cls) -> None:
+        """Closes the shared writer connection and the reader pool."""
+        connections: list[sqlite3.Connection] = []
+
+        while cls._readers is not None and not cls._readers.empty():
+            connections.append(cls._readers.get_nowait())
+
+        with cls._write_lock:
+            if cls._write_conn is not None:
+                connections.append(cls._write_conn)  # Closed last, so it checkpoints the WAL into the database file
+
+            for conn in connections:
+                try:
+                    conn.close()
+
+                except sqlite3.Error as e:
+                    logger.error(f'Failed to close database connection: {e}')
+
+            cls._write_conn, cls._readers, cls._opened = None, None, None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The shared writer connection. Use it through _get_cursor, which holds the write lock."""
+        return SQLiteDatabase._write_conn
+
+    @contextmanager
+    def _get_cursor(self):
+        """Context manager for a cursor of the writer connection, held exclusively until it exits."""
+        cursor: Optional[sqlite3.Cursor] = None
+
+        with self._write_lock:
+            try:
+                cursor = self._cursor(self.conn)
+                yield cursor
+
+            except sqlite3.Error as e:
+                logger.error(f'Database error: {e}')
+                self.conn.rollback()
+                raise
+
+            finally:
+                if cursor:
+                    cursor.close()
+
+    @contextmanager
+    def _read_cursor(self):
+        """Context manager for a cursor of a pooled read-only connection."""
+        try:
+            conn: sqlite3.Connection = self._readers.get_nowait()
+
+        except queue.Empty:
+            conn = self._open_reader()  # Pool exhausted, e.g. by long exports: open an extra one
+
+        cursor: sqlite3.Cursor = self._cursor(conn)
+
+        try:
+            yield cursor
+
+        except sqlite3.Error as e:
+            logger.error(f'Database error: {e}')
+            raise
+
+        finally:
+            cursor.close()
+
+            try:
+                self._readers.put_nowait(conn)
+
+            except (queue.Full, AttributeError):
+                conn.close()  # Extra connection, or the pool was closed meanwhile
+
+    def _cursor(self, conn: sqlite3.Connection) -> sqlite3.Cursor:
+        """
+        Opens a cursor, recorded by the query profiler when it is enabled.
+
+        :param conn: The connection.
+        :return: The cursor.
+        """
+        return conn.cursor() if self.profiler is None else self.profiler.cursor(conn)
+
+    def _create_table(self) -> None:
+        """Creates the tables if they don't exist and migrates a database written by an older version."""
+        try:
+            if self._schema_version() < self.SCHEMA_VERSION and self._table_exists('accounts'):
+                self._migrate_compact()
+
+            if self._auto_vacuum() != self.AUTO_VACUUM_INCREMENTAL:
+                # Only applies to a new file or after a VACUUM, so existing databases are rebuilt once
+                self.conn.execute('PRAGMA auto_vacuum = INCREMENTAL;')
+                self.conn.execute('VACUUM;')
+
+            self.conn.execute('PRAGMA journal_mode = WAL;')  # Persistent, readers never block the writer
+
+            with self._get_cursor() as cursor:
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS account_statuses (
+                    code INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL UNIQUE
+                );
+                ''')
+                cursor.executemany(
+                    'INSERT OR IGNORE INTO account_statuses (code, name) VALUES (?, ?);',
+                    [(status.code, status.value) for status in AccountStatus]
+                )
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS accounts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nick TEXT NOT NULL,
+                    status INTEGER NOT NULL REFERENCES account_statuses (code),
+                    price INTEGER,
+                    sold_to TEXT,
+                    reason_inactive TEXT,
+                    discord_channel_id INTEGER,
+                    created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                    reserved_until INTEGER
+                );
+                ''')
+
+                if 'reserved_until' not in [column[1] for column in cursor.execute('PRAGMA table_info(accounts);').fetchall()]:
+                    cursor.execute('ALTER TABLE accounts ADD COLUMN reserved_until INTEGER;')
+
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_accounts_created_at ON accounts (created_at);')
+                # Partial, only the reservations with a deadline are indexed
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_accounts_reserved_until ON accounts (reserved_until) WHERE reserved_until IS NOT NULL;')
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS data_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    version INTEGER NOT NULL
+                );
+                ''')
+                cursor.execute('INSERT OR IGNORE INTO data_version (id, version) VALUES (1, 0);')
+
+                for operation in ('INSERT', 'UPDATE', 'DELETE'):
+                    # Bumped in the same transaction as the change, so a version always matches one state of the accounts
+                    cursor.execute(f'''
+                    CREATE TRIGGER IF NOT EXISTS accounts_{operation.lower()}_version AFTER {operation} ON accounts
+                    BEGIN
+                        UPDATE data_version SET version = version + 1 WHERE id = 1;
+                    END;
+                    ''')
+
+                for table in ('account_events', 'account_events_archive'):
+                    cursor.execute(f'''
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        account_id INTEGER,
+                        nick TEXT NOT NULL,
+                        actor_id INTEGER,
+                        old_status TEXT,
+                        new_status TEXT,
+                        price INTEGER,
+                        details TEXT,
+                        created_at INTEGER NOT NULL
+                    );
+                    ''')
+
+                # By the nick stored on the event, so the history of a removed account is still found
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_account_events_nick_time ON account_events (LOWER(nick), created_at);')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_account_events_time ON account_events (created_at);')
+                cursor.execute('''
+                CREATE TABLE IF NOT EXISTS watchlists (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    status INTEGER NOT NULL REFERENCES account_statuses (code),
+                    nick TEXT NOT NULL DEFAULT '',
+                    min_price INTEGER NOT NULL DEFAULT 0,
+                    max_price INTEGER,
+                    locale TEXT,
+                    created_at INTEGER NOT NULL
+                );
+                ''')
+                # '' (any nick) and 0 (no minimum) instead of NULL, so a change is matched with two index range scans
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_watchlists_match ON watchlists (status, nick, min_price);')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_watchlists_user ON watchlists (user_id);')
+                cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION};')
+                self.conn.commit()
+
+        except sqlite3.Error as e:
+            logger.critical(f'Failed to create table: {e}')
+            sys.exit(1)
+
+    def _schema_version(self) -> int:
+        """
+        Gets the layout version stored in the database header.
+
+        :return: The version, 0 for databases created before versioning.
+        """
+        return self.conn.execute('PRAGMA user_version;').fetchone()[0]
+
+    def _auto_vacuum(self) -> int:
+        """
+        Gets the auto_vacuum mode of the database.
+
+        :return: 0 (none), 1 (full) or 2 (incremental).
+        """
+        return self.conn.execute('PRAGMA auto_vacuum;').fetchone()[0]
+
+    def _table_exists(self, table: str) -> bool:
+        """
+        Checks if a table exists.
+
+        :param table: The table name.
+        :return: True if the table exists, otherwise False.
+        """
+        return self.conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?;", (table,)).fetchone() is not None
+
+    def _migrate_compact(self) -> None:
+        """
+        Rewrites a version 0 accounts table (status as text, created_at as a DATETIME string) in the compact layout.
+
+        Runs in a single transaction, keeping the account ids (and so the event history links) and the
+        AUTOINCREMENT counter. Statuses unknown to AccountStatus abort the migration instead of being lost.
+        """
+        known: list[str] = [status.value for status in AccountStatus]
+        unknown: list = self.conn.execute(
+            f'SELECT DISTINCT status FROM accounts WHERE status NOT IN ({", ".join("?" for _ in known)});', known
+        ).fetchall()
+
+        if unknown:
+            logger.critical(f'Cannot migrate the accounts table, unknown statuses: {", ".join(str(row[0]) for row in unknown)}')
+            sys.exit(1)
+
+        accounts: int = self.conn.execute('SELECT COUNT(*) FROM accounts;').fetchone()[0]
+        logger.info(f'Migrating {accounts} accounts to the compact storage format...')
+
+        with self._get_cursor() as cursor:
+            cursor.execute('BEGIN;')
+            sequence: Optional[tuple] = cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'accounts';").fetchone()
+            cursor.execute('''
+            CREATE TABLE accounts_compact (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                nick TEXT NOT NULL,
+                status INTEGER NOT NULL REFERENCES account_statuses (code),
+                price INTEGER,
+                sold_to TEXT,
+                reason_inactive TEXT,
+                discord_channel_id INTEGER,
+                created_at INTEGER NOT NULL DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+                reserved_until INTEGER
+            );
+            ''')
+            cursor.execute(f'''
+            INSERT INTO accounts_compact (id, nick, status, price, sold_to, reason_inactive, discord_channel_id, created_at)
+            SELECT id, nick,
+                CASE status {" ".join(f"WHEN ? THEN {status.code}" for status in AccountStatus)} END,
+                price, sold_to, reason_inactive, discord_channel_id,
+                COALESCE(CAST(strftime('%s', created_at) AS INTEGER), CAST(strftime('%s', 'now') AS INTEGER))
+            FROM accounts;
+            ''', known)
+            cursor.execute('DROP TABLE accounts;')
+            cursor.execute('ALTER TABLE accounts_compact RENAME TO accounts;')
+
+            if sequence is not None:
+                cursor.execute("UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'accounts';", sequence)
+
+            cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION};')
+            self.conn.commit()
+
+        logger.info('Accounts migrated to the compact storage format.')
+
+    @classmethod
+    def enable_profiler(cls, slow_threshold: float) -> QueryProfiler:
+        """
+        Enables the query profiler: every statement run through a cursor is timed and aggregated.
+
+        :param slow_threshold: The seconds above which a statement is logged as slow, with its plan.
+        :return: The profiler.
+        """
+        if cls.profiler is None:
+            cls.profiler = QueryProfiler(slow_threshold=slow_threshold)
+
+            if cls.writer is not None:
+                cls.writer.profiler = cls.profiler
+
+            logger.info(f'Database query profiler enabled (slow queries over {slow_threshold * 1000:.0f} ms are logged).')
+
+        return cls.profiler
+
+    @classmethod
+    def start_write_behind(cls, window: float, max_batch: int) -> WriteBehindQueue:
+        """
+        Enables write-behind mode: writes are queued to a single writer thread and group-committed.
+
+        :param window: The maximum time in seconds a batch waits for more writes.
+        :param max_batch: The maximum number of writes committed in one transaction.
+        :return: The started writer.
+        """
+        if cls.writer is None:
+            cls.writer = WriteBehindQueue(cls.PATH, window=window, max_batch=max_batch, lock=cls._write_lock, profiler=cls.profiler)
+            cls.writer.start()
+            logger.info(f'Database write-behind enabled ({window * 1000:.0f} ms window, {max_batch} statements per batch).')
+
+        return cls.writer
+
+    @classmethod
+    def stop_write_behind(cls) -> None:
+        """Flushes the pending writes and goes back to committing every statement directly."""
+        if cls.writer is not None:
+            writer: WriteBehindQueue = cls.writer
+            cls.writer = None
+            writer.close()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        cls.stop_write_behind()
+        cls._close_connections()
+        logger.info('Database connections closed successfully.')
+
+    def _wait_for_writes(self) -> None:
+        """Read barrier: waits until the queued writes are committed so reads see them."""
+        if SQLiteDatabase.writer is not None and SQLiteDatabase.writer.pending:
+            SQLiteDatabase.writer.flush()
+
+    def _execute_query(self, query: str, params: tuple = ()) -> Optional[Future]:
+        """
+        Executes an insert or update query on the database.
+
+        In write-behind mode the query is queued for the next group commit instead.
+
+        :param query: The SQL query to execute.
+        :param params: The parameters for the query, default is an empty tuple.
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        if SQLiteDatabase.writer is not None:
+            return SQLiteDatabase.writer.submit(query, params)
+
+        try:
+            with self._get_cursor() as cursor:
+                cursor.execute(query, params)
+                self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f'Error executing query: {e}')
+
+    def _fetch_data(self, query: str, params: tuple = ()) -> list:
+        """
+        Fetches data from the database.
+
+        :param query: The SQL query to fetch data.
+        :param params: The parameters for the query, default is an empty tuple.
+        :return: A list of tuples containing the fetched data.
+        """
+        self._wait_for_writes()
+
+        try:
+            with self._read_cursor() as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
+        except sqlite3.Error as e:
+            logger.error(f'Error fetching data: {e}')
+            return []
+        
+    def add_account(self, nick: str, price: int = None) -> Optional[Future]:
+        """
+        Adds a new account with 'FOR SALE' as the default status and prevents other statuses.
+
+        :param nick: The nickname of the account.
+        :param price: The price of the account, default is None.
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        return self._execute_query('''
+        INSERT INTO accounts (nick, status, price)
+        VALUES (?, ?, ?);
+        ''', (nick, AccountStatus.SALE.code, price))
+        
+    def update_account_status(self, nick: str, status: str) -> Optional[Future]:
+        """
+        Updates the status of an existing account, clearing its reservation deadline.
+
+        :param nick: The nickname of the account.
+        :param status: The new status for the account.
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        return self._execute_query('''
+        UPDATE accounts
+        SET status = ?, reserved_until = NULL
+        WHERE LOWER(nick) = LOWER(?);
+        ''', (AccountStatus(status).code, nick))
+        
+    def link_discord_channel(self, nick: str, channel_id: int) -> Optional[Future]:
+        """
+        Links a Discord channel to an account.
+
+        :param nick: The nickname of the account.
+        :param channel_id: The ID of the Discord channel to link.
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        return self._execute_query('''
+        UPDATE accounts
+        SET discord_channel_id = ?
+        WHERE LOWER(nick) = LOWER(?);
+        ''', (channel_id, nick))
+        
+    def set_buyer(self, nick: str, buyer: str) -> Optional[Future]:
+        """
+        Sets the buyer of an account.
+
+        :param nick: The nickname of the account.
+        :param buyer: The buyer's name.
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        return self._execute_query('''
+        UPDATE accounts
+        SET sold_to = ?
+        WHERE LOWER(nick) = LOWER(?);
+        ''', (buyer, nick))
+        
+    def set_inactive_reason(self, nick: str, reason: str) -> Optional[Future]:
+        """
+        Sets the reason for an account's inactivity.
+
+        :param nick: The nickname of the account.
+        :param reason: The reason for inactivity.
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        return self._execute_query('''
+        UPDATE accounts
+        SET reason_inactive = ?
+        WHERE LOWER(nick) = LOWER(?);
+        ''', (reason, nick))
+        
+    def account_exists(self, nick: str) -> bool:
+        """
+        Checks if an account with the given nick already exists in the database, ignoring case.
+
+        :param nick: The nickname of the account to check.
+        :return: True if the account exists, otherwise False.
+        """
+        query: str = 'SELECT COUNT(*) FROM accounts WHERE LOWER(nick) = LOWER(?);'
+        result: list = self._fetch_data(query, (nick,))
+        return result[0][0] > 0
+
+    def remove_account(self, nick: str) -> Optional[Future]:
+        """
+        Removes an account by its nick.
+
+        :param nick: The nickname of the account to remove.
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        future: Optional[Future] = self._execute_query('''
+        DELETE FROM accounts
+        WHERE LOWER(nick) = LOWER(?);
+        ''', (nick,))
+        logger.info(f'Account with nick "{nick}" removed successfully.')
+        return future
+    
+    def get_account(self, nick: str) -> User:
+        """
+        Fetches an account by its nick.
+
+        :param nick: The nickname of the account to fetch.
+        :return: A User object representing the account.
+        """
+        query: str = f'SELECT {self.ACCOUNT_COLUMNS} FROM accounts WHERE LOWER(nick) = LOWER(?)'
+        user_data: list = self._fetch_data(query, (nick,))
+        return self._to_user(user_data[0])
+    
+    def get_accounts(self, status: Optional[str] = None) -> list:
+        """
+        Lists accounts filtered by status and returns a list of User objects.
+
+        :param status: The status to filter accounts by (optional).
+        :return: A list of User objects representing the accounts.
+        """
+        query: str = f'SELECT {self.ACCOUNT_COLUMNS} FROM accounts'
+
+        if status:
+            query += ' WHERE status = ?'
+
+        user_data_list: list = self._fetch_data(query, (AccountStatus(status).code,) if status else ())
+        return [self._to_user(user_data) for user_data in user_data_list]
+
+    def iter_accounts(
+        self,
+        status: Optional[str] = None,
+        created_after: Optional[str] = None,
+        created_before: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        nicks: Optional[list[str]] = None,
+        chunk_size: int = 500
+    ) -> Iterator[User]:
+        """
+        Streams accounts from the database without materializing the whole table.
+
+        Rows are pulled with fetchmany in chunks of chunk_size, so memory usage stays
+        bounded regardless of the table size.
+
+        :param status: The status to filter accounts by (optional).
+        :param created_after: Only include accounts created on or after this date, 'YYYY-MM-DD' (optional).
+        :param created_before: Only include accounts created before this date, 'YYYY-MM-DD' (optional).
+        :param min_price: Only include accounts with at least this price (optional).
+        :param max_price: Only include accounts with at most this price (optional).
+        :param nicks: Only include these accounts, ignoring case (optional).
+        :param chunk_size: The number of rows fetched per round trip.
+        :return: An iterator of User objects ordered by id.
+        :raises sqlite3.Error: If reading fails, also midway, so a partial result is never taken for the whole table.
+        """
+        query: str = f'SELECT {self.ACCOUNT_COLUMNS} FROM accounts'
+        conditions: list[str] = []
+        params: list = []
+
+        if status:
+            conditions.append('status = ?')
+            params.append(AccountStatus(status).code)
+
+        if created_after:
+            conditions.append("created_at >= CAST(strftime('%s', ?) AS INTEGER)")
+            params.append(created_after)
+
+        if created_before:
+            conditions.append("created_at < CAST(strftime('%s', ?) AS INTEGER)")
+            params.append(created_before)
+
+        if min_price is not None:
+            conditions.append('price >= ?')
+            params.append(min_price)
+
+        if max_price is not None:
+            conditions.append('price <= ?')
+            params.append(max_price)
+
+        if nicks is not None:
+            conditions.append(f'LOWER(nick) IN ({", ".join("LOWER(?)" for _ in nicks)})')
+            params.extend(nicks)
+
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+
+        query += ' ORDER BY id'
+        self._wait_for_writes()
+
+        with self._read_cursor() as cursor:
+            cursor.execute(query, tuple(params))
+
+            while True:
+                rows: list = cursor.fetchmany(chunk_size)
+
+                if not rows:
+                    break
+
+                for row in rows:
+                    yield self._to_user(row)
+
+    def bulk_update(
+        self,
+        changes: list[tuple[str, Optional[str], Optional[int]]],
+        actor_id: Optional[int],
+        reason: Optional[str] = None,
+        reserved_until: Optional[int] = None
+    ) -> int:
+        """
+        Changes the status and/or price of many accounts in a single transaction.
+
+        An account event is recorded for every change in the same transaction, so the history
+        never disagrees with the accounts table. A status change replaces the reservation deadline:
+        accounts set to RESERVED get reserved_until, any other status clears it.
+
+        :param changes: (nick, new status or None to keep it, new price or None to keep it) tuples.
+        :param actor_id: The Discord id of the user who made the change.
+        :param reason: The inactivity reason, stored on the accounts set to INACTIVE (optional).
+        :param reserved_until: The reservation deadline of the accounts set to RESERVED, epoch seconds (optional).
+        :return: The number of updated accounts, 0 if the transaction failed.
+        """
+        now: int = int(time.time())
+        self._wait_for_writes()
+
+        try:
+            with self._get_cursor() as cursor:
+                cursor.executemany('''
+                INSERT INTO account_events (account_id, nick, actor_id, old_status, new_status, price, details, created_at)
+                SELECT a.id, a.nick, ?, s.name, COALESCE(?, s.name), COALESCE(?, a.price), ?, ?
+                FROM accounts a
+                JOIN account_statuses s ON s.code = a.status
+                WHERE LOWER(a.nick) = LOWER(?);
+                ''', [(actor_id, status, price, reason or 'bulk', now, nick) for nick, status, price in changes])
+                cursor.executemany('''
+                UPDATE accounts
+                SET status = COALESCE(?, status),
+                    price = COALESCE(?, price),
+                    reason_inactive = COALESCE(?, reason_inactive),
+                    reserved_until = CASE WHEN ? THEN ? ELSE reserved_until END
+                WHERE LOWER(nick) = LOWER(?);
+                ''', [
+                    (
+                        AccountStatus(status).code if status is not None else None,
+                        price,
+                        reason if status == AccountStatus.INACTIVE else None,
+                        status is not None,
+                        reserved_until if status == AccountStatus.RESERVED else None,
+                        nick
+                    )
+                    for nick, status, price in changes
+                ])
+                updated: int = cursor.rowcount
+                self.conn.commit()
+                return updated
+
+        except sqlite3.Error as e:
+            logger.error(f'Error applying bulk update: {e}')
+            return 0
+
+    def record_event(
+        self,
+        nick: str,
+        actor_id: Optional[int],
+        old_status: Optional[str],
+        new_status: Optional[str],
+        details: Optional[str] = None
+    ) -> Optional[Future]:
+        """
+        Appends a state change of an account to its event history.
+
+        The account id and current price are copied from the accounts table, so this must be
+        called while the account row still exists.
+
+        :param nick: The nickname of the account.
+        :param actor_id: The Discord id of the user who made the change.
+        :param old_status: The status before the change, None for new accounts.
+        :param new_status: The status after the change, None for removed accounts.
+        :param details: Extra information such as the buyer or the inactivity reason (optional).
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        return self._execute_query('''
+        INSERT INTO account_events (account_id, nick, actor_id, old_status, new_status, price, details, created_at)
+        SELECT id, nick, ?, ?, ?, price, ?, ?
+        FROM accounts
+        WHERE LOWER(nick) = LOWER(?);
+        ''', (actor_id, old_status, new_status, details, int(time.time()), nick))
+
+    def get_account_events(self, nick: str, limit: int = 25) -> list[AccountEvent]:
+        """
+        Fetches the most recent events of an account, newest first, including those of a removed account.
+
+        :param nick: The nickname of the account.
+        :param limit: The maximum number of events to return.
+        :return: A list of AccountEvent objects.
+        """
+        query: str = f'''
+        SELECT {self.EVENT_COLUMNS} FROM account_events
+        WHERE LOWER(nick) = LOWER(?)
+        ORDER BY created_at DESC, id DESC
+        LIMIT ?
+        '''
+        return [self._to_event(row) for row in self._fetch_data(query, (nick, limit))]
+
+    def get_events(self, start: int, end: int, limit: int = 25) -> list[AccountEvent]:
+        """
+        Fetches the events of the whole shop in a time range, newest first.
+
+        :param start: The lower bound as epoch seconds (inclusive).
+        :param end: The upper bound as epoch seconds (exclusive).
+        :param limit: The maximum number of events to return.
+        :return: A list of AccountEvent objects.
+        """
+        query: str = f'''
+        SELECT {self.EVENT_COLUMNS} FROM account_events
+        WHERE created_at >= ? AND created_at < ?
+        ORDER BY created_at DESC, id DESC
+        LIMIT ?
+        '''
+        return [self._to_event(row) for row in self._fetch_data(query, (start, end, limit))]
+
+    def compact_events(self, before: int) -> int:
+        """
+        Moves the events older than the given time to the archive table.
+
+        Keeps the hot account_events table (and its indexes) small; the archive is append-only
+        and never read by the commands.
+
+        :param before: Events created before this epoch time are archived.
+        :return: The number of archived events.
+        """
+        self._wait_for_writes()
+
+        try:
+            with self._get_cursor() as cursor:
+                cursor.execute(f'''
+                INSERT INTO account_events_archive ({self.EVENT_COLUMNS})
+                SELECT {self.EVENT_COLUMNS} FROM account_events WHERE created_at < ?;
+                ''', (before,))
+                cursor.execute('DELETE FROM account_events WHERE created_at < ?;', (before,))
+                archived: int = cursor.rowcount
+                self.conn.commit()
+                return archived
+
+        except sqlite3.Error as e:
+            logger.error(f'Error compacting account events: {e}')
+            return 0
+
+    def set_reservation(self, nick: str, expires_at: Optional[int]) -> Optional[Future]:
+        """
+        Sets when the reservation of an account expires. Call it after setting the RESERVED status,
+        which clears the deadline.
+
+        :param nick: The nickname of the account.
+        :param expires_at: The deadline as epoch seconds, None for a reservation that never expires.
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        return self._execute_query('''
+        UPDATE accounts
+        SET reserved_until = ?
+        WHERE LOWER(nick) = LOWER(?);
+        ''', (expires_at, nick))
+
+    def get_reservations(self) -> list[tuple[str, int]]:
+        """
+        Fetches the reserved accounts that have a deadline, soonest first, through idx_accounts_reserved_until.
+
+        :return: (nick, expires_at) tuples.
+        """
+        query: str = '''
+        SELECT nick, reserved_until FROM accounts
+        WHERE reserved_until IS NOT NULL AND status = ?
+        ORDER BY reserved_until
+        '''
+        return [(nick, expires_at) for nick, expires_at in self._fetch_data(query, (AccountStatus.RESERVED.code,))]
+
+    def expire_reservation(self, nick: str, expires_at: int) -> bool:
+        """
+        Returns an account to FOR SALE if it is still reserved with this deadline, recording the event
+        in the same transaction.
+
+        :param nick: The nickname of the account.
+        :param expires_at: The deadline the expiry was scheduled for.
+        :return: True if the account was returned to sale.
+        """
+        self._wait_for_writes()
+
+        try:
+            with self._get_cursor() as cursor:
+                cursor.execute('''
+                UPDATE accounts
+                SET status = ?, reserved_until = NULL
+                WHERE LOWER(nick) = LOWER(?) AND status = ? AND reserved_until = ?;
+                ''', (AccountStatus.SALE.code, nick, AccountStatus.RESERVED.code, expires_at))
+
+                if cursor.rowcount == 0:
+                    return False
+
+                cursor.execute('''
+                INSERT INTO account_events (account_id, nick, actor_id, old_status, new_status, price, details, created_at)
+                SELECT id, nick, NULL, ?, ?, price, 'expired', ?
+                FROM accounts
+                WHERE LOWER(nick) = LOWER(?);
+                ''', (AccountStatus.RESERVED, AccountStatus.SALE, int(time.time()), nick))
+                self.conn.commit()
+                return True
+
+        except sqlite3.Error as e:
+            logger.error(f'Error expiring the reservation of {nick}: {e}')
+            return False
+
+    def add_watch(
+        self,
+        user_id: int,
+        status: str,
+        nick: Optional[str] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        locale: Optional[str] = None
+    ) -> Optional[Future]:
+        """
+        Subscribes a user to the accounts changing to a status.
+
+        :param user_id: The Discord id of the subscriber.
+        :param status: Notify when an account changes to this status.
+        :param nick: Only for this account, ignoring case (optional).
+        :param min_price: Only for accounts with at least this price (optional).
+        :param max_price: Only for accounts with at most this price (optional).
+        :param locale: The locale of the subscriber, for the notifications (optional).
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        return self._execute_query('''
+        INSERT INTO watchlists (user_id, status, nick, min_price, max_price, locale, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?);
+        ''', (user_id, AccountStatus(status).code, (nick or '').lower(), min_price or 0, max_price, locale, int(time.time())))
+
+    def remove_watch(self, user_id: int, watch_id: int) -> Optional[Future]:
+        """
+        Removes a subscription of a user.
+
+        :param user_id: The Discord id of the subscriber, so users can only remove their own.
+        :param watch_id: The id of the subscription.
+        :return: In write-behind mode, a future resolved once the write is committed, otherwise None.
+        """
+        return self._execute_query('DELETE FROM watchlists WHERE id = ? AND user_id = ?;', (watch_id, user_id))
+
+    def get_watches(self, user_id: int) -> list[Watch]:
+        """
+        Fetches the subscriptions of a user, oldest first.
+
+        :param user_id: The Discord id of the subscriber.
+        :return: A list of Watch objects.
+        """
+        rows: list = self._fetch_data(f'SELECT {self.WATCH_COLUMNS} FROM watchlists WHERE user_id = ? ORDER BY id;', (user_id,))
+        return [self._to_watch(row) for row in rows]
+
+    def match_watches(self, nick: str, status: str, price: Optional[int]) -> list[Watch]:
+        """
+        Fetches the subscriptions matching an account change.
+
+        Uses idx_watchlists_match: one range scan for the watches of any account and one for the watches
+        of this nick, both bounded by min_price, so the cost follows the matches and not the subscriptions.
+
+        :param nick: The nickname of the account.
+        :param status: The new status of the account.
+        :param price: The price of the account.
+        :return: A list of Watch objects, ordered by id.
+        """
+        query: str = f'''
+        SELECT {self.WATCH_COLUMNS} FROM watchlists
+        WHERE status = ? AND nick IN ('', ?) AND min_price <= ? AND (max_price IS NULL OR max_price >= ?)
+        ORDER BY id
+        '''
+        rows: list = self._fetch_data(query, (AccountStatus(status).code, nick.lower(), price or 0, price or 0))
+        return [self._to_watch(row) for row in rows]
+
+    def data_version(self) -> Optional[int]:
+        """
+        Gets the counter bumped by the triggers on the accounts table.
+
+        :return: The version, None if it could not be read.
+        """
+        rows: list = self._fetch_data('SELECT version FROM data_version WHERE id = 1;')
+        return rows[0][0] if rows else None
+
+    def vacuum(self, pages: Optional[int] = None) -> int:
+        """
+        Returns free pages to the filesystem with an incremental vacuum.
+
+        :param pages: The maximum number of pages to free, None for all of them.
+        :return: The number of freed pages.
+        """
+        self._wait_for_writes()
+
+        try:
+            with self._write_lock:
+                free: int = self.conn.execute('PRAGMA freelist_count;').fetchone()[0]
+                self.conn.execute('PRAGMA incremental_vacuum;' if pages is None else f'PRAGMA incremental_vacuum({int(pages)});').fetchall()
+                return free - self.conn.execute('PRAGMA freelist_count;').fetchone()[0]
+
+        except sqlite3.Error as e:
+            logger.error(f'Error vacuuming the database: {e}')
+            return 0
+
+    @staticmethod
+    def _to_watch(row: tuple) -> Watch:
+        """
+        Builds a Watch object from a watchlists row, whose status is stored as a code.
+
+        :param row: The row, in the WATCH_COLUMNS order.
+        :return: A Watch object representing the subscription.
+        """
+        return Database._to_watch((*row[:2], AccountStatus.from_code(row[2]), *row[3:]))
+
+    @staticmethod
+    def _to_user(row: tuple) -> User:
+        """
+        Builds a User object from an accounts row, whose status is stored as a code.
+
+        :param row: The row, in the ACCOUNT_COLUMNS order.
+        :return: A User object representing the account.
+        """
+        return Database._to_user((*row[:2], AccountStatus.from_code(row[2]), *row[3:]))
@@ -0,0 +1,195 @@
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Optional
+
+from loguru import logger
+
+from .profiler import QueryProfiler
+
+
+class WriteBehindQueue:
+    def __init__(
+        self,
+        path: str,
+        window: float = 0.005,
+        max_batch: int = 100,
+        lock: Optional[threading.RLock] = None,
+        profiler: Optional[QueryProfiler] = None
+    ) -> None:
+        """
+        Single writer that coalesces queued statements into group commits.
+
+        Statements are executed by a dedicated thread owning its own connection. The first queued
+        statement opens a batch that collects everything submitted within `window` seconds (or up to
+        `max_batch` statements) and commits it as one transaction, so the whole batch pays for a
+        single fsync.
+
+        :param path: The path of the SQLite database file.
+        :param window: The maximum time in seconds a batch waits for more statements.
+        :param max_batch: The maximum number of statements committed in one transaction.
+        :param lock: Held while a batch is committed, so the batches never compete with the other writers of the process (optional).
+        :param profiler: Records the queued statements (optional).
+        """
+        self.path: str = path
+        self.window: float = window
+        self.max_batch: int = max_batch
+        self.lock: threading.RLock = lock or threading.RLock()
+        self.batches: int = 0
+        self.statements: int = 0
+        self.profiler: Optional[QueryProfiler] = profiler
+        self._queue: queue.Queue = queue.Queue()
+        self._pending: int = 0
+        self._idle: threading.Condition = threading.Condition()
+        self._closed: bool = False
+        self._thread: threading.Thread = threading.Thread(target=self._run, name='db-writer', daemon=True)
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        self._thread.start()
+
+    def submit(self, query: str, params: tuple = ()) -> Future:
+        """
+        Queue a statement for the next group commit.
+
+        :param query: The SQL query to execute.
+        :param params: The parameters for the query.
+        :return: A future resolved with the affected row count once the batch is committed,
+                 or with the sqlite3.Error raised by the statement.
+        """
+        if self._closed:
+            raise RuntimeError('The database writer is closed.')
+
+        future: Future = Future()
+
+        with self._idle:
+            self._pending += 1
+
+        self._queue.put((query, params, future))
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every submitted statement has been committed.
+
+        :param timeout: The maximum time to wait in seconds, None waits forever.
+        :return: True if the queue was drained, False on timeout.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    @property
+    def pending(self) -> int:
+        """Number of statements submitted but not yet committed."""
+        return self._pending
+
+    def close(self) -> None:
+        """Commit the pending statements and stop the writer thread."""
+        if self._closed:
+            return
+
+        self._closed = True
+        self._queue.put(None)
+
+        if self._thread.is_alive():
+            self._thread.join()
+
+        logger.info(f'Database writer stopped after {self.statements} statements in {self.batches} batches.')
+
+    def _run(self) -> None:
+        """Writer thread loop: collect a batch, commit it, acknowledge it."""
+        conn: sqlite3.Connection = sqlite3.connect(self.path, isolation_level=None)
+        stopping: bool = False
+
+        while not stopping:
+            item: Optional[tuple] = self._queue.get()
+
+            if item is None:
+                break
+
+            batch: list[tuple] = [item]
+            deadline: float = time.monotonic() + self.window
+
+            while len(batch) < self.max_batch:
+                remaining: float = deadline - time.monotonic()
+
+                if remaining <= 0:
+                    break
+
+                try:
+                    item = self._queue.get(timeout=remaining)
+
+                except queue.Empty:
+                    break
+
+                if item is None:
+                    stopping = True
+                    break
+
+                batch.append(item)
+
+            with self.lock:
+                self._commit(conn, batch)
+
+            with self._idle:
+                self._pending -= len(batch)
+                self._idle.notify_all()
+
+        conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, batch: list[tuple]) -> None:
+        """
+        Execute a batch in one transaction and resolve its futures after the commit.
+
+        Every statement runs inside its own savepoint, so a failing statement is rolled back
+        and reported on its future without discarding the rest of the batch.
+
+        :param conn: The writer connection.
+        :param batch: The (query, params, future) tuples to execute.
+        """
+        results: list[tuple] = []
+        cursor: sqlite3.Cursor = conn.cursor() if self.profiler is None else self.profiler.cursor(conn)
+
+        try:
+            cursor.execute('BEGIN')
+
+            for query, params, future in batch:
+                cursor.execute('SAVEPOINT statement')
+
+                try:
+                    cursor.execute(query, params)
+                    results.append((future, cursor.rowcount, None))
+
+                except sqlite3.Error as e:
+                    logger.error(f'Error executing query: {e}')
+                    cursor.execute('ROLLBACK TO statement')
+                    results.append((future, None, e))
+
+                cursor.execute('RELEASE statement')
+
+            cursor.execute('COMMIT')
+
+        except sqlite3.Error as e:
+            logger.error(f'Failed to commit a batch of {len(batch)} statements: {e}')
+
+            if conn.in_transaction:
+                conn.rollback()
+
+            for _, _, future in batch:
+                future.set_exception(e)
+
+            return
+
+        finally:
+            cursor.close()
+
+        self.batches += 1
+        self.statements += len(batch)
+
+        for future, rowcount, error in results:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(rowcount)
@@ -1,5 +1,11 @@
 from .user import User
+from .event import AccountEvent
+from .table import AccountTable
+from .watch import Watch
 
 __all__ = [
-    'User'
-]
\ No newline at end of file
+    'User',
+    'AccountEvent',
+    'AccountTable',
+    'Watch'
+]
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class AccountEvent:
+    id: int
+    account_id: Optional[int]
+    nick: str
+    actor_id: Optional[int]
+    old_status: Optional[str]
+    new_status: Optional[str]
+    price: Optional[int]
+    details: Optional[str]
+    created_at: int
@@ -0,0 +1,163 @@
+import sys
+from array import array
+from typing import Optional, Iterable
+
+from ..constants import AccountStatus
+from .user import User
+
+
+class AccountTable:
+    """
+    Columnar snapshot of the accounts: one parallel array per field instead of one object per account.
+
+    Only the fields needed to list, count and look up accounts are kept. Ids and prices live in machine
+    integer arrays, statuses as one byte codes and nicks as interned strings, which takes a fraction of
+    the memory of the equivalent User objects when the whole inventory is cached.
+    """
+    __slots__ = ('ids', 'prices', 'status_codes', 'nicks')
+    NO_PRICE: int = -1  # Stored in place of a NULL price
+    LIST_ORDER: tuple[AccountStatus, ...] = (AccountStatus.SALE, AccountStatus.RESERVED, AccountStatus.SOLD, AccountStatus.INACTIVE)
+
+    def __init__(self) -> None:
+        self.ids: array = array('q')
+        self.prices: array = array('q')
+        self.status_codes: array = array('B')
+        self.nicks: list[str] = []
+
+    @classmethod
+    def from_accounts(cls, accounts: Iterable[User]) -> 'AccountTable':
+        """
+        Builds a table from accounts, typically the Database.iter_accounts generator.
+
+        :param accounts: The accounts.
+        :return: The table.
+        """
+        table: AccountTable = cls()
+
+        for account in accounts:
+            table.append(account)
+
+        return table
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'AccountTable':
+        """
+        Builds a table from the output of to_dict.
+
+        :param data: The dict.
+        :return: The table.
+        :raises ValueError: If the statuses were declared differently when the dict was written.
+        """
+        if data['statuses'] != [status.value for status in AccountStatus]:
+            raise ValueError('The status codes changed since the table was saved')
+
+        table: AccountTable = cls()
+        table.ids.extend(data['ids'])
+        table.prices.extend(data['prices'])
+        table.status_codes.extend(data['status_codes'])
+        table.nicks.extend(sys.intern(nick) for nick in data['nicks'])
+        return table
+
+    def to_dict(self) -> dict:
+        """
+        Converts the table to plain lists, e.g. to save it as JSON.
+
+        :return: The dict.
+        """
+        return {
+            'statuses': [status.value for status in AccountStatus],
+            'ids': self.ids.tolist(),
+            'prices': self.prices.tolist(),
+            'status_codes': self.status_codes.tolist(),
+            'nicks': self.nicks,
+        }
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, account: User) -> None:
+        """
+        Adds an account at the end of the table.
+
+        :param account: The account.
+        """
+        self.ids.append(account.id)
+        self.prices.append(self.NO_PRICE if account.price is None else account.price)
+        self.status_codes.append(AccountStatus(account.status).code)
+        self.nicks.append(sys.intern(account.nick))
+
+    def status(self, index: int) -> AccountStatus:
+        """
+        Gets the status of a row.
+
+        :param index: The row index.
+        :return: The status.
+        """
+        return AccountStatus.from_code(self.status_codes[index])
+
+    def price(self, index: int) -> Optional[int]:
+        """
+        Gets the price of a row.
+
+        :param index: The row index.
+        :return: The price, None if the account has none.
+        """
+        price: int = self.prices[index]
+        return None if price == self.NO_PRICE else price
+
+    def counts(self) -> dict[AccountStatus, int]:
+        """
+        Counts the accounts of every status.
+
+        :return: A dict status -> number of accounts, including the statuses without accounts.
+        """
+        counts: list[int] = [0] * len(AccountStatus)
+
+        for code in self.status_codes:
+            counts[code] += 1
+
+        return {status: counts[status.code] for status in AccountStatus}
+
+    def total_price(self, status: AccountStatus) -> int:
+        """
+        Sums the prices of the accounts with a status.
+
+        :param status: The status.
+        :return: The sum of their prices, accounts without price count as 0.
+        """
+        code: int = status.code
+        return sum(
+            price for price, status_code in zip(self.prices, self.status_codes)
+            if status_code == code and price != self.NO_PRICE
+        )
+
+    def grouped(self) -> list[int]:
+        """
+        Orders the rows for /list: grouped by status in LIST_ORDER, most expensive first within a group.
+
+        :return: The row indexes in display order.
+        """
+        rank: dict[int, int] = {status.code: position for position, status in enumerate(self.LIST_ORDER)}
+        return sorted(range(len(self)), key=lambda index: (rank[self.status_codes[index]], -self.prices[index]))
+
+    def complete(self, prefix: str, statuses: Optional[Iterable[AccountStatus]] = None, limit: int = 25) -> list[str]:
+        """
+        Finds the nicks starting with a prefix, ignoring case, for command autocompletion.
+
+        :param prefix: The typed text.
+        :param statuses: Only suggest accounts with these statuses (optional).
+        :param limit: The maximum number of suggestions (Discord allows 25).
+        :return: The matching nicks, in table order.
+        """
+        prefix = prefix.lower()
+        codes: Optional[set[int]] = {status.code for status in statuses} if statuses is not None else None
+        matches: list[str] = []
+
+        for nick, code in zip(self.nicks, self.status_codes):
+            if (codes is None or code in codes) and nick.lower().startswith(prefix):
+                matches.append(nick)
+
+                if len(matches) == limit:
+                    break
+
+        return matches
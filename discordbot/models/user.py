@@ -1,14 +1,16 @@
 from dataclasses import dataclass
 from typing import Optional
 
+from ..constants import AccountStatus
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class User:
-    id: str
+    id: int
     nick: str
-    status: str
+    status: AccountStatus
     price: int
     buyer: Optional[str]
     reason_inactive: Optional[str]
-    discord_channel_id: int
-    created_at: str
\ No newline at end of file
+    discord_channel_id: Optional[int]
+    created_at: str
@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from ..constants import AccountStatus
+
+
+@dataclass(frozen=True, slots=True)
+class Watch:
+    id: int
+    user_id: int  # Discord id of the subscriber
+    status: AccountStatus  # Notify when an account changes to this status
+    nick: Optional[str]  # Lowercase, None for any account
+    min_price: Optional[int]
+    max_price: Optional[int]
+    locale: Optional[str]  # Locale of the subscriber, for the notification
+    created_at: int
+
+    def matches(self, nick: str, status: str, price: Optional[int]) -> bool:
+        """
+        Checks if an account change is one the subscriber asked for.
+
+        :param nick: The nickname of the account.
+        :param status: The new status of the account.
+        :param price: The price of the account.
+        :return: True if the change matches every condition of the watch.
+        """
+        return (
+            self.status == status
+            and (self.nick is None or self.nick == nick.lower())
+            and (self.min_price is None or (price or 0) >= self.min_price)
+            and (self.max_price is None or (price or 0) <= self.max_price)
+        )
@@ -1,8 +1,21 @@
 from .validator import Validators
 from .uuid import PlayerUUID, PlayerUUIDFormat
+from .breaker import CircuitBreaker
+from .export import AccountExporter
+from .messages import MessageCatalog
+from .watchdog import LoopWatchdog, LoopStall
+from .snapshot import WarmCache
+from .scheduler import DeadlineScheduler
 
 __all__ = [
     'Validators',
     'PlayerUUID',
-    'PlayerUUIDFormat'
-]
\ No newline at end of file
+    'PlayerUUIDFormat',
+    'CircuitBreaker',
+    'AccountExporter',
+    'MessageCatalog',
+    'LoopWatchdog',
+    'LoopStall',
+    'WarmCache',
+    'DeadlineScheduler'
+]
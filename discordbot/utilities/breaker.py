@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+
+class CircuitBreaker:
+    CLOSED: str = 'closed'
+    OPEN: str = 'open'
+    HALF_OPEN: str = 'half-open'
+
+    def __init__(self, window: float = 60.0, failure_rate: float = 0.5, min_calls: int = 4, open_seconds: float = 30.0) -> None:
+        """
+        Failure-rate circuit breaker for an unreliable upstream.
+
+        While closed, the outcomes of the calls of the last `window` seconds are kept. Once at least
+        `min_calls` were made and the share of failures reaches `failure_rate`, the breaker opens and
+        rejects calls for `open_seconds` (or for the Retry-After time announced by the upstream). Then a
+        single trial call is let through (half-open): success closes the breaker, failure opens it again.
+
+        :param window: The length in seconds of the sliding window of outcomes.
+        :param failure_rate: The share of failed calls (0-1) that opens the breaker.
+        :param min_calls: The minimum number of calls in the window before the rate is considered.
+        :param open_seconds: How long the breaker stays open before the trial call.
+        """
+        self.window: float = window
+        self.failure_rate: float = failure_rate
+        self.min_calls: int = min_calls
+        self.open_seconds: float = open_seconds
+        self.state: str = self.CLOSED
+        self.opened: int = 0
+        self._outcomes: deque = deque()  # (monotonic time, succeeded)
+        self._open_until: float = 0.0
+        self._trial_in_flight: bool = False
+        self._lock: threading.Lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """
+        Checks if a call may be made now. In half-open state only one caller gets True.
+
+        :return: True if the call may go to the upstream.
+        """
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN and time.monotonic() >= self._open_until:
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+
+            return False
+
+    def retry_in(self) -> float:
+        """
+        Gets the time until the breaker lets a call through again.
+
+        :return: The number of seconds, 0 if calls are allowed now.
+        """
+        if self.state == self.CLOSED:
+            return 0.0
+
+        return max(self._open_until - time.monotonic(), 0.0)
+
+    def record_success(self) -> None:
+        """Records a successful call, closing the breaker after a successful trial."""
+        with self._lock:
+            if self.state != self.CLOSED:
+                self.state = self.CLOSED
+                self._outcomes.clear()
+
+            self._add(True)
+
+    def record_failure(self, retry_after: Optional[float] = None) -> None:
+        """
+        Records a failed call.
+
+        :param retry_after: The delay in seconds requested by the upstream (e.g. the Retry-After header),
+                            which opens the breaker immediately for at least that long.
+        """
+        with self._lock:
+            self._add(False)
+
+            if retry_after is not None:
+                self._open(retry_after)
+                return
+
+            if self.state == self.HALF_OPEN:
+                self._open(self.open_seconds)
+                return
+
+            failures: int = sum(1 for _, succeeded in self._outcomes if not succeeded)
+
+            if len(self._outcomes) >= self.min_calls and failures / len(self._outcomes) >= self.failure_rate:
+                self._open(self.open_seconds)
+
+    def release(self) -> None:
+        """Gives back an allowed call that ended without a verdict on the upstream health (e.g. cut by a deadline)."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def _add(self, succeeded: bool) -> None:
+        """Appends an outcome and drops the ones that left the window."""
+        now: float = time.monotonic()
+        self._outcomes.append((now, succeeded))
+
+        while self._outcomes and self._outcomes[0][0] < now - self.window:
+            self._outcomes.popleft()
+
+    def _open(self, seconds: float) -> None:
+        """Opens the breaker for the given number of seconds."""
+        if self.state != self.OPEN:
+            self.opened += 1
+
+        self.state = self.OPEN
+        self._open_until = max(self._open_until, time.monotonic() + seconds)
+        self._trial_in_flight = False
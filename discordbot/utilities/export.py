@@ -0,0 +1,89 @@
+import csv
+import gzip
+import io
+import json
+import tempfile
+from dataclasses import asdict, fields
+from typing import BinaryIO, Iterable
+
+from ..models import User
+
+
+class AccountExporter:
+    FORMATS: tuple[str, ...] = ('csv', 'ndjson')
+    COLUMNS: list[str] = [field.name for field in fields(User)]
+
+    def __init__(self, fmt: str = 'csv', compress: bool = False, flush_every: int = 500) -> None:
+        if fmt not in self.FORMATS:
+            raise ValueError(f'Unsupported export format: {fmt}')
+
+        self.fmt: str = fmt
+        self.compress: bool = compress
+        self.flush_every: int = flush_every
+
+    @property
+    def filename_extension(self) -> str:
+        """
+        Get the file extension matching the export settings.
+
+        :return: The extension, e.g. 'csv' or 'ndjson.gz'.
+        """
+        return f'{self.fmt}.gz' if self.compress else self.fmt
+
+    def export(self, accounts: Iterable[User]) -> tuple[BinaryIO, int]:
+        """
+        Writes the accounts to a temporary file incrementally.
+
+        Rows are encoded in small batches and written straight to a disk-backed temporary file
+        (gzip-compressed on the fly if enabled), so memory usage does not grow with the number of accounts.
+
+        :param accounts: The accounts to export, typically the Database.iter_accounts generator.
+        :return: A tuple (file, count) with the file rewound to the start and the number of exported accounts.
+        """
+        output: BinaryIO = tempfile.TemporaryFile()
+        sink: BinaryIO = gzip.GzipFile(fileobj=output, mode='wb') if self.compress else output
+        buffer: io.StringIO = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=self.COLUMNS) if self.fmt == 'csv' else None
+        count: int = 0
+
+        try:
+            if writer is not None:
+                writer.writeheader()
+
+            for account in accounts:
+                row: dict = asdict(account)
+
+                if writer is not None:
+                    writer.writerow(row)
+                else:
+                    buffer.write(json.dumps(row, ensure_ascii=False, default=str))
+                    buffer.write('\n')
+
+                count += 1
+
+                if count % self.flush_every == 0:
+                    self._flush(buffer, sink)
+
+            self._flush(buffer, sink)
+
+            if sink is not output:
+                sink.close()  # Writes the gzip trailer, the underlying file stays open
+
+        except Exception:
+            output.close()
+            raise
+
+        output.seek(0)
+        return output, count
+
+    @staticmethod
+    def _flush(buffer: io.StringIO, sink: BinaryIO) -> None:
+        """
+        Moves the encoded text buffer to the output file and resets it.
+
+        :param buffer: The text buffer holding the pending rows.
+        :param sink: The binary file (or gzip stream) to write to.
+        """
+        sink.write(buffer.getvalue().encode('utf-8'))
+        buffer.seek(0)
+        buffer.truncate(0)
@@ -0,0 +1,164 @@
+import json
+import os
+import threading
+from string import Template
+from typing import Optional, Union
+
+from loguru import logger
+
+from ..constants import BotConstants
+
+
+class MessageCatalog:
+    _catalogs: dict[str, dict[str, Union[str, Template]]] = {}
+    _resolved: dict[str, str] = {}
+    _mtimes: dict[str, float] = {}
+    _lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def load(cls, directory: str = BotConstants.LANG_PATH) -> None:
+        """
+        Loads every locale file of the directory and precompiles its messages.
+
+        Each <locale>.json file is flattened into a dict keyed by the dotted message path. Messages
+        with $placeholders are compiled to string.Template objects, the rest are kept as plain strings.
+        The new catalogs replace the previous ones in a single assignment, so a reload never
+        exposes a half-loaded state to running commands and a failed one keeps the previous catalogs.
+
+        :param directory: The directory holding the locale files.
+        :raises json.JSONDecodeError: If a locale file is not valid JSON, the message names the file.
+        :raises OSError: If the directory or a locale file cannot be read, or the default locale is missing.
+        """
+        catalogs: dict[str, dict[str, Union[str, Template]]] = {}
+        mtimes: dict[str, float] = {}
+
+        for file in sorted(os.listdir(directory)):
+            if not file.endswith('.json'):
+                continue
+
+            path: str = os.path.join(directory, file)
+
+            with open(path, encoding='utf-8') as lang_file:
+                try:
+                    catalogs[file[:-5]] = cls._compile(json.load(lang_file))
+
+                except json.JSONDecodeError as e:
+                    raise json.JSONDecodeError(f'{path}: {e.msg}', e.doc, e.pos) from e
+
+            mtimes[path] = os.path.getmtime(path)
+
+        if BotConstants.DEFAULT_LOCALE not in catalogs:
+            raise FileNotFoundError(f'Default locale file {BotConstants.DEFAULT_LOCALE}.json not found in {directory}')
+
+        with cls._lock:
+            cls._catalogs = catalogs
+            cls._resolved = {}
+            cls._mtimes = mtimes
+
+        logger.info(f'Loaded locales: {", ".join(catalogs)}')
+
+    @classmethod
+    def reload_if_changed(cls, directory: str = BotConstants.LANG_PATH) -> bool:
+        """
+        Reloads the catalogs if a locale file was added, removed or modified.
+
+        :param directory: The directory holding the locale files.
+        :return: True if the catalogs were reloaded, otherwise False.
+        """
+        current: dict[str, float] = {
+            os.path.join(directory, file): os.path.getmtime(os.path.join(directory, file))
+            for file in os.listdir(directory) if file.endswith('.json')
+        }
+
+        if current == cls._mtimes:
+            return False
+
+        cls.load(directory)
+        return True
+
+    @classmethod
+    def locales(cls) -> list[str]:
+        """
+        Gets the loaded locales.
+
+        :return: The locale names, e.g. ['en', 'es'].
+        """
+        return list(cls._catalogs)
+
+    @classmethod
+    def get(cls, path: str, locale: Optional[object] = None, **values: object) -> str:
+        """
+        Gets a message in the given locale, falling back to the default locale.
+
+        :param path: The dotted message path, e.g. 'commands.nick.accountExists'.
+        :param locale: The locale, usually interaction.locale. None uses the default locale.
+        :param values: The values of the $placeholders of the message.
+        :return: The message, or the path itself if it does not exist in any locale.
+        """
+        if not cls._catalogs:
+            cls.load()
+
+        message: Optional[Union[str, Template]] = cls._catalogs[cls._resolve(locale)].get(path)
+
+        if message is None:
+            message = cls._catalogs[BotConstants.DEFAULT_LOCALE].get(path)
+
+            if message is None:
+                logger.warning(f'Message {path} not found')
+                return path
+
+        if isinstance(message, Template):
+            return message.safe_substitute(values)
+
+        return message
+
+    @classmethod
+    def _resolve(cls, locale: Optional[object]) -> str:
+        """
+        Maps a Discord locale (e.g. 'es-ES') to a loaded catalog: exact match, then language, then default.
+
+        :param locale: The requested locale.
+        :return: The name of the catalog to use.
+        """
+        if locale is None:
+            return BotConstants.DEFAULT_LOCALE
+
+        name: str = str(locale)
+        resolved: Optional[str] = cls._resolved.get(name)
+
+        if resolved is None:
+            language: str = name.split('-')[0]
+
+            if name in cls._catalogs:
+                resolved = name
+            elif language in cls._catalogs:
+                resolved = language
+            else:
+                resolved = BotConstants.DEFAULT_LOCALE
+
+            cls._resolved[name] = resolved
+
+        return resolved
+
+    @staticmethod
+    def _compile(data: dict, prefix: str = '') -> dict[str, Union[str, Template]]:
+        """
+        Flattens a nested locale dict and compiles the messages with placeholders.
+
+        :param data: The locale dict.
+        :param prefix: The dotted path of the dict, empty for the root.
+        :return: A flat dict of message path to string or Template.
+        """
+        flat: dict[str, Union[str, Template]] = {}
+
+        for key, value in data.items():
+            path: str = f'{prefix}{key}'
+
+            if isinstance(value, dict):
+                flat.update(MessageCatalog._compile(value, f'{path}.'))
+            elif '$' in value:
+                flat[path] = Template(value)
+            else:
+                flat[path] = value
+
+        return flat
@@ -0,0 +1,104 @@
+import asyncio
+import heapq
+import time
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+
+
+class DeadlineScheduler:
+    MAX_SLEEP: float = 3600.0  # Seconds, so a wall clock change is noticed within the hour
+
+    def __init__(self, callback: Callable[[str, int], Awaitable[None]]) -> None:
+        """
+        Calls a coroutine function when each key reaches its deadline.
+
+        Deadlines are epoch seconds, so they can be stored and scheduled again after a restart; deadlines
+        already past fire right away. The deadlines are kept in a heap and a single task sleeps until
+        the earliest one, whatever the number of keys. Scheduling a key again replaces its deadline and
+        cancelling it forgets it: the outdated heap entries are skipped when they come up.
+
+        :param callback: Called with (key, deadline) once the deadline is reached.
+        """
+        self.callback: Callable[[str, int], Awaitable[None]] = callback
+        self.fired: int = 0
+        self._deadlines: dict[str, int] = {}
+        self._heap: list[tuple[int, str]] = []
+        self._wakeup: asyncio.Event = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def next_deadline(self) -> Optional[int]:
+        """
+        Get the earliest deadline.
+
+        :return: The deadline in epoch seconds, None if nothing is scheduled.
+        """
+        self._discard_outdated()
+        return self._heap[0][0] if self._heap else None
+
+    def schedule(self, key: str, deadline: int) -> None:
+        """
+        Schedule a key, replacing its previous deadline.
+
+        :param key: The key passed to the callback.
+        :param deadline: When to call it, epoch seconds.
+        """
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, key))
+
+        if self._heap[0] == (deadline, key):
+            self._wakeup.set()  # Earlier than what the task sleeps for
+
+    def cancel(self, key: str) -> None:
+        """
+        Forget a key.
+
+        :param key: The key.
+        """
+        self._deadlines.pop(key, None)
+
+    def start(self) -> None:
+        """Start the task. Must be called from the event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop the task, keeping the scheduled keys."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _discard_outdated(self) -> None:
+        """Pop the heap entries of cancelled or rescheduled keys."""
+        while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    async def _run(self) -> None:
+        """Sleep until the earliest deadline, or until an earlier one is scheduled, and fire the due keys."""
+        while True:
+            self._wakeup.clear()
+            deadline: Optional[int] = self.next_deadline()
+
+            if deadline is None or deadline > time.time():
+                timeout: float = self.MAX_SLEEP if deadline is None else min(deadline - time.time(), self.MAX_SLEEP)
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+
+                except asyncio.TimeoutError:
+                    pass
+
+                continue
+
+            deadline, key = heapq.heappop(self._heap)
+            del self._deadlines[key]
+            self.fired += 1
+
+            try:
+                await self.callback(key, deadline)
+
+            except Exception as e:
+                logger.error(f'Scheduled callback for {key} failed: {e}')
@@ -0,0 +1,147 @@
+import gzip
+import json
+import os
+import time
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+
+class WarmCache:
+    """
+    Saves in-memory caches to a snapshot file on shutdown and hands them back on the next start.
+
+    Every cache registers a dump function, returning JSON serializable data, and a load function taking
+    that data back. Caches built from the accounts are registered as bound: their dump returns
+    (data_version, data), with the Database.data_version() read before the cache was built, and they are
+    only restored while the database still has that version.
+
+    A snapshot loaded before its cache registers (cogs are loaded after the database is opened) is kept
+    until it does. A cache unregistered by a cog reload is kept the same way for the reloaded cog.
+    """
+    VERSION: int = 1  # Bump when the layout of a cache changes, older snapshots are then ignored
+    _providers: dict[str, tuple[Callable[[], Any], Callable[[Any], None], bool]] = {}
+    _pending: dict[str, tuple[Any, bool]] = {}  # Name -> (data, bound), waiting for their cache to register
+
+    @classmethod
+    def register(cls, name: str, dump: Callable[[], Any], load: Callable[[Any], None], bound: bool = False) -> None:
+        """
+        Registers a cache and restores it if the snapshot holds it.
+
+        :param name: The name of the cache in the snapshot.
+        :param dump: Returns the data to save, None to save nothing.
+        :param load: Takes the saved data back.
+        :param bound: Whether the data depends on the accounts, dump then returns (data_version, data).
+        """
+        cls._providers[name] = (dump, load, bound)
+
+        if name in cls._pending:
+            cls._restore(name, cls._pending.pop(name)[0])
+
+    @classmethod
+    def unregister(cls, name: str) -> None:
+        """
+        Unregisters a cache, keeping its current data for the next register or save.
+
+        :param name: The name of the cache.
+        """
+        dump, _, bound = cls._providers.pop(name)
+        data: Any = cls._dump(name, dump)
+
+        if data is not None:
+            cls._pending[name] = (data, bound)
+
+    @classmethod
+    def save(cls, path: str) -> None:
+        """
+        Writes every cache to the snapshot file.
+
+        :param path: The path of the gzip compressed snapshot.
+        """
+        started: float = time.monotonic()
+        caches: dict[str, dict] = {name: {'data': data, 'bound': bound} for name, (data, bound) in cls._pending.items()}
+
+        for name, (dump, _, bound) in cls._providers.items():
+            data: Any = cls._dump(name, dump)
+
+            if data is not None:
+                caches[name] = {'data': data, 'bound': bound}
+
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        try:
+            with gzip.open(f'{path}.tmp', 'wt', encoding='utf-8', compresslevel=1) as file:
+                json.dump({'version': cls.VERSION, 'saved_at': time.time(), 'caches': caches}, file, separators=(',', ':'))
+
+            os.replace(f'{path}.tmp', path)
+
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f'Failed to save the cache snapshot: {e}')
+            return
+
+        logger.info(f'Saved {len(caches)} caches to {path} in {time.monotonic() - started:.2f}s.')
+
+    @classmethod
+    def load(cls, path: str, data_version: Optional[int]) -> None:
+        """
+        Reads the snapshot file and restores the caches, now or when they register.
+
+        :param path: The path of the gzip compressed snapshot.
+        :param data_version: The current Database.data_version(), None to skip the bound caches.
+        """
+        if not os.path.exists(path):
+            return
+
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as file:
+                snapshot: dict = json.load(file)
+
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring the unreadable cache snapshot {path}: {e}')
+            return
+
+        if snapshot.get('version') != cls.VERSION:
+            logger.info(f'Ignoring the cache snapshot {path}, written by another version.')
+            return
+
+        for name, cache in snapshot['caches'].items():
+            if cache['bound'] and (data_version is None or cache['data'][0] != data_version):
+                logger.info(f'Not restoring the "{name}" cache, the accounts changed since it was saved.')
+                continue
+
+            if name in cls._providers:
+                cls._restore(name, cache['data'])
+
+            else:
+                cls._pending[name] = (cache['data'], cache['bound'])
+
+    @staticmethod
+    def _dump(name: str, dump: Callable[[], Any]) -> Any:
+        """
+        Calls a dump function, logging its errors.
+
+        :param name: The name of the cache.
+        :param dump: The dump function.
+        :return: The data, None if there is nothing to save.
+        """
+        try:
+            return dump()
+
+        except Exception as e:
+            logger.error(f'Failed to dump the "{name}" cache: {e}')
+            return None
+
+    @classmethod
+    def _restore(cls, name: str, data: Any) -> None:
+        """
+        Hands saved data to a registered cache.
+
+        :param name: The name of the cache.
+        :param data: The saved data.
+        """
+        try:
+            cls._providers[name][1](data)
+            logger.info(f'Restored the "{name}" cache from the snapshot.')
+
+        except Exception as e:
+            logger.warning(f'Failed to restore the "{name}" cache: {e}')
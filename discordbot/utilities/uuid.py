@@ -1,9 +1,17 @@
+import asyncio
 import hashlib
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from json import JSONDecodeError
-from typing import Optional
+from typing import Optional, Callable, Awaitable
 
 import requests
+from loguru import logger
+
+from .breaker import CircuitBreaker
+from ..constants import MojangConstants, URLConstants
 
 
 class PlayerUUIDFormat:
@@ -13,25 +21,215 @@ class PlayerUUIDFormat:
 
 
 class PlayerUUID:
+    breaker: CircuitBreaker = CircuitBreaker(
+        window=MojangConstants.BREAKER_WINDOW,
+        failure_rate=MojangConstants.BREAKER_FAILURE_RATE,
+        min_calls=MojangConstants.BREAKER_MIN_CALLS,
+        open_seconds=MojangConstants.BREAKER_OPEN_SECONDS
+    )
+    # Lowercase username -> (online UUID, None if the name is not premium; expiry as epoch seconds), least recently used first
+    cache: OrderedDict[str, tuple[Optional[str], float]] = OrderedDict()
+    _cache_lock: threading.Lock = threading.Lock()
+    _refreshing: dict[str, list[Callable[[str], Awaitable[None]]]] = {}
+    _tasks: set[asyncio.Task] = set()
+
     def __init__(self, username: str):
         self.username = username
 
-    def get_uuid(self) -> PlayerUUIDFormat:
+    def get_uuid(self, timeout: float = MojangConstants.TIMEOUT) -> PlayerUUIDFormat:
         """
         Method to get the UUID of the player
+
+        Answers from the cache when possible. While the circuit breaker is open, Mojang is not
+        contacted and only the offline UUID is returned.
+
+        :param timeout: The maximum time in seconds to wait for Mojang.
         :return: The UUID of the player
         """
+        key: str = self.username.lower()
+
+        if not self._cached(key)[0] and self.breaker.allow():
+            self._lookup(timeout)
+
+        return PlayerUUIDFormat(self._cached(key)[1], self._get_offline_uuid())
+
+    async def resolve(
+        self,
+        deadline: Optional[float] = None,
+        on_refresh: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> PlayerUUIDFormat:
+        """
+        Method to get the UUID of the player without blocking the event loop
+
+        The lookup is cut to `deadline` seconds. If Mojang could not answer in time (or the breaker is open),
+        the offline UUID is returned right away and, when `on_refresh` is given, the lookup is retried in the
+        background once Mojang is healthy again; `on_refresh` is then called with the online UUID.
+
+        :param deadline: The time in seconds the caller can wait, None to use the default timeout.
+        :param on_refresh: Coroutine function called with the online UUID after a successful background refresh.
+        :return: The UUID of the player
+        """
+        key: str = self.username.lower()
+
+        if deadline is None or deadline >= MojangConstants.MIN_DEADLINE:
+            timeout: float = MojangConstants.TIMEOUT if deadline is None else min(deadline, MojangConstants.TIMEOUT)
+            result: PlayerUUIDFormat = await asyncio.to_thread(self.get_uuid, timeout)
+
+        else:
+            result = PlayerUUIDFormat(self._cached(key)[1], self._get_offline_uuid())
+
+        if not self._cached(key)[0] and on_refresh is not None:
+            self._schedule_refresh(on_refresh)
+
+        return result
+
+    def _lookup(self, timeout: float) -> None:
+        """
+        Method to query Mojang, cache the answer and report the outcome to the circuit breaker
+        :param timeout: The maximum time in seconds to wait for Mojang.
+        """
+        key: str = self.username.lower()
+
+        try:
+            response: requests.Response = requests.get(URLConstants.MOJANG_PROFILE.replace('$name', self.username), timeout=timeout)
+
+        except requests.exceptions.Timeout:
+            if timeout < MojangConstants.TIMEOUT:
+                self.breaker.release()  # Cut by the caller's deadline, says nothing about Mojang
+            else:
+                self.breaker.record_failure()
+
+            return
+
+        except requests.exceptions.RequestException:
+            self.breaker.record_failure()
+            return
+
+        if response.status_code == 429:
+            retry_after: Optional[str] = response.headers.get('Retry-After')
+            self.breaker.record_failure(
+                retry_after=float(retry_after) if retry_after and retry_after.isdigit() else self.breaker.open_seconds
+            )
+            return
+
+        if response.status_code in (204, 404):
+            self.breaker.record_success()
+            self._store(key, None)
+            return
+
         try:
-            response: requests.Response = requests.get(
-                f"https://api.mojang.com/users/profiles/minecraft/{self.username}")
             response.raise_for_status()
-            return PlayerUUIDFormat(response.json()['id'], self._get_offline_uuid())
+            self._store(key, response.json()['id'])
+            self.breaker.record_success()
 
         except (JSONDecodeError, KeyError, requests.exceptions.HTTPError):
-            return PlayerUUIDFormat(None, self._get_offline_uuid())
+            self.breaker.record_failure()
 
-        except requests.exceptions.RequestException:
-            return PlayerUUIDFormat(None, self._get_offline_uuid())
+    @classmethod
+    def dump_cache(cls) -> dict[str, tuple[Optional[str], float]]:
+        """
+        Method to copy the cache for the snapshot
+        :return: Lowercase username -> (online UUID, expiry as epoch seconds).
+        """
+        with cls._cache_lock:
+            return dict(cls.cache)
+
+    @classmethod
+    def load_cache(cls, entries: dict[str, list]) -> None:
+        """
+        Method to restore the cache from the snapshot, skipping the entries that expired meanwhile
+        :param entries: Lowercase username -> [online UUID, expiry as epoch seconds].
+        """
+        now: float = time.time()
+
+        with cls._cache_lock:
+            for key, (online_uuid, expires_at) in entries.items():  # Saved least recently used first
+                if expires_at > now:
+                    cls.cache[key] = (online_uuid, expires_at)
+
+            cls._trim()
+
+    @classmethod
+    def _cached(cls, key: str) -> tuple[bool, Optional[str]]:
+        """
+        Method to read the cache, forgetting the entry if it expired
+        :param key: The lowercase username.
+        :return: A tuple (found, online UUID).
+        """
+        with cls._cache_lock:
+            entry: Optional[tuple[Optional[str], float]] = cls.cache.get(key)
+
+            if entry is None:
+                return False, None
+
+            if entry[1] <= time.time():
+                del cls.cache[key]
+                return False, None
+
+            cls.cache.move_to_end(key)
+            return True, entry[0]
+
+    @classmethod
+    def _store(cls, key: str, online_uuid: Optional[str]) -> None:
+        """
+        Method to cache an answer of Mojang, evicting the least recently used entries over the size bound
+        :param key: The lowercase username.
+        :param online_uuid: The online UUID, None if the name is not premium.
+        """
+        ttl: float = MojangConstants.CACHE_TTL if online_uuid is not None else MojangConstants.NEGATIVE_CACHE_TTL
+
+        with cls._cache_lock:
+            cls.cache[key] = (online_uuid, time.time() + ttl)
+            cls.cache.move_to_end(key)
+            cls._trim()
+
+    @classmethod
+    def _trim(cls) -> None:
+        """Method to evict the least recently used entries over the size bound, with the cache lock held"""
+        while len(cls.cache) > MojangConstants.CACHE_SIZE:
+            cls.cache.popitem(last=False)
+
+    def _schedule_refresh(self, on_refresh: Callable[[str], Awaitable[None]]) -> None:
+        """
+        Method to queue a background lookup, sharing one task per username
+        :param on_refresh: Coroutine function called with the online UUID.
+        """
+        key: str = self.username.lower()
+
+        if key in self._refreshing:
+            self._refreshing[key].append(on_refresh)
+            return
+
+        self._refreshing[key] = [on_refresh]
+        task: asyncio.Task = asyncio.create_task(self._refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self) -> None:
+        """Method to retry the lookup until Mojang answers or the refresh window ends"""
+        key: str = self.username.lower()
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        give_up_at: float = loop.time() + MojangConstants.REFRESH_WINDOW
+
+        try:
+            while not self._cached(key)[0] and loop.time() < give_up_at:
+                await asyncio.sleep(max(self.breaker.retry_in(), MojangConstants.REFRESH_INTERVAL))
+                await asyncio.to_thread(self.get_uuid)
+
+            online_uuid: Optional[str] = self._cached(key)[1]
+
+            if online_uuid is None:
+                return
+
+            for callback in self._refreshing.get(key, []):
+                try:
+                    await callback(online_uuid)
+
+                except Exception as e:
+                    logger.warning(f'Failed to refresh the UUID of {self.username}: {e}')
+
+        finally:
+            self._refreshing.pop(key, None)
 
     def _get_offline_uuid(self) -> str:
         """
@@ -39,4 +237,4 @@ class PlayerUUID:
         :return: The offline UUID of the player
         """
         return str(uuid.UUID(bytes=hashlib.md5(bytes(f'OfflinePlayer:{self.username}', 'utf-8')).digest()[:16],
-                             version=3)).replace('-', '')
\ No newline at end of file
+                             version=3)).replace('-', '')
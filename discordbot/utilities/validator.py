@@ -1,4 +1,5 @@
 import re
+import datetime
 from typing import Optional
 
 from loguru import logger
@@ -6,7 +7,7 @@ from discord.member import Member
 from discord.guild import Guild
 from discord.role import Role
 
-from ..constants import BotConstants
+from ..constants import BotConstants, IDs
 
 
 class Validators:
@@ -24,6 +25,32 @@ class Validators:
             return True
         
         return False
+
+    @staticmethod
+    def validate_date(date: str) -> bool:
+        """
+        Validates if the date uses the YYYY-MM-DD format.
+
+        :param date: The date to validate.
+        :return: True if valid, otherwise False.
+        """
+        try:
+            datetime.datetime.strptime(date, '%Y-%m-%d')
+
+        except ValueError:
+            return False
+
+        return True
+
+    @staticmethod
+    def is_admin(user: Member) -> bool:
+        """
+        Checks if the user is one of the bot administrators.
+
+        :param user: The user to check.
+        :return: True if the user id is in the admin ids, otherwise False.
+        """
+        return user.id in IDs.ADMIN_IDS
     
     @staticmethod
     def has_permissions_role(user: Member, guild: Guild) -> bool:
@@ -0,0 +1,159 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Optional
+
+from loguru import logger
+
+
+@dataclass
+class LoopStall:
+    at: float  # Epoch seconds when the loop got going again
+    blocked: float  # Seconds
+    location: Optional[str]  # Where the loop thread was caught, None if it recovered before the capture
+
+
+class LoopWatchdog:
+    BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, float('inf'))  # Upper bounds, seconds
+    STACK_DEPTH: int = 15  # Innermost frames logged for a stall
+    PACKAGE: str = f'{os.sep}discordbot{os.sep}'
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.25, history: int = 20) -> None:
+        """
+        Measures the lag of the asyncio event loop and reports the code that blocks it.
+
+        A heartbeat task wakes up every `interval` seconds and records how late it was woken. A helper
+        thread watches the heartbeat: when the loop has not run for `threshold` seconds, it captures the
+        stack of the loop thread while it is still blocked and logs it, so the blocking call shows up in
+        the logs with its file and line instead of as a Discord heartbeat warning.
+
+        :param interval: The seconds between two heartbeats.
+        :param threshold: The lag in seconds that counts as a stall.
+        :param history: The number of recent stalls kept.
+        """
+        self.interval: float = interval
+        self.threshold: float = threshold
+        self.histogram: list[int] = [0] * len(self.BUCKETS)
+        self.samples: int = 0
+        self.total_lag: float = 0.0
+        self.max_lag: float = 0.0
+        self.stalled: int = 0
+        self.stalls: deque[LoopStall] = deque(maxlen=history)
+        self.hotspots: Counter[str] = Counter()
+        self._beat: float = 0.0
+        self._reported: float = 0.0  # Heartbeat of the stall whose stack was already captured
+        self._caught: Optional[str] = None
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop: threading.Event = threading.Event()
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the watchdog is started."""
+        return self._task is not None
+
+    def start(self) -> None:
+        """Start the heartbeat task and the helper thread. Must be called from the event loop."""
+        if self._task is not None:
+            return
+
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name='loop-watchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the heartbeat task and the helper thread."""
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        self._task = None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    async def _heartbeat(self) -> None:
+        """Sleep for an interval at a time and record how late the loop woke the task up."""
+        while True:
+            expected: float = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now: float = time.monotonic()
+            self._beat = now
+            self._record(max(now - expected, 0.0))
+
+    def _record(self, lag: float) -> None:
+        """
+        Add a lag sample to the histogram and close the stall it belongs to.
+
+        :param lag: The lag in seconds.
+        """
+        self.samples += 1
+        self.total_lag += lag
+        self.max_lag = max(self.max_lag, lag)
+        self.histogram[next(i for i, bound in enumerate(self.BUCKETS) if lag <= bound)] += 1
+
+        if lag < self.threshold:
+            return
+
+        with self._lock:
+            location, self._caught = self._caught, None
+
+        self.stalled += 1
+        self.stalls.append(LoopStall(at=time.time(), blocked=lag, location=location))
+
+        if location is not None:
+            self.hotspots[location] += 1
+
+        logger.warning(f'Event loop was blocked for {lag * 1000:.0f} ms{f" in {location}" if location else ""}.')
+
+    def _watch(self) -> None:
+        """Helper thread: capture the loop thread stack once per stall."""
+        while not self._stop.wait(self.interval / 2):
+            beat: float = self._beat
+            blocked: float = time.monotonic() - beat - self.interval
+
+            if blocked < self.threshold or beat == self._reported:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread)
+
+            if frame is None:
+                continue
+
+            self._reported = beat
+            stack: list[traceback.FrameSummary] = traceback.extract_stack(frame)[-self.STACK_DEPTH:]
+            location: str = self._locate(stack)
+
+            with self._lock:
+                self._caught = location
+
+            logger.warning(
+                f'Event loop blocked for over {blocked * 1000:.0f} ms in {location}, loop thread stack:\n'
+                f'{"".join(traceback.format_list(stack)).rstrip()}'
+            )
+
+    def _locate(self, stack: list[traceback.FrameSummary]) -> str:
+        """
+        Name the blocking call: the innermost frame of the bot and the call it was making.
+
+        :param stack: The captured stack, outermost first.
+        :return: E.g. 'database/sqlite.py:352 _fetch_data -> execute'.
+        """
+        innermost: traceback.FrameSummary = stack[-1]
+
+        for frame in reversed(stack):
+            if self.PACKAGE in frame.filename and not frame.filename.endswith('watchdog.py'):
+                name: str = frame.filename.split(self.PACKAGE, 1)[1]
+                return f'{name}:{frame.lineno} {frame.name}' + (f' -> {innermost.name}' if frame is not innermost else '')
+
+        return f'{os.path.basename(innermost.filename)}:{innermost.lineno} {innermost.name}'
@@ -0,0 +1,181 @@
+"""
+Tests of the postgres backend against a real server.
+
+They only run when TEST_DATABASE_URL points to a PostgreSQL database whose tables can be dropped:
+TEST_DATABASE_URL=postgresql://postgres@localhost:5432/test python -m pytest tests
+"""
+import asyncio
+import os
+import time
+
+import pytest
+
+asyncpg = pytest.importorskip('asyncpg')
+
+from discordbot.constants import BotConstants, AccountStatus
+from discordbot.database import AsyncDatabase, PostgresDatabase
+
+DATABASE_URL: str = os.getenv('TEST_DATABASE_URL', '')
+TABLES: tuple[str, ...] = ('accounts', 'watchlists', 'account_statuses', 'account_events', 'account_events_archive')
+
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason='TEST_DATABASE_URL is not set')
+
+
+async def _drop_tables() -> None:
+    conn: asyncpg.Connection = await asyncpg.connect(DATABASE_URL)
+
+    try:
+        await conn.execute(f'DROP TABLE IF EXISTS {", ".join(TABLES)} CASCADE;')
+
+    finally:
+        await conn.close()
+
+
+@pytest.fixture
+def database(monkeypatch: pytest.MonkeyPatch) -> PostgresDatabase:
+    monkeypatch.setattr(BotConstants, 'DATABASE_URL', DATABASE_URL)
+    asyncio.run(_drop_tables())
+    yield PostgresDatabase()
+    PostgresDatabase.shutdown()
+
+
+def test_account_lifecycle(database: PostgresDatabase) -> None:
+    database.add_account(nick='Notch', price=100)
+
+    assert database.account_exists(nick='notch')
+    assert not database.account_exists(nick='jeb_')
+
+    database.update_account_status(nick='NOTCH', status=AccountStatus.SOLD)
+    database.set_buyer(nick='notch', buyer='Dinnerbone')
+    database.link_discord_channel(nick='notch', channel_id=1234567890123456789)
+    account = database.get_account(nick='Notch')
+
+    assert (account.nick, account.status, account.price, account.buyer) == ('Notch', AccountStatus.SOLD, 100, 'Dinnerbone')
+    assert account.discord_channel_id == 1234567890123456789
+    assert [user.nick for user in database.get_accounts(status=AccountStatus.SOLD)] == ['Notch']
+
+    database.remove_account(nick='notch')
+
+    assert not database.account_exists(nick='notch')
+
+
+def test_history_outlives_the_account(database: PostgresDatabase) -> None:
+    database.add_account(nick='Notch', price=100)
+    database.record_event(nick='Notch', actor_id=1, old_status=None, new_status=AccountStatus.SALE)
+    database.record_event(nick='Notch', actor_id=1, old_status=AccountStatus.SALE, new_status=None)
+    database.remove_account(nick='Notch')
+    events = database.get_account_events(nick='notch')
+
+    assert [(event.old_status, event.new_status) for event in events] == [(AccountStatus.SALE, None), (None, AccountStatus.SALE)]
+    assert len(database.get_events(start=0, end=int(time.time()) + 1)) == 2
+    assert database.compact_events(before=int(time.time()) + 1) == 2
+    assert database.get_account_events(nick='notch') == []
+
+
+def test_bulk_update_and_streaming(database: PostgresDatabase) -> None:
+    for i in range(12):
+        database.add_account(nick=f'player{i}', price=10 * (i + 1))
+
+    updated: int = database.bulk_update(
+        [('PLAYER0', AccountStatus.INACTIVE, None), ('player1', None, 5), ('missing', AccountStatus.SOLD, None)],
+        actor_id=1,
+        reason='banned'
+    )
+
+    assert updated == 2
+    assert database.get_account(nick='player0').reason_inactive == 'banned'
+    assert database.get_account(nick='player1').price == 5
+    assert len(database.get_account_events(nick='player0')) == 1
+    assert [user.nick for user in database.iter_accounts(min_price=30, max_price=60, chunk_size=2)] == [f'player{i}' for i in range(2, 6)]
+    assert [user.nick for user in database.iter_accounts(nicks=['Player3', 'PLAYER7'])] == ['player3', 'player7']
+    assert len(list(database.iter_accounts(chunk_size=5))) == 12
+
+
+def test_statuses_and_dates_are_stored_compact(database: PostgresDatabase) -> None:
+    database.add_account(nick='Notch', price=100)
+    database.add_account(nick='jeb_', price=50)
+    database.update_account_status(nick='jeb_', status=AccountStatus.RESERVED)
+    today: str = time.strftime('%Y-%m-%d', time.gmtime())
+    tomorrow: str = time.strftime('%Y-%m-%d', time.gmtime(time.time() + 86400))
+
+    assert [user.nick for user in database.iter_accounts(status=AccountStatus.RESERVED)] == ['jeb_']
+    assert len(list(database.iter_accounts(created_after=today, created_before=tomorrow))) == 2
+    assert list(database.iter_accounts(created_after=tomorrow)) == []
+    assert database.get_account(nick='notch').created_at.startswith(today)
+
+    async def stored() -> list:
+        conn: asyncpg.Connection = await asyncpg.connect(DATABASE_URL)
+
+        try:
+            return await conn.fetch('SELECT status, created_at FROM accounts ORDER BY id;')
+
+        finally:
+            await conn.close()
+
+    assert [(row[0], type(row[1])) for row in asyncio.run(stored())] == [(AccountStatus.SALE.code, int), (AccountStatus.RESERVED.code, int)]
+
+
+def test_reservations_expire_once(database: PostgresDatabase) -> None:
+    for nick in ('Notch', 'jeb_', 'Dinnerbone'):
+        database.add_account(nick=nick, price=100)
+
+    database.update_account_status(nick='Notch', status=AccountStatus.RESERVED)
+    database.set_reservation(nick='Notch', expires_at=2000)
+    database.bulk_update([('jeb_', AccountStatus.RESERVED, None), ('Dinnerbone', None, 5)], actor_id=1, reserved_until=1000)
+
+    assert database.get_reservations() == [('jeb_', 1000), ('Notch', 2000)]
+    assert not database.expire_reservation(nick='notch', expires_at=1000)
+    assert database.expire_reservation(nick='JEB_', expires_at=1000)
+    assert not database.expire_reservation(nick='jeb_', expires_at=1000)
+    assert database.get_account(nick='jeb_').status == AccountStatus.SALE
+    assert [(event.old_status, event.new_status, event.details) for event in database.get_account_events(nick='jeb_', limit=1)] == [
+        (AccountStatus.RESERVED, AccountStatus.SALE, 'expired')
+    ]
+
+    database.update_account_status(nick='Notch', status=AccountStatus.SOLD)
+
+    assert database.get_reservations() == []
+
+
+def test_watchlists(database: PostgresDatabase) -> None:
+    database.add_watch(user_id=1, status=AccountStatus.SALE, max_price=50)
+    database.add_watch(user_id=1, status=AccountStatus.RESERVED, nick='Notch', locale='es-ES')
+    database.add_watch(user_id=2, status=AccountStatus.SALE, min_price=100)
+    watches = database.get_watches(user_id=1)
+
+    assert [(watch.status, watch.nick, watch.max_price) for watch in watches] == [(AccountStatus.SALE, None, 50), (AccountStatus.RESERVED, 'notch', None)]
+    assert [watch.user_id for watch in database.match_watches(nick='jeb_', status=AccountStatus.SALE, price=40)] == [1]
+    assert [watch.user_id for watch in database.match_watches(nick='jeb_', status=AccountStatus.SALE, price=150)] == [2]
+    assert [watch.locale for watch in database.match_watches(nick='NOTCH', status=AccountStatus.RESERVED, price=None)] == ['es-ES']
+    assert database.match_watches(nick='jeb_', status=AccountStatus.RESERVED, price=None) == []
+
+    database.remove_watch(user_id=2, watch_id=watches[0].id)
+    database.remove_watch(user_id=1, watch_id=watches[1].id)
+
+    assert [watch.status for watch in database.get_watches(user_id=1)] == [AccountStatus.SALE]
+
+
+def test_streaming_raises_instead_of_stopping_early(database: PostgresDatabase) -> None:
+    database.add_account(nick='Notch', price=100)
+
+    with pytest.raises(asyncpg.PostgresError):
+        list(database.iter_accounts(min_price='not a number'))
+
+
+def test_async_calls_do_not_block_threads(database: PostgresDatabase, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def no_worker_threads(*args, **kwargs):
+        raise AssertionError('the postgres backend must not use worker threads')
+
+    monkeypatch.setattr(asyncio, 'to_thread', no_worker_threads)
+
+    async def scenario() -> list[bool]:
+        aio: AsyncDatabase = AsyncDatabase(PostgresDatabase)
+        await asyncio.gather(*(aio.add_account(nick=f'player{i}', price=i + 1) for i in range(20)))
+        await aio.update_account_status(nick='player3', status=AccountStatus.RESERVED)
+
+        assert (await aio.get_account(nick='PLAYER3')).status == AccountStatus.RESERVED
+        assert len(await aio.get_accounts()) == 20
+
+        return await asyncio.gather(*(aio.account_exists(nick=f'player{i}') for i in range(25)))
+
+    assert asyncio.run(scenario()) == [True] * 20 + [False] * 5